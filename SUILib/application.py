@@ -14,15 +14,32 @@ Classes:
 import pygame
 import abc
 from typing import final
+from contextlib import contextmanager
 import os
+import asyncio
+import inspect
+from time import perf_counter
 
 from .colors import *
 from .utils import *
 from .guielement import GUIElement, Container
 from .stylemanager import StyleManager
+from .scheduler import FrameScheduler
+from .profiler import FrameProfiler
+from .compositor import Compositor
+from .spatial import SpatialGrid
+from .focus import FocusManager
+from .executor import TASK_DONE_EVENT, TaskExecutor
+from .fonts import font_registry, get_font
+from .textcache import text_cache
+from .fontcache import init_system_fonts
 
 # Event konstanty
 REPAINT_EVENT = pygame.USEREVENT + 1
+# Events routed only to the elements under the mouse cursor (and elements capturing the mouse)
+POINTER_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+# Events routed only to the focused element (if any element is focused)
+KEYBOARD_EVENTS = (pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT)
 
 class Application:
     """
@@ -32,10 +49,18 @@ class Application:
         views (list): List of View objects managed by the application.
         visible_view (View): Currently visible View.
         inited (bool): True if the application window is initialized.
+        headless (bool): True if the application renders offscreen (SDL dummy video driver).
         running (bool): True if the event loop is running.
         stylemanager (StyleManager): Style manager instance.
         fill_color (tuple): Default background color for views.
-        draw_queue (list): Queue for deferred draw callbacks.
+        compositor (Compositor): Z-ordered queue of overlay layers drawn after the view (see draw_later()).
+        dirty_rendering (bool): True if only invalidated regions are redrawn.
+        event_batching (bool): True if all pending events are processed before each render.
+        frame_scheduling (bool): True if the main loop runs the fixed-timestep frame scheduler.
+        scheduler (FrameScheduler): Scheduler of update ticks, rendering and deferred tasks.
+        profiler (FrameProfiler): Per-element frame profiler (disabled by default).
+        render_cache (bool): True if GUI elements cache their rendered surfaces (see GUIElement.draw_cached()).
+        executor (TaskExecutor): Worker pools of this application for background tasks (see run_task()).
     """
 
     def __init__(self, views, dark=False):
@@ -49,10 +74,29 @@ class Application:
         self._periodic_repaint_enabled = False  
         self._periodic_repaint_fps = 60  
         self._needs_repaint = True 
+        self._full_repaint = True
+        self._dirty_rects = []
+        self._rendering = False
+        self.dirty_rendering = False
+        self.event_batching = False
+        self.frame_scheduling = False
+        self.scheduler = FrameScheduler()
+        self.profiler = FrameProfiler()
+        self.render_cache = False
+        self._cursor = None
+        self._cache_scratch = None
+        self._building_cache = False
+        self._frame_requested = False
+        self._loop = None
+        self._tasks = set()
+        self._startup_report = {}
+        self._pending_resize = None
+        self.executor = TaskExecutor()
         self.views = []
-        self.draw_queue = []
+        self.compositor = Compositor()
         self.visible_view = None
         self.inited = False
+        self.headless = False
         self.running = False
         module_path = os.path.dirname(os.path.abspath(__file__))
         if dark:
@@ -124,6 +168,7 @@ class Application:
         for view in self.views:
             view.set_fill_color(fill_color)
             view.reload_element_style()
+        self.invalidate_all()
 
     def remove_view(self, view) -> bool:
         """
@@ -141,6 +186,17 @@ class Application:
         else:
             return False
 
+    def set_cursor(self, cursor):
+        """
+        Set the mouse cursor of the window (only calls pygame if the cursor changes).
+
+        Args:
+            cursor: Pygame system cursor constant.
+        """
+        if cursor != self._cursor and not self.headless:
+            pygame.mouse.set_cursor(cursor)
+            self._cursor = cursor
+
     def get_screen(self) -> pygame.Surface:
         """
         Get the pygame Surface representing the application window.
@@ -150,7 +206,7 @@ class Application:
         """
         return self.screen
 
-    def init(self, width: int, height: int, name: str, icon: str):
+    def init(self, width: int, height: int, name: str, icon: str, headless: bool = False, font_cache: bool = True):
         """
         Initialize the application window and resources.
 
@@ -159,16 +215,44 @@ class Application:
             height (int): Window height in pixels.
             name (str): Window/application title.
             icon (str): Path to window icon image.
-        """
+            headless (bool): If True, no window is opened. The application renders into
+                an in-memory surface under the SDL dummy video driver and can be driven
+                frame by frame with start() and step() (for tests and benchmarks).
+            font_cache (bool): If True, the list of system fonts is loaded from the on-disk
+                font cache instead of being enumerated on every start (see fontcache module).
+        """
+        init_start = perf_counter()
+        report = {}
         self.width = max(width, 50)
         self.height = max(height, 50)
         self.name = name
         self.icon = icon
+        self.headless = headless
+
+        if headless:
+            # the video driver can only be chosen before the display is initialized
+            if pygame.display.get_init() and pygame.display.get_driver() != "dummy":
+                pygame.display.quit()
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
 
+        phase_start = perf_counter()
         self.stylemanager.init()
+        report["style_sheet"] = (perf_counter() - phase_start) * 1000
+        default_style = self.stylemanager.get_style_with_name("default")
+        if default_style is not None and "text_backend" in default_style:
+            self.set_text_backend(default_style["text_backend"])
 
+        phase_start = perf_counter()
         pygame.init()
-        self.default_font = pygame.font.SysFont("Verdana", 35, bold=True)
+        report["pygame_init"] = (perf_counter() - phase_start) * 1000
+
+        phase_start = perf_counter()
+        if font_cache:
+            report["font_cache_hit"] = init_system_fonts()
+        self.default_font = get_font("Verdana", 35, bold=True)
+        report["font_discovery"] = (perf_counter() - phase_start) * 1000
+
+        phase_start = perf_counter()
         pygame.display.set_caption(name)
         img = load_image(self.icon)
         if img is None:
@@ -176,10 +260,16 @@ class Application:
             img = load_image(os.path.join(module_path, "./assets/icon.png"))
         if img is not None:
             pygame.display.set_icon(img)
-        self.screen = pygame.display.set_mode(
-            (width, height), 
-            pygame.DOUBLEBUF | pygame.HWSURFACE | pygame.SRCALPHA | pygame.RESIZABLE, 
-            vsync=1)
+        if headless:
+            self.screen = pygame.display.set_mode((width, height))
+        else:
+            self.screen = pygame.display.set_mode(
+                (width, height), 
+                pygame.DOUBLEBUF | pygame.HWSURFACE | pygame.SRCALPHA | pygame.RESIZABLE, 
+                vsync=1)
+        report["display"] = (perf_counter() - phase_start) * 1000
+        report["init_total"] = (perf_counter() - init_start) * 1000
+        self._startup_report = report
         self.inited = True
 
     def run(self, start_view=None) -> bool:
@@ -192,61 +282,528 @@ class Application:
         Returns:
             bool: True if the loop exited normally, False if not initialized.
         """
+        if not self.start(start_view):
+            return False
+
+        clock = pygame.time.get_ticks
+        self.scheduler.reset(clock())
+        while self.running:
+            if self.frame_scheduling:
+                self.run_scheduled_frame()
+                continue
+
+            if self.scheduler.has_deferred() or self._needs_repaint:
+                # do not block while deferred work or a repaint (requested by it) is waiting
+                event = pygame.event.poll()
+                events = [] if event.type == pygame.NOEVENT else [event]
+            else:
+                events = [pygame.event.wait()]
+            if self.event_batching:
+                events += pygame.event.get()
+            self.run_frame(events)
+
+        self.executor.shutdown()
+        # fonts are invalid after pygame.quit()
+        text_cache.clear()
+        font_registry.clear()
+        pygame.quit()
+        return True
+
+    async def run_async(self, start_view=None, poll_interval: float = 0.005) -> bool:
+        """
+        Run the main loop as a coroutine cooperating with an asyncio event loop.
+
+        Events are polled without blocking and the coroutine sleeps between polls,
+        so other tasks of the loop (sockets, timers, coroutine callbacks of the
+        elements) run in the same thread. The frame scheduler is honored if enabled.
+
+        Example:
+            asyncio.run(app.run_async(view))
+
+        Args:
+            start_view (View, optional): View to show first.
+            poll_interval (float): Time in seconds the loop sleeps between event polls.
+
+        Returns:
+            bool: True if the loop exited normally, False if not initialized.
+        """
+        if not self.start(start_view):
+            return False
+
+        self._loop = asyncio.get_running_loop()
+        self.scheduler.reset(pygame.time.get_ticks())
+        try:
+            while self.running:
+                if self.frame_scheduling:
+                    self.run_scheduled_frame(block=False)
+                else:
+                    events = pygame.event.get()
+                    if len(events) != 0 or self.scheduler.has_deferred():
+                        self.run_frame(events)
+                await asyncio.sleep(poll_interval)
+        finally:
+            # coroutine callbacks must not outlive the application
+            for task in list(self._tasks):
+                task.cancel()
+            self._tasks.clear()
+            self._loop = None
+        self.executor.shutdown()
+        # fonts are invalid after pygame.quit()
+        text_cache.clear()
+        font_registry.clear()
+        pygame.quit()
+        return True
+
+    def run_coroutine(self, coro):
+        """
+        Schedule a coroutine (e.g. returned by an async element callback).
+
+        While run_async() is running the coroutine becomes a task of its event loop.
+        Otherwise it is run to completion immediately, blocking the caller.
+
+        Args:
+            coro: The coroutine or awaitable.
+
+        Returns:
+            asyncio.Task: The scheduled task, or the result of the coroutine
+                if no event loop is running.
+        """
+        if self._loop is None:
+            async def wrapper():
+                return await coro
+            return asyncio.run(wrapper())
+        task = asyncio.ensure_future(coro, loop=self._loop)
+        # keep a reference, the loop holds only weak references to its tasks
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def start(self, start_view=None) -> bool:
+        """
+        Start the application without entering the main loop.
+
+        Calls the create event of all views and shows the start view. Used by run(),
+        or directly when the application is driven frame by frame with step().
+
+        Args:
+            start_view (View, optional): View to show first.
+
+        Returns:
+            bool: True on success, False if not initialized.
+        """
         if not self.inited:
             return False
 
         self.running = True
 
         # call start event for each view
+        phase_start = perf_counter()
         for view in self.views:
             view.createEvt_base(self.screen.get_width(), self.screen.get_height())
+        self._startup_report["create_views"] = (perf_counter() - phase_start) * 1000
 
+        phase_start = perf_counter()
         if start_view is not None:
             self.show_view(start_view)
+        self._startup_report["show_view"] = (perf_counter() - phase_start) * 1000
 
         # Enable periodic repaint if requested
         if self._periodic_repaint_enabled:
             pygame.time.set_timer(REPAINT_EVENT, int(1000 / self._periodic_repaint_fps))
+        return True
 
-        while self.running:
-            event = pygame.event.wait()
+    def step(self, events: list = None) -> pygame.Surface:
+        """
+        Run a single frame programmatically: process the given events together
+        with the events waiting in the pygame queue, update the visible view and
+        render it if a repaint is pending.
+
+        Args:
+            events (list, optional): Events to inject (e.g. synthetic mouse or key events).
+
+        Returns:
+            pygame.Surface: The surface the frame was rendered into.
+        """
+        events = pygame.event.get() + (events if events is not None else [])
+        self.run_frame(events, idle_update=True)
+        return self.screen
+
+    def run_frame(self, events: list, idle_update: bool = False):
+        """
+        Run one frame of the main loop with already collected events: dispatch them,
+        render if a repaint is pending and run deferred tasks.
+
+        Args:
+            events (list): List of pygame events (may be empty).
+            idle_update (bool): If True, the visible view is updated even if there are no events.
+        """
+        clock = pygame.time.get_ticks
+        if self.event_batching:
+            events = coalesce_mouse_motion(events)
+        self.scheduler.begin_frame(clock())
+        self.profiler.begin_frame()
+        self.process_events(events)
+        if idle_update and len(events) == 0 and self.visible_view is not None:
+            self.visible_view.update()
+
+        rendered = False
+        if self._needs_repaint and self.visible_view is not None:
+            self.render_frame()
+            self._needs_repaint = False  # repaint done
+            rendered = True
+        self.scheduler.run_deferred(clock)
+        self.scheduler.end_frame(clock(), rendered)
+        self.profiler.end_frame(rendered)
+
+    def grab_frame(self) -> pygame.Surface:
+        """
+        Get a copy of the last rendered frame.
+
+        Returns:
+            pygame.Surface: Copy of the application surface.
+        """
+        return self.screen.copy()
+
+    def grab_pixels(self):
+        """
+        Get the pixels of the last rendered frame.
+
+        Returns:
+            numpy.ndarray: Array of shape (width, height, 3) with RGB values.
+        """
+        return pygame.surfarray.array3d(self.screen)
+
+    def run_scheduled_frame(self, block: bool = True):
+        """
+        Run one iteration of the frame-scheduled main loop.
+
+        Waits for events only until the next update tick or render is due (or blocks
+        when nothing is animated), dispatches all pending events, runs the due update
+        ticks of the visible view, renders if a repaint is pending and the FPS cap
+        allows it and finally runs deferred tasks while the frame budget allows it.
+
+        Args:
+            block (bool): If False, the frame never waits for events and returns
+                immediately when there are no events and nothing is due (used by run_async()).
+        """
+        scheduler = self.scheduler
+        clock = pygame.time.get_ticks
+        render_pending = self._needs_repaint or len(self._dirty_rects) != 0
+        active = self._frame_requested or render_pending
+        wait = scheduler.wait_time(clock(), active, render_pending)
+        if not block:
+            events = pygame.event.get()
+            if len(events) == 0 and wait != 0:
+                if wait is None:
+                    scheduler.reset(clock())
+                return
+        elif wait is None:
+            events = [pygame.event.wait()]
+            # the loop was idle, do not try to catch up the missed update ticks
+            scheduler.reset(clock())
+        elif wait > 0:
+            event = pygame.event.wait(wait)
+            events = [] if event.type == pygame.NOEVENT else [event]
+        else:
+            events = []
+        if block:
+            events += pygame.event.get()
+        if self.event_batching:
+            events = coalesce_mouse_motion(events)
+
+        scheduler.begin_frame(clock())
+        self.profiler.begin_frame()
+        self.process_events(events, update=False)
+
+        view = self.visible_view
+        for i in range(scheduler.pending_updates(clock())):
+            # ticks which do not fit into the frame budget stay pending
+            if i > 0 and scheduler.time_left(clock()) <= 0:
+                break
+            scheduler.consume_update()
+            self._frame_requested = False
+            if view is not None:
+                view.update()
+
+        rendered = False
+        render_pending = self._needs_repaint or len(self._dirty_rects) != 0
+        if render_pending and view is not None and scheduler.render_due(clock()):
+            self.render_frame()
+            self._needs_repaint = False
+            rendered = True
+        scheduler.run_deferred(clock)
+        scheduler.end_frame(clock(), rendered)
+        self.profiler.end_frame(rendered)
+
+    def process_events(self, events: list, update: bool = True):
+        """
+        Process a batch of events: handle application events and dispatch the
+        rest to the visible view, followed by a single view update.
 
+        Args:
+            events (list): List of pygame events.
+            update (bool): If True, View.update() is called after the batch
+                (the frame scheduler runs updates on its own ticks instead).
+        """
+        view_events = []
+        quit_requested = False
+        for event in events:
             if event.type == pygame.QUIT:
-                self.running = False
+                quit_requested = True
             elif event.type == REPAINT_EVENT:
                 self._needs_repaint = True
+                self._full_repaint = True
+            elif event.type == TASK_DONE_EVENT:
+                self.executor.dispatch_completed()
+            elif event.type == pygame.VIDEORESIZE:
+                # only the last size of the batch is laid out (see apply_resize())
+                self._pending_resize = event.size
+            elif event.type == pygame.KEYDOWN and self.profiler.enabled and \
+                    event.key == self.profiler.toggle_key:
+                self.toggle_profiler_overlay()
             else:
-                if self.visible_view is not None:
-                    self.visible_view.process_evt(event)
-                    self.visible_view.update()
-                self._needs_repaint = True  # repaint after every event
-
-            if self._needs_repaint and self.visible_view is not None:
-                if self.visible_view.get_fill_color() is None:
-                    self.screen.fill(self.fill_color)
-                else:
-                    self.screen.fill(self.visible_view.get_fill_color())
-                self.visible_view.render(self.screen)
-                pygame.display.flip()
-                self._needs_repaint = False  # repaint done
+                view_events.append(event)
+
+        if len(view_events) != 0:
+            # a callback may switch the view, the rest of the batch goes to the new one
+            while len(view_events) != 0 and self.visible_view is not None:
+                view = self.visible_view
+                view_events = view.process_evts(view_events)
+                if update:
+                    view.update()
+            self._needs_repaint = True  # repaint after every event batch
+
+        self.apply_resize()
+        view = self.visible_view
+        if view is not None and view.is_layout_pending():
+            view.update_layouts(self.screen.get_width(), self.screen.get_height())
+            self._needs_repaint = True
+
+        # quit after the batch, so events queued before QUIT are still handled
+        if quit_requested:
+            self.running = False
+
+    def apply_resize(self):
+        """
+        Apply the window size of the last VIDEORESIZE event received since the previous call.
+
+        Called once per frame after the events are processed, so a live resize of the
+        window runs at most one layout pass per frame. Views which are not visible are
+        laid out for the new size when they are shown.
+        """
+        size = self._pending_resize
+        if size is None:
+            return
+        self._pending_resize = None
+        size = (max(size[0], 50), max(size[1], 50))
+        self.width, self.height = size
+        if self.screen.get_size() != size:
+            # pygame resizes the window surface itself, only the headless surface is recreated
+            if self.headless:
+                self.screen = pygame.display.set_mode(size)
+            else:
+                self.screen = pygame.display.get_surface()
+        if self.visible_view is not None:
+            self.visible_view.update_layouts(self.screen.get_width(), self.screen.get_height())
+        self.request_repaint()
+
+    def render_frame(self):
+        """
+        Render the active view and present it on the display.
+
+        Without dirty-rectangle rendering the whole window is redrawn and flipped.
+        With it, only elements intersecting the invalidated regions are redrawn
+        (clipped to their union) and only those regions are presented.
+        Overlay layers queued with draw_later() are drawn over the view, cached layers
+        damaged by their owner are restored from the saved pixels underneath them
+        instead of redrawing the elements underneath. The profiler overlay (if visible)
+        is drawn over the rendered frame.
+        """
+        view = self.visible_view
+        if view is None:
+            return
+        overlay = self.profiler.enabled and self.profiler.overlay_visible
+        if not self.dirty_rendering or self._full_repaint:
+            self._full_repaint = False
+            self._rendering = True
+            self.compositor.clear_cache()
+            self.screen.fill(self.get_view_fill_color(view))
+            view.render(self.screen)
+            self.compositor.flush(view, self.screen)
+            if overlay:
+                self.profiler.draw_overlay(self.screen)
+            self._rendering = False
+            self._dirty_rects = []
+            pygame.display.flip()
+            return
+
+        if overlay:
+            # the overlay content changes every frame
+            self._dirty_rects.append(self.profiler.get_overlay_rect(self.screen))
+        screen_rect = self.screen.get_rect()
+        rects = [r.clip(screen_rect) for r in self._dirty_rects]
+        rects = [r for r in rects if r.width > 0 and r.height > 0]
+        self._dirty_rects = []
+        self._rendering = True
+        restored = [r.clip(screen_rect) for r in self.compositor.restore_damaged(self.screen)]
+        if len(rects) == 0:
+            self._rendering = False
+            if len(restored) != 0:
+                pygame.display.update(restored)
+            return
+        region = rects[0].unionall(rects[1:])
+        self.screen.set_clip(region)
+        self.screen.fill(self.get_view_fill_color(view), region)
+        view.render(self.screen, region)
+        region = region.unionall(restored)
+        self.screen.set_clip(region)
+        self.compositor.flush(view, self.screen, region)
+        if overlay:
+            self.profiler.draw_overlay(self.screen)
+        self.screen.set_clip(None)
+        self._rendering = False
+        pygame.display.update(rects + restored)
+
+    def get_view_fill_color(self, view) -> tuple:
+        """
+        Get the background color used when rendering a view.
+
+        Args:
+            view (View): The rendered view.
+
+        Returns:
+            tuple: Fill color of the view, or the application fill color if the view has none.
+        """
+        if view.get_fill_color() is None:
+            return self.fill_color
+        return view.get_fill_color()
 
-        pygame.quit()
-        return True
-    
     def request_repaint(self):
         """
-        Request an immediate repaint of the active view.
+        Request a full repaint of the active view.
+
+        The repaint is not done immediately: all requests made while an event batch
+        is processed are merged into a single render at the end of the frame.
+        Use flush_repaint() if the window must be updated synchronously.
         """
         self._needs_repaint = True
-        if self.visible_view is not None:
-            if self.visible_view.get_fill_color() is None:
-                self.screen.fill(self.fill_color)
-            else:
-                self.screen.fill(self.visible_view.get_fill_color())
-            self.visible_view.render(self.screen)
-            pygame.display.flip()
+        self._full_repaint = True
+
+    def flush_repaint(self):
+        """
+        Render the active view immediately if a repaint is pending.
+        """
+        if self._needs_repaint and not self._rendering and self.visible_view is not None:
+            self.render_frame()
             self._needs_repaint = False
 
+    def enable_dirty_rendering(self):
+        """
+        Enable dirty-rectangle rendering.
+
+        Elements report the areas they changed (see GUIElement.invalidate()) and
+        only those areas are redrawn and presented with pygame.display.update().
+        Periodic and explicitly requested repaints still redraw the whole window.
+        """
+        self.dirty_rendering = True
+        self._full_repaint = True
+
+    def disable_dirty_rendering(self):
+        """
+        Disable dirty-rectangle rendering. Every repaint redraws the whole window.
+        """
+        self.dirty_rendering = False
+        self._dirty_rects = []
+
+    def invalidate_rect(self, rect: pygame.Rect, source=None):
+        """
+        Mark a region of the window as needing a redraw.
+
+        Regions invalidated while a frame is being drawn are ignored, they
+        are already part of the frame being rendered. Otherwise a repaint is
+        requested, so the region is presented by the next frame. If the source owns a cached
+        overlay layer (see draw_later()), the part of the region covered by the
+        layer is restored from the saved pixels instead of being redrawn.
+
+        Args:
+            rect (pygame.Rect): Region in window coordinates.
+            source (GUIElement, optional): Element which changed.
+        """
+        if not self.dirty_rendering or self._full_repaint or self._rendering:
+            return
+        rect = pygame.Rect(rect)
+        if source is not None:
+            rest = self.compositor.damage(source, rect)
+            if rest is not None:
+                rect = rest
+        self._dirty_rects.extend(self.compositor.invalidate(rect, source))
+        self._dirty_rects.append(rect)
+        self._needs_repaint = True
+
+    def invalidate_all(self):
+        """
+        Mark the whole window as needing a redraw on the next repaint.
+        """
+        self._full_repaint = True
+        self._dirty_rects = []
+
+    def enable_render_cache(self):
+        """
+        Enable the render cache of all GUI elements (unless disabled on the element itself).
+
+        Every element is drawn into a cached surface once and then only blitted
+        until it is invalidated by a change of its state, style, text, size or position.
+        """
+        self.render_cache = True
+
+    def disable_render_cache(self):
+        """
+        Disable the render cache and release all cached surfaces.
+        """
+        self.render_cache = False
+        for view in self.views:
+            view.clear_render_cache()
+
+    def begin_render_cache(self, size: tuple, rect: pygame.Rect) -> pygame.Surface:
+        """
+        Internal: Get a transparent surface an element is drawn into when its render cache is built.
+
+        Args:
+            size (tuple): Size of the surface the element is drawn on.
+            rect (pygame.Rect): Area of the element (cleared and used as the clip).
+
+        Returns:
+            pygame.Surface: Surface in the display format with per-pixel alpha.
+        """
+        scratch = self._cache_scratch
+        if scratch is None or scratch.get_width() < size[0] or scratch.get_height() < size[1]:
+            width, height = size
+            if scratch is not None:
+                width = max(width, scratch.get_width())
+                height = max(height, scratch.get_height())
+            scratch = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+            self._cache_scratch = scratch
+        scratch.set_clip(rect)
+        scratch.fill((0, 0, 0, 0), rect)
+        self._building_cache = True
+        return scratch
+
+    def end_render_cache(self):
+        """
+        Internal: Finish building a render cache started with begin_render_cache().
+        """
+        self._building_cache = False
+        self._cache_scratch.set_clip(None)
+
+    def is_building_render_cache(self) -> bool:
+        """
+        Check whether a render cache is being built (nested elements are then drawn directly).
+
+        Returns:
+            bool: True while an element is drawn into its render cache.
+        """
+        return self._building_cache
+
     def enable_periodic_repaint(self, fps=60):
         """
         Enable periodic repaint at a given FPS.
@@ -265,6 +822,223 @@ class Application:
         self._periodic_repaint_enabled = False
         pygame.time.set_timer(REPAINT_EVENT, 0)
 
+    def enable_frame_scheduler(self, update_rate: int = 60, fps: int = 60, frame_budget: float = None):
+        """
+        Run the main loop with the fixed-timestep frame scheduler.
+
+        View.update() is called at a fixed rate independent of events, rendering
+        is capped to the given FPS and the work of a frame is limited by a time
+        budget (deferred tasks and update ticks that do not fit move to the next frame).
+        When nothing is animated (see request_frame()) and no repaint is pending,
+        the loop blocks until the next event instead of ticking.
+
+        Args:
+            update_rate (int): Number of View.update() ticks per second.
+            fps (int): Maximum number of rendered frames per second (0 = uncapped).
+            frame_budget (float, optional): Time budget of one frame in milliseconds.
+                Defaults to the frame interval.
+        """
+        self.scheduler.configure(update_rate, fps, frame_budget)
+        self.scheduler.reset(pygame.time.get_ticks())
+        self.frame_scheduling = True
+
+    def disable_frame_scheduler(self):
+        """
+        Disable the frame scheduler. Updates and repaints happen after every event (batch) again.
+        """
+        self.frame_scheduling = False
+
+    def request_frame(self):
+        """
+        Request another update tick of the frame scheduler.
+
+        Animated elements and views call this from update() to keep the
+        scheduler ticking; when nobody requests a frame the loop goes idle.
+        """
+        self._frame_requested = True
+
+    def defer(self, task):
+        """
+        Defer a task to the end of a later frame, when there is time left in the frame budget.
+
+        Args:
+            task (callable): Function without arguments, called on the main loop.
+        """
+        self.scheduler.defer(task)
+
+    def run_task(self, task, *args, callback=None, error_callback=None, process: bool = False, **kwargs):
+        """
+        Run a task in the background without blocking the main loop.
+
+        The callbacks are called on the main loop (UI thread), so they can safely modify
+        GUI elements. Coroutine callbacks are scheduled with run_coroutine().
+
+        Example:
+            app.run_task(load_rows, path, callback=table.refresh_table)
+
+        Args:
+            task (callable): Function to run. Tasks run in a process must be picklable.
+            *args: Positional arguments for the task.
+            callback (callable, optional): Called with the result of the task.
+            error_callback (callable, optional): Called with the exception raised by the task.
+            process (bool): If True, the task runs in a worker process instead of a thread
+                (for CPU-bound work).
+            **kwargs: Keyword arguments for the task.
+
+        Returns:
+            concurrent.futures.Future: Future of the task (can be used to cancel it).
+        """
+        return self.executor.submit(
+            task, *args,
+            callback=self._ui_callback(callback),
+            error_callback=self._ui_callback(error_callback),
+            process=process, **kwargs
+        )
+
+    def _ui_callback(self, callback):
+        """
+        Internal: Wrap a callback of a background task to schedule its coroutine and request a repaint.
+        """
+        if callback is None:
+            return None
+
+        def wrapper(value):
+            result = callback(value)
+            if inspect.isawaitable(result):
+                self.run_coroutine(result)
+            self._needs_repaint = True
+        return wrapper
+
+    def set_task_workers(self, max_threads: int = 4, max_processes: int = None):
+        """
+        Set the size of the worker pools used by run_task(). Running pools are restarted.
+
+        Args:
+            max_threads (int): Maximum number of worker threads.
+            max_processes (int, optional): Maximum number of worker processes (None = number of CPUs).
+        """
+        self.executor.shutdown()
+        self.executor.max_threads = max(int(max_threads), 1)
+        self.executor.max_processes = max_processes
+
+    def get_frame_stats(self) -> dict:
+        """
+        Get frame telemetry of the main loop (frame times, missed frames, dropped update ticks, ...).
+
+        Returns:
+            dict: See FrameScheduler.get_stats().
+        """
+        return self.scheduler.get_stats()
+
+    def enable_event_batching(self):
+        """
+        Enable event batching in the main loop.
+
+        All pending events are drained from the queue, consecutive MOUSEMOTION
+        events are merged into one and the whole batch is processed before a
+        single render, instead of rendering after every event.
+        """
+        self.event_batching = True
+
+    def disable_event_batching(self):
+        """
+        Disable event batching. Every event is processed and rendered on its own.
+        """
+        self.event_batching = False
+
+    def enable_profiler(self, overlay: bool = False, toggle_key: int = pygame.K_F3, top_n: int = 5):
+        """
+        Enable the per-element frame profiler.
+
+        Draw, event and update times of the elements of the visible view are
+        measured every frame, see get_profiler_stats().
+
+        Args:
+            overlay (bool): True to show the overlay with FPS, frame time graph and the most expensive elements.
+            toggle_key (int): Key toggling the overlay (None = no key). The key is not passed to the view.
+            top_n (int): Number of most expensive elements shown in the overlay.
+        """
+        self.profiler.toggle_key = toggle_key
+        self.profiler.top_n = top_n
+        self.profiler.reset()
+        self.profiler.enable()
+        if overlay:
+            self.toggle_profiler_overlay()
+
+    def disable_profiler(self):
+        """
+        Disable the frame profiler and hide its overlay.
+        """
+        if self.profiler.overlay_visible:
+            self.invalidate_all()
+            self._needs_repaint = True
+        self.profiler.disable()
+
+    def toggle_profiler_overlay(self):
+        """
+        Show or hide the profiler overlay (only while the profiler is enabled).
+        """
+        if not self.profiler.enabled:
+            return
+        self.profiler.overlay_visible = not self.profiler.overlay_visible
+        self.invalidate_all()
+        self._needs_repaint = True
+
+    def get_profiler_stats(self) -> dict:
+        """
+        Get the data collected by the frame profiler.
+
+        Returns:
+            dict: fps, frame_time (ms of the last loop iteration), history (list of frame times in ms),
+                elements (per-instance timings of the last rendered frame, see FrameProfiler.get_element_stats())
+                classes (timings aggregated per element class) and text_cache
+                (statistics of the rendered text cache, see TextCache.get_stats()).
+        """
+        return {
+            "fps": self.profiler.fps,
+            "frame_time": self.profiler.get_frame_time(),
+            "history": list(self.profiler.history),
+            "elements": self.profiler.get_element_stats(),
+            "classes": self.profiler.get_class_stats(),
+            "text_cache": text_cache.get_stats()
+        }
+
+    def get_startup_report(self) -> dict:
+        """
+        Get the duration of the startup phases (init() and start()).
+
+        Returns:
+            dict: Times in milliseconds: style_sheet, pygame_init, font_discovery (system font
+                enumeration or font cache loading), display, init_total, create_views and show_view;
+                font_cache_hit is True if the system fonts were loaded from the font cache.
+        """
+        return dict(self._startup_report)
+
+    def set_text_backend(self, backend: str):
+        """
+        Select the text backend used by all elements ("text_backend" of the default style sets it too).
+
+        "font" renders text with pygame.font into cached surfaces, "freetype" draws it
+        directly onto the screen with pygame.freetype. Must be called before the elements
+        are created (before start()), existing elements keep their fonts.
+
+        Args:
+            backend (str): "font" or "freetype".
+
+        Raises:
+            ValueError: If the backend name is unknown.
+        """
+        font_registry.set_backend(backend)
+
+    def set_text_cache_budget(self, budget: int):
+        """
+        Set the size budget of the rendered text cache shared by all elements.
+
+        Args:
+            budget (int): Maximum total size of the cached text surfaces in bytes.
+        """
+        text_cache.set_budget(budget)
+
     def close(self):
         """
         Close the application and clean up views.
@@ -300,6 +1074,7 @@ class Application:
             view.openEvt_base(self.screen.get_width(),
                               self.screen.get_height())
             self.visible_view = view
+            self.invalidate_all()
             # change window title
             if len(view.name) == 0:
                 pygame.display.set_caption(self.name)
@@ -337,15 +1112,23 @@ class Application:
             if view.ID == id:
                 return self.show_view(view)
 
-    def draw_later(self, z_index, draw_callback):
+    def draw_later(self, z_index, draw_callback, rect: pygame.Rect = None, key=None):
         """
         Add a draw callback to the queue for deferred drawing.
 
+        The queue is drawn after the view in the current frame and cleared, so
+        the callback has to be queued again in every frame it should be drawn
+        (typically from the draw() method of the owning element).
+
         Args:
             z_index (int): Z-INDEX; higher values will be drawn above lower ones.
             draw_callback (callable): Function to call for drawing (signature: draw(self, view, screen)).
+            rect (pygame.Rect, optional): Area covered by the layer.
+            key (optional): The owning element. Layers with rect and key are cached: when the
+                owner changes or closes the layer, the content underneath is restored from the
+                saved pixels instead of being redrawn (dirty-rectangle rendering only).
         """
-        self.draw_queue.append({"Z-INDEX": z_index, "CALLBACK": draw_callback})
+        self.compositor.push(z_index, draw_callback, rect, key)
 
 # **************************************************************************************************************
 # Base View 
@@ -370,6 +1153,8 @@ class View(metaclass=abc.ABCMeta):
         layout_manager_list (list): List of registered layout managers for this view.
         cursor: The default system cursor for this view.
         app (Application): Reference to the parent Application (set via set_application()).
+        spatial_index (SpatialGrid): Grid of element areas used to route pointer events.
+        focus_manager (FocusManager): Tracks the selected, focused and hovered elements.
     """
 
     def __init__(self, name: str, id: int):
@@ -387,6 +1172,18 @@ class View(metaclass=abc.ABCMeta):
         self.filter = None
         self.GUIElements = []
         self.layout_manager_list = []
+        self.app = None
+        self.spatial_index = SpatialGrid()
+        self.focus_manager = FocusManager()
+        self._element_order = {}
+        self._element_counter = 0
+        self._indexed_elements = []
+        self._moved_elements = set()
+        self._pointer_targets = set()
+        self._pressed_elements = set()
+        self._layout_batch = 0
+        self._deferred_geometry = {}
+        self._layout_pending = False
         self.set_default_cursor()
 
     def set_id(self, id: int):
@@ -408,6 +1205,11 @@ class View(metaclass=abc.ABCMeta):
         for el in elements:
             if isinstance(el, GUIElement):
                 self.GUIElements.append(el)
+                self._indexed_elements.append(el)
+                self._element_order[el] = self._element_counter
+                self._element_counter += 1
+                self._moved_elements.add(el)
+                el.invalidate()
 
     def remove_gui_element(self, element):
         """
@@ -416,15 +1218,201 @@ class View(metaclass=abc.ABCMeta):
         Args:
             element (GUIElement): The GUI element to remove.
         """
+        element.invalidate()
         self.GUIElements.remove(element)
+        if element in self._element_order:
+            self._indexed_elements.remove(element)
+        self.spatial_index.remove(element)
+        self._element_order.pop(element, None)
+        self._moved_elements.discard(element)
+        self._pointer_targets.discard(element)
+        self._pressed_elements.discard(element)
+        self.focus_manager.element_removed(element)
+        element.release_fonts()
+
+    def element_moved(self, element):
+        """
+        Internal: Called when the area of an element changes, its entry in the spatial index
+        is updated before the next pointer event is dispatched.
+
+        Args:
+            element (GUIElement): The moved or resized element.
+        """
+        if element in self._element_order:
+            self._moved_elements.add(element)
+
+    @contextmanager
+    def batch_layout(self):
+        """
+        Context manager which defers the geometry updates of the elements of this view.
+
+        Inside the block set_x(), set_y(), set_width(), set_height() and set_geometry()
+        only record the change; when the outermost block ends, every changed element
+        runs update_view_rect() (e.g. refresh of Table or ListPanel) and size_changed()
+        once. Layout passes of the view run inside a batch.
+
+        Example usage:
+            with view.batch_layout():
+                table.set_width(400)
+                table.set_height(300)   # the table is refreshed only once
+
+        Yields:
+            View: This view.
+        """
+        self._layout_batch += 1
+        try:
+            yield self
+        finally:
+            self._layout_batch -= 1
+            if self._layout_batch == 0:
+                self.flush_geometry_updates()
+
+    def defer_geometry_update(self, element, size_changed: bool) -> bool:
+        """
+        Internal: Record a geometry change of an element if a layout batch is active.
+
+        Args:
+            element (GUIElement): The moved or resized element.
+            size_changed (bool): True if the width or height changed.
+
+        Returns:
+            bool: True if the update was deferred, False if it must be applied now.
+        """
+        if self._layout_batch == 0:
+            return False
+        self._deferred_geometry[element] = self._deferred_geometry.get(element, False) or size_changed
+        return True
+
+    def update_layouts(self, width: int, height: int):
+        """
+        Run a layout pass: update the layout managers which are dirty or were laid out
+        for another size (see Layout.needs_layout()).
+
+        Geometry changes are batched (see batch_layout()); managers made dirty by the
+        pass (e.g. a Panel resized by another layout) are updated in further rounds.
+
+        Args:
+            width (int): Width of the view window.
+            height (int): Height of the view window.
+        """
+        self._layout_pending = False
+        for _ in range(len(self.layout_manager_list) + 1):
+            updated = False
+            with self.batch_layout():
+                for lm in self.layout_manager_list:
+                    if lm.layout(width, height):
+                        updated = True
+            if not updated:
+                break
+
+    def request_layout(self):
+        """
+        Request a layout pass at the end of the current frame (used when the intrinsic
+        size of an element changed, see GUIElement.invalidate_measure()).
+        """
+        self._layout_pending = True
+
+    def is_layout_pending(self) -> bool:
+        """
+        Check whether a layout pass was requested with request_layout().
+
+        Returns:
+            bool: True if update_layouts() should run.
+        """
+        return self._layout_pending
+
+    def flush_geometry_updates(self):
+        """
+        Apply the geometry updates deferred by batch_layout().
+
+        Updates caused by the flushed elements (e.g. a ComboBox moving its button)
+        are collected and applied in the following rounds.
+        """
+        self._layout_batch += 1
+        try:
+            while len(self._deferred_geometry) != 0:
+                pending = self._deferred_geometry
+                self._deferred_geometry = {}
+                for el, size_changed in pending.items():
+                    el.update_view_rect()
+                    el.invalidate()
+                    if size_changed:
+                        el.size_changed()
+        finally:
+            self._layout_batch -= 1
+
+    def update_spatial_index(self):
+        """
+        Bring the spatial index up to date with the areas of the GUI elements.
+
+        The index is rebuilt if the list of GUI elements was modified directly
+        (elements added, removed, replaced or reordered).
+        """
+        if self._indexed_elements != self.GUIElements:
+            self.spatial_index.clear()
+            self._indexed_elements = list(self.GUIElements)
+            self._element_order = {}
+            for i, el in enumerate(self.GUIElements):
+                self._element_order[el] = i
+            self._element_counter = len(self.GUIElements)
+            self._pointer_targets.intersection_update(self.GUIElements)
+            self._pressed_elements.intersection_update(self.GUIElements)
+            self._moved_elements = set(self.GUIElements)
+        for el in self._moved_elements:
+            self.spatial_index.insert(el, el.get_view_rect().union(el.get_paint_rect()))
+        self._moved_elements = set()
+
+    def get_pointer_targets(self, pos: tuple) -> list:
+        """
+        Get the elements a pointer event at a position is dispatched to.
+
+        These are the elements under the position, the elements which were under
+        the previous pointer event (so they can react to the mouse leaving them),
+        the elements capturing the mouse (selected or focused, e.g. a dragged scrollbar)
+        and the elements pressed by a mouse button until the button is released.
+
+        Args:
+            pos (tuple): Position of the pointer event.
+
+        Returns:
+            list: Target elements in the order of the view's element list.
+        """
+        self.update_spatial_index()
+        targets = set(self.spatial_index.query_point(pos[0], pos[1]))
+        targets.update(self._pointer_targets)
+        targets.update(self._pressed_elements)
+        return sorted(targets, key=self._element_order.__getitem__)
+
+    def has_capture(self, element) -> bool:
+        """
+        Check whether an element (or one of its children) captures the mouse.
+
+        Args:
+            element (GUIElement): The element.
+
+        Returns:
+            bool: True if the element or any of its children is selected or focused.
+        """
+        return self.focus_manager.has_capture(element)
+
+    def invalidate_element(self, element):
+        """
+        Report the painted area of an element to the dirty-rectangle renderer.
+        Only has an effect while this view is visible and dirty rendering is enabled.
+
+        Args:
+            element (GUIElement): The element whose area needs a redraw.
+        """
+        app = self.app
+        if app is not None and app.dirty_rendering and app.visible_view is self:
+            app.invalidate_rect(element.get_paint_rect(), element)
 
     def request_repaint(self):
         """
         Request a repaint of this view (only if it is currently visible/active).
-        Triggers the repaint mechanism in the parent application.
+        The repaint is merged with other requests into one render at the end of the frame.
         """
         if hasattr(self, "app") and self.app is not None and self.app.visible_view == self:
-            self.app._needs_repaint = True
             self.app.request_repaint()
 
     @final
@@ -574,8 +1562,7 @@ class View(metaclass=abc.ABCMeta):
         if self.fill_color is None:
             self.fill_color = self.get_app().get_style_manager(
             ).get_style_with_name("default")["fill_color"]
-        for lm in self.layout_manager_list:
-            lm.update_layout(width, height)
+        self.update_layouts(width, height)
 
     @abc.abstractmethod
     def create_evt(self):
@@ -596,16 +1583,17 @@ class View(metaclass=abc.ABCMeta):
     @final
     def openEvt_base(self, width: int, height: int):
         """
-        Internal: Called when this view becomes visible, updates layout, and unselects all elements.
+        Internal: Called when this view becomes visible, updates layout (if the window size
+        changed or a layout is dirty), and unselects all elements.
 
         Args:
             width (int): Width of the view window.
             height (int): Height of the view window.
         """
-        for lm in self.layout_manager_list:
-            lm.update_layout(width, height)
+        self.update_layouts(width, height)
         for el in self.GUIElements:
             el.un_select()
+        self.focus_manager.clear()
         self.open_evt()
 
     @abc.abstractmethod
@@ -640,18 +1628,87 @@ class View(metaclass=abc.ABCMeta):
         Args:
             event: A pygame event object.
         """
-        if self.app is not None:
-            if self.filter is None:
-                for el in self.GUIElements:
-                    el.process_event(self, event)
-            else:
-                self.filter["element"].process_event(self, event)
-        selected = self.find_element(
-            self.GUIElements, lambda el: el.is_selected())
-        if selected is not None:
-            pygame.mouse.set_cursor(selected.get_select_cursor())
+        self.dispatch_evt(event)
+        self.update_cursor()
+
+    @final
+    def process_evts(self, events: list) -> list:
+        """
+        Process a batch of events and update the mouse cursor once at the end.
+
+        If the view gets hidden while processing (e.g. a button switched the
+        view), the remaining events are not dispatched and are returned.
+
+        Args:
+            events (list): List of pygame event objects.
+
+        Returns:
+            list: Events which were not processed by this view.
+        """
+        for i, event in enumerate(events):
+            if not self.visible:
+                self.update_cursor()
+                return events[i:]
+            self.dispatch_evt(event)
+        self.update_cursor()
+        return []
+
+    def dispatch_evt(self, event):
+        """
+        Dispatch a single event to GUI elements (respecting the event filter).
+
+        Pointer events are dispatched only to the elements returned by
+        get_pointer_targets(), keyboard events only to the (top-level element
+        containing the) focused element, other events and keyboard events
+        without a focused element to all elements.
+
+        Args:
+            event: A pygame event object.
+        """
+        if self.app is None:
+            return
+        pointer = self.filter is None and event.type in POINTER_EVENTS
+        if self.filter is not None:
+            elements = [self.filter["element"]]
+        elif pointer:
+            elements = self.get_pointer_targets(event.pos)
+        elif event.type in KEYBOARD_EVENTS and self.focus_manager.focused is not None:
+            self.update_spatial_index()
+            root = self.focus_manager.get_focused_root()
+            elements = [root] if root in self._element_order else self.GUIElements
         else:
-            pygame.mouse.set_cursor(self.cursor)
+            elements = self.GUIElements
+
+        if self.app.profiler.enabled:
+            profiler = self.app.profiler
+            for el in elements:
+                start = perf_counter()
+                el.process_event(self, event)
+                profiler.record("event", el, perf_counter() - start)
+        else:
+            for el in elements:
+                el.process_event(self, event)
+
+        if pointer:
+            # elements under the cursor get the next pointer event too (to handle leaving them)
+            under = self.spatial_index.query_point(event.pos[0], event.pos[1])
+            self._pointer_targets = set(under)
+            self.focus_manager.set_hovered(
+                max(under, key=self._element_order.__getitem__) if len(under) != 0 else None)
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                self._pressed_elements.update(self._pointer_targets)
+            elif event.type == pygame.MOUSEBUTTONUP:
+                self._pressed_elements = set()
+            for el in elements:
+                if el in self._element_order and self.has_capture(el):
+                    self._pointer_targets.add(el)
+
+    def update_cursor(self):
+        """
+        Set the mouse cursor of the most recently selected element, or the view's default cursor.
+        """
+        if self.app is not None:
+            self.app.set_cursor(self.focus_manager.get_cursor(self.cursor))
 
     def find_element(self, list, procces_function=None):
         """
@@ -680,26 +1737,57 @@ class View(metaclass=abc.ABCMeta):
                     break
         return ret
 
-    def render(self, screen: pygame.Surface):
+    def render(self, screen: pygame.Surface, region: pygame.Rect = None):
         """
         Render the view's GUI elements to the given surface.
 
         Args:
             screen (pygame.Surface): Pygame surface to draw on.
+            region (pygame.Rect, optional): If set, only elements painting into
+                this region are drawn (used by dirty-rectangle rendering).
         """
         if self.app is not None:
+            profiler = self.app.profiler if self.app.profiler.enabled else None
             for el in self.GUIElements:
                 if el.is_visible():
-                    el.draw(self, screen)
+                    if region is None or region.colliderect(el.get_paint_rect()):
+                        if profiler is None:
+                            el.draw_cached(self, screen)
+                        else:
+                            start = perf_counter()
+                            el.draw_cached(self, screen)
+                            profiler.record("draw", el, perf_counter() - start)
+
+    def clear_render_cache(self, list=None):
+        """
+        Release the cached surfaces of all GUI elements in this view.
+
+        Args:
+            list (list, optional): List of GUI elements. If None, all elements of the view.
+        """
+        if list is None:
+            list = self.GUIElements
+        for el in list:
+            if el is None:
+                continue
+            el.set_render_cache(el.render_cache)
+            if isinstance(el, Container):
+                self.clear_render_cache(el.get_childs())
 
     def update(self):
         """
         Update all visible GUI elements in this view.
         """
         if self.app is not None:
+            profiler = self.app.profiler if self.app.profiler.enabled else None
             for el in self.GUIElements:
                 if el.is_visible():
-                    el.update(self)
+                    if profiler is None:
+                        el.update(self)
+                    else:
+                        start = perf_counter()
+                        el.update(self)
+                        profiler.record("update", el, perf_counter() - start)
 
 # **************************************************************************************************************
 # base layout manager class
@@ -731,6 +1819,8 @@ class Layout(metaclass=abc.ABCMeta):
         if isinstance(view, View):
             self.view = view
         self.layout_elements = []
+        self._layout_dirty = True
+        self._layout_size = None
         # register
         if register:
             view.register_layout_manager(self)
@@ -752,6 +1842,8 @@ class Layout(metaclass=abc.ABCMeta):
         Args:
             layout_elements (list): New list of layout elements.
         """
+        if layout_elements is not self.layout_elements:
+            self.invalidate_layout()
         self.layout_elements = layout_elements
 
     def add_element(self, element: GUIElement, propt: bool = None):
@@ -764,6 +1856,63 @@ class Layout(metaclass=abc.ABCMeta):
         """
         if isinstance(element, GUIElement):
             self.layout_elements.append({"element": element, "propt": propt})
+            element.layout_owners.add(self)
+            self.invalidate_layout()
+
+    def invalidate_layout(self):
+        """
+        Mark this layout as dirty, it is updated by the next layout pass of the view
+        even if the size of the view did not change.
+        """
+        self._layout_dirty = True
+
+    def element_measure_changed(self, element) -> bool:
+        """
+        Called when the intrinsic size of an element changed (see GUIElement.measure()).
+        Layouts which use intrinsic sizes invalidate themselves if they manage the element.
+
+        Args:
+            element (GUIElement): The element.
+
+        Returns:
+            bool: True if the layout was invalidated.
+        """
+        return False
+
+    def needs_layout(self, width: int, height: int) -> bool:
+        """
+        Check whether the layout must be updated for the given size of the view.
+
+        Args:
+            width (int): Width of the view or screen.
+            height (int): Height of the view or screen.
+
+        Returns:
+            bool: True if the layout is dirty or was last updated for another size.
+        """
+        return self._layout_dirty or self._layout_size != (width, height)
+
+    @final
+    def layout(self, width: int, height: int) -> bool:
+        """
+        Update the layout if it is needed (see needs_layout()) and mark it clean.
+
+        The dirty flag is cleared after update_layout() returns, so update_layout()
+        can check whether the content changed (see CachedLayout).
+
+        Args:
+            width (int): Width of the view or screen.
+            height (int): Height of the view or screen.
+
+        Returns:
+            bool: True if update_layout() was called.
+        """
+        if not self.needs_layout(width, height):
+            return False
+        self._layout_size = (width, height)
+        self.update_layout(width, height)
+        self._layout_dirty = False
+        return True
 
     @abc.abstractmethod
     def update_layout(self, width: int, height: int):
@@ -0,0 +1,191 @@
+"""
+Overlay compositor for SUILib applications
+
+This module provides the Compositor class which draws deferred overlay layers
+(popups, dropdowns, tooltips) over the rendered view. Layers are queued during
+View.render() in a heap ordered by z-index and flushed once the view is drawn,
+the queue is cleared every frame.
+
+Layers registered with a key and a rectangle are cached between frames: the
+compositor keeps a copy of the pixels underneath the layer (save-under). When
+the owner of the layer changes or closes it, the saved pixels are restored
+instead of redrawing the GUI elements underneath the layer.
+"""
+
+import heapq
+import pygame
+
+
+class Compositor:
+    """
+    Z-ordered queue of overlay layers drawn over the rendered view.
+
+    Attributes:
+        queue (list): Heap of (z_index, sequence, callback, rect, key) entries of the current frame.
+        layers (dict): Cached layers (key -> dict with "rect", "under" and "damaged").
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty compositor.
+        """
+        self.queue = []
+        self.layers = {}
+        self._sequence = 0
+
+    def push(self, z_index: int, callback, rect: pygame.Rect = None, key=None):
+        """
+        Queue a layer to be drawn after the view in the current frame.
+
+        Layers with a higher z-index are drawn above lower ones, layers with
+        the same z-index are drawn in the order they were queued.
+
+        Args:
+            z_index (int): Z-index of the layer.
+            callback (callable): Drawing function (signature: callback(view, screen)).
+            rect (pygame.Rect, optional): Area covered by the layer.
+            key (optional): Identifies the layer between frames (usually the owning element).
+                Layers with both rect and key are cached.
+        """
+        heapq.heappush(self.queue, (z_index, self._sequence, callback, rect, key))
+        self._sequence += 1
+
+    def flush(self, view, screen: pygame.Surface, region: pygame.Rect = None):
+        """
+        Draw all queued layers in z-order and clear the queue.
+
+        Cached layers whose area was redrawn in this frame but which were not
+        queued again (e.g. a closed popup) are dropped.
+
+        Args:
+            view (View): The rendered view.
+            screen (pygame.Surface): The surface to draw on.
+            region (pygame.Rect, optional): Area rendered in this frame (None = whole screen).
+        """
+        pushed = set()
+        screen_rect = screen.get_rect()
+        while len(self.queue) != 0:
+            z_index, sequence, callback, rect, key = heapq.heappop(self.queue)
+            if key is not None and rect is not None:
+                pushed.add(key)
+                self._save_under(key, screen, pygame.Rect(rect).clip(screen_rect), region)
+            callback(view, screen)
+        self._sequence = 0
+
+        for key in list(self.layers.keys()):
+            if key not in pushed:
+                if region is None or region.colliderect(self.layers[key]["rect"]):
+                    del self.layers[key]
+
+    def _save_under(self, key, screen: pygame.Surface, rect: pygame.Rect, region: pygame.Rect):
+        """
+        Save the pixels underneath a cached layer (if they are not saved yet).
+
+        Pixels are saved only if the whole area of the layer was rendered in this frame.
+        """
+        layer = self.layers.get(key)
+        if layer is not None and layer["rect"] != rect:
+            layer = None
+        if layer is None:
+            layer = {"rect": rect, "under": None, "damaged": False}
+            self.layers[key] = layer
+        if layer["under"] is None and rect.width > 0 and rect.height > 0:
+            if region is None or region.contains(rect):
+                layer["under"] = screen.subsurface(rect).copy()
+
+    def damage(self, key, rect: pygame.Rect) -> pygame.Rect:
+        """
+        Report a change of the owner of a cached layer.
+
+        If the changed area can be split into the layer (restored from the saved
+        pixels and drawn again) and a rectangle outside of it, the layer is marked
+        as damaged and the outside rectangle is returned.
+
+        Args:
+            key: Key of the layer (the owning element).
+            rect (pygame.Rect): Changed area.
+
+        Returns:
+            pygame.Rect: Part of the area which must be redrawn normally, or None
+                if the layer cannot be restored (the whole area must be redrawn).
+        """
+        layer = self.layers.get(key)
+        if layer is None or layer["under"] is None or not rect.colliderect(layer["rect"]):
+            return None
+        rest = subtract_rect(rect, layer["rect"])
+        if rest is None or rest.width <= 0 or rest.height <= 0:
+            return None
+        layer["damaged"] = True
+        return rest
+
+    def invalidate(self, rect: pygame.Rect, exclude=None) -> list:
+        """
+        Drop the saved pixels of all cached layers intersecting a changed area.
+
+        Args:
+            rect (pygame.Rect): Changed area.
+            exclude (optional): Key of a layer which is not affected.
+
+        Returns:
+            list: Areas of damaged layers which can no longer be restored and must be redrawn normally.
+        """
+        lost = []
+        for key, layer in self.layers.items():
+            if key is not exclude and layer["under"] is not None and rect.colliderect(layer["rect"]):
+                layer["under"] = None
+                if layer["damaged"]:
+                    layer["damaged"] = False
+                    lost.append(pygame.Rect(layer["rect"]))
+        return lost
+
+    def restore_damaged(self, screen: pygame.Surface) -> list:
+        """
+        Restore the saved pixels underneath all damaged layers.
+
+        Args:
+            screen (pygame.Surface): The surface to draw on.
+
+        Returns:
+            list: Restored areas.
+        """
+        restored = []
+        for layer in self.layers.values():
+            if layer["damaged"]:
+                layer["damaged"] = False
+                screen.blit(layer["under"], layer["rect"])
+                restored.append(pygame.Rect(layer["rect"]))
+        return restored
+
+    def clear_cache(self):
+        """
+        Drop all cached layers (e.g. before the whole window is redrawn).
+        """
+        self.layers = {}
+
+
+def subtract_rect(rect: pygame.Rect, cut: pygame.Rect) -> pygame.Rect:
+    """
+    Subtract a rectangle from another one.
+
+    Args:
+        rect (pygame.Rect): Source rectangle.
+        cut (pygame.Rect): Rectangle to remove.
+
+    Returns:
+        pygame.Rect: The remaining rectangle, or None if the rest is not a single rectangle.
+    """
+    if not rect.colliderect(cut):
+        return pygame.Rect(rect)
+    if cut.left <= rect.left and cut.right >= rect.right:
+        if cut.top <= rect.top:
+            top = min(cut.bottom, rect.bottom)
+            return pygame.Rect(rect.x, top, rect.width, rect.bottom - top)
+        if cut.bottom >= rect.bottom:
+            return pygame.Rect(rect.x, rect.y, rect.width, cut.top - rect.top)
+    if cut.top <= rect.top and cut.bottom >= rect.bottom:
+        if cut.left <= rect.left:
+            left = min(cut.right, rect.right)
+            return pygame.Rect(left, rect.y, rect.right - left, rect.height)
+        if cut.right >= rect.right:
+            return pygame.Rect(rect.x, rect.y, cut.left - rect.left, rect.height)
+    return None
@@ -6,6 +6,7 @@ import pygame
 from ..utils import *
 from ..colors import *
 from ..guielement import *
+from ..textcache import draw_text, text_size
 
 
 class Button(GUIElement):
@@ -14,8 +15,8 @@ class Button(GUIElement):
 
     The Button displays customizable text, supports style configuration,
     and triggers a callback function when clicked. It handles rendering
-    with hover and selection effects, and automatically adjusts its size
-    to fit the text content.
+    with hover and selection effects, and automatically grows to fit the
+    text content (the size is never smaller than the text, see update_view_rect()).
 
     Attributes:
         text (str): The text displayed on the button.
@@ -38,15 +39,13 @@ class Button(GUIElement):
             x (int, optional): X coordinate of the button. Defaults to 0.
             y (int, optional): Y coordinate of the button. Defaults to 0.
         """
-        super().__init__(view, x, y, width, height, style)
         self.text = text
+        self.font = None
+        super().__init__(view, x, y, width, height, style)
         self.callbacks = []
         self.hover = False
-        self.font = pygame.font.SysFont(
-            super().get_style()["font_name"],
-            super().get_style()["font_size"],
-            bold=super().get_style()["font_bold"]
-        )
+        self.font = self.acquire_font()
+        self.update_view_rect()
 
     def set_text(self, text: str):
         """
@@ -55,7 +54,13 @@ class Button(GUIElement):
         Args:
             text (str): New text to display on the button.
         """
-        self.text = text
+        if self.text != text:
+            self.invalidate()
+            self.text = text
+            self.invalidate_measure()
+            min_width, min_height = self.get_min_size()
+            self.set_geometry(width=max(super().get_width(), min_width), height=max(super().get_height(), min_height))
+            self.invalidate()
 
     def get_text(self) -> str:
         """
@@ -76,6 +81,42 @@ class Button(GUIElement):
         """
         self.callbacks.append(callback)
 
+    def get_min_size(self) -> tuple:
+        """
+        Get the smallest size of the button which fits its text.
+
+        Returns:
+            tuple: Width and height in pixels.
+        """
+        if self.font is None or len(self.text) == 0:
+            return (0, 0)
+        text_width, text_height = text_size(self.font, self.text)
+        return (text_width + 4, text_height + 4)
+
+    @overrides(GUIElement)
+    def measure(self) -> tuple:
+        """
+        Compute the intrinsic size: the preferred size grown to fit the text.
+
+        Returns:
+            tuple: Width and height in pixels.
+        """
+        min_width, min_height = self.get_min_size()
+        width, height = super().measure()
+        return (max(width, min_width), max(height, min_height))
+
+    @overrides(GUIElement)
+    def update_view_rect(self):
+        """
+        Grow the button to fit its text (if needed) and update its view rectangle.
+        """
+        min_width, min_height = self.get_min_size()
+        if super().get_height() < min_height:
+            self.height = min_height
+        if super().get_width() < min_width:
+            self.width = min_width
+        super().update_view_rect()
+
     @overrides(GUIElement)
     def draw(self, view, screen):
         """
@@ -85,43 +126,38 @@ class Button(GUIElement):
             view: The parent View instance.
             screen (pygame.Surface): The surface to render the button onto.
         """
+        style = self.get_style_record()
         # Draw button background with selection effect
         if self.is_selected():
-            c = super().get_style()["background_color"]
             pygame.draw.rect(
                 screen,
-                color_change(c, -0.2 if c[0] > 128 else 0.6),
+                style.background_color_hover,
                 super().get_view_rect(),
                 border_radius=10
             )
         else:
             pygame.draw.rect(
                 screen,
-                super().get_style()["background_color"],
+                style.background_color,
                 super().get_view_rect(),
                 border_radius=10
             )
         # Draw button text
         if len(self.text) != 0:
-            text_surface = self.font.render(
-                self.text, True, super().get_style()["foreground_color"]
-            )
-            # Auto-resize button to fit text if needed
-            if text_surface.get_height() + 4 > super().get_height():
-                super().set_height(text_surface.get_height() + 4)
-            if text_surface.get_width() + 4 > super().get_width():
-                super().set_width(text_surface.get_width() + 4)
-            screen.blit(
-                text_surface,
+            text_width, text_height = text_size(self.font, self.text)
+            draw_text(
+                screen,
+                self.font,
+                self.text, True, style.foreground_color,
                 (
-                    super().get_x() + (super().get_width() - text_surface.get_width()) / 2,
-                    super().get_y() + (super().get_height() - text_surface.get_height()) / 2
+                    super().get_x() + (super().get_width() - text_width) / 2,
+                    super().get_y() + (super().get_height() - text_height) / 2
                 )
             )
         # Draw button outline
         pygame.draw.rect(
             screen,
-            super().get_style()["outline_color"],
+            style.outline_color,
             super().get_view_rect(),
             2,
             border_radius=10
@@ -142,7 +178,7 @@ class Button(GUIElement):
         if event.type == pygame.MOUSEBUTTONDOWN:
             if in_rect(event.pos[0], event.pos[1], super().get_view_rect()):
                 for callback in self.callbacks:
-                    callback(self)
+                    self.call_callback(callback, self)
         elif event.type == pygame.MOUSEMOTION:
             if in_rect(event.pos[0], event.pos[1], super().get_view_rect()):
                 self.select()
@@ -25,6 +25,9 @@ class Canvas(GUIElement):
         font (pygame.font.Font): Font used for any text rendering inside the canvas.
     """
 
+    # the paint callback can draw different content in every frame
+    RENDER_CACHEABLE = False
+
     def __init__(self, view, style: dict, width: int = 0, height: int = 0, x: int = 0, y: int = 0):
         """
         Initialize a new Canvas instance.
@@ -43,11 +46,7 @@ class Canvas(GUIElement):
         self.control = False
         self.mouse_sensitivity = 2.0
         self.offset = [0, 0]
-        self.font = pygame.font.SysFont(
-            super().get_style()["font_name"],
-            super().get_style()["font_size"],
-            bold=super().get_style()["font_bold"]
-        )
+        self.font = self.acquire_font()
 
     def enable_mouse_control(self):
         """
@@ -92,6 +91,7 @@ class Canvas(GUIElement):
             offset (list): List of two values [x, y] representing the offset.
         """
         self.offset = offset
+        self.invalidate()
 
     def get_offset(self) -> list:
         """
@@ -113,6 +113,7 @@ class Canvas(GUIElement):
             callback (callable): Function to be called for custom drawing.
         """
         self.callback = callback
+        self.invalidate()
 
     @overrides(GUIElement)
     def draw(self, view, screen):
@@ -123,11 +124,13 @@ class Canvas(GUIElement):
             view: The parent View instance.
             screen (pygame.Surface): The surface to render the canvas onto.
         """
+        style = self.get_style_record()
         # Draw canvas background
-        pygame.draw.rect(screen, super().get_style()["background_color"], super().get_view_rect())
+        pygame.draw.rect(screen, style.background_color, super().get_view_rect())
 
         # Create a subsurface for drawing
-        surface = screen.subsurface(
+        surface = clipped_subsurface(
+            screen,
             pygame.Rect(
                 super().get_x(),
                 super().get_y(),
@@ -140,7 +143,7 @@ class Canvas(GUIElement):
             self.callback(surface, self.offset)
 
         # Draw canvas outline
-        pygame.draw.rect(screen, super().get_style()["outline_color"], super().get_view_rect(), 2)
+        pygame.draw.rect(screen, style.outline_color, super().get_view_rect(), 2)
 
     @overrides(GUIElement)
     def process_event(self, view, event):
@@ -166,6 +169,7 @@ class Canvas(GUIElement):
                         else:
                             self.offset[0] += (event.pos[0] - self.last_pos[0]) * self.mouse_sensitivity
                             self.offset[1] += (event.pos[1] - self.last_pos[1]) * self.mouse_sensitivity
+                            self.invalidate()
                         self.mouse_motion = not self.mouse_motion
 
     @overrides(GUIElement)
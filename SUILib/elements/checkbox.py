@@ -37,8 +37,11 @@ class CheckBox(GUIElement):
             x (int, optional): X coordinate of the checkbox. Defaults to 0.
             y (int, optional): Y coordinate of the checkbox. Defaults to 0.
         """
+        self.label = None
         super().__init__(view, x, y, size, size, style)
         self.label = Label(view, super().get_style()["label"], text, False, True, x, y)
+        self.label.parent = self
+        self.update_view_rect()
         self.checked = checked
         self.callback = None
 
@@ -78,7 +81,9 @@ class CheckBox(GUIElement):
         Args:
             checked (bool): True if the checkbox should be checked, False otherwise.
         """
-        self.checked = checked
+        if self.checked != checked:
+            self.checked = checked
+            self.invalidate()
 
     def is_checked(self) -> bool:
         """
@@ -89,6 +94,28 @@ class CheckBox(GUIElement):
         """
         return self.checked
 
+    @overrides(GUIElement)
+    def update_view_rect(self):
+        """
+        Update the view rectangle of the checkbox and move its label next to it.
+        """
+        super().update_view_rect()
+        if self.label is not None:
+            self.label.set_x(super().get_x() + super().get_width() + 5)
+            self.label.set_y(super().get_y() + super().get_height() / 2)
+
+    @overrides(GUIElement)
+    def get_paint_rect(self) -> pygame.Rect:
+        """
+        Get the area covered by the checkbox together with its label.
+
+        Returns:
+            pygame.Rect: The rectangle covering the checkbox and its label.
+        """
+        if self.label is None:
+            return super().get_view_rect()
+        return super().get_view_rect().union(self.label.get_paint_rect())
+
     @overrides(GUIElement)
     def draw(self, view, screen):
         """
@@ -98,31 +125,29 @@ class CheckBox(GUIElement):
             view: The parent View instance.
             screen (pygame.Surface): The surface to render the checkbox onto.
         """
-        # Position and draw the label
+        style = self.get_style_record()
+        # Draw the label
         if self.label is not None:
-            self.label.set_x(super().get_x() + super().get_width() + 5)
-            self.label.set_y(super().get_y() + super().get_height() / 2)
             self.label.draw(view, screen)
         # Draw checkbox background
         if super().is_selected():
-            c = super().get_style()["background_color"]
             pygame.draw.rect(
                 screen,
-                color_change(c, -0.2 if c[0] > 128 else 0.6),
+                style.background_color_hover,
                 super().get_view_rect(),
                 border_radius=6
             )
         else:
             pygame.draw.rect(
                 screen,
-                super().get_style()["background_color"],
+                style.background_color,
                 super().get_view_rect(),
                 border_radius=5
             )
         # Draw checkbox outline
         pygame.draw.rect(
             screen,
-            super().get_style()["outline_color"],
+            style.outline_color,
             super().get_view_rect(),
             2,
             border_radius=5
@@ -136,7 +161,7 @@ class CheckBox(GUIElement):
             ]
             pygame.draw.lines(
                 screen,
-                super().get_style()["foreground_color"],
+                style.foreground_color,
                 False,
                 pts,
                 round(7 * super().get_width() / 40)
@@ -154,8 +179,9 @@ class CheckBox(GUIElement):
         if event.type == pygame.MOUSEBUTTONDOWN:
             if in_rect(event.pos[0], event.pos[1], super().get_view_rect()):
                 if self.callback is not None:
-                    self.callback(self)
+                    self.call_callback(self.callback, self)
                 self.checked = not self.checked
+                self.invalidate()
         elif event.type == pygame.MOUSEMOTION:
             if in_rect(event.pos[0], event.pos[1], super().get_view_rect()):
                 super().select()
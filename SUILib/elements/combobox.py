@@ -8,6 +8,7 @@ import pygame
 from ..utils import *
 from ..colors import *
 from ..guielement import *
+from ..textcache import draw_text, text_size
 
 
 class ComboBox(GUIElement, Container):
@@ -28,6 +29,9 @@ class ComboBox(GUIElement, Container):
         font (pygame.font.Font): Font used for rendering the selected value.
     """
 
+    # the popup panel is queued to the compositor from draw()
+    RENDER_CACHEABLE = False
+
     def __init__(self, view, style: dict, values: list, width: int = 0, height: int = 0, x: int = 0, y: int = 0):
         """
         Initialize a new ComboBox instance.
@@ -53,17 +57,15 @@ class ComboBox(GUIElement, Container):
         self.listpanel = ListPanel(
             view, super().get_style()["listpanel"], values)
         self.listpanel.set_visibility(False)
+        self.listpanel.parent = self
         self.listpanel.set_item_click_evet(lambda p: self.set_selected_item(p))
         # Dropdown toggle button
         self.button = Button(view, super().get_style()["button"], "↓")
+        self.button.parent = self
         self.button.add_click_evt(
             lambda x: self.set_popup_panel_visibility(not self.listpanel.is_visible()))
         # Font for rendering selected value
-        self.font = pygame.font.SysFont(
-            super().get_style()["font_name"],
-            super().get_style()["font_size"],
-            bold=super().get_style()["font_bold"]
-        )
+        self.font = self.acquire_font()
         super().update_view_rect()
 
     @overrides(GUIElement)
@@ -90,6 +92,7 @@ class ComboBox(GUIElement, Container):
         Args:
             visibility (bool): True to show the panel, False to hide it.
         """
+        self.invalidate()
         self.listpanel.set_visibility(visibility)
         if self.listpanel.is_visible():
             self.get_view().setFilter_processOnly(self)
@@ -133,9 +136,10 @@ class ComboBox(GUIElement, Container):
             item_name (str): The value to select.
         """
         self.selected_item = item_name
+        self.invalidate()
         self.set_popup_panel_visibility(False)
         if self.callback is not None:
-            self.callback(self.selected_item)
+            self.call_callback(self.callback, self.selected_item)
 
     def set_value_changed_evt(self, callback):
         """
@@ -147,6 +151,18 @@ class ComboBox(GUIElement, Container):
         """
         self.callback = callback
 
+    @overrides(GUIElement)
+    def get_paint_rect(self) -> pygame.Rect:
+        """
+        Get the area covered by the ComboBox, including the popup panel when it is open.
+
+        Returns:
+            pygame.Rect: The rectangle covering everything drawn by the ComboBox.
+        """
+        if self.listpanel is not None and self.listpanel.is_visible():
+            return super().get_view_rect().union(self.listpanel.get_view_rect())
+        return super().get_view_rect()
+
     @overrides(GUIElement)
     def draw(self, view, screen):
         """
@@ -156,36 +172,37 @@ class ComboBox(GUIElement, Container):
             view: The parent View instance.
             screen (pygame.Surface): The surface to render the ComboBox onto.
         """
+        style = self.get_style_record()
         # Draw ComboBox background
         if self.is_selected():
-            c = super().get_style()["background_color"]
-            pygame.draw.rect(screen, color_change(
-                c, -0.2 if c[0] > 128 else 0.6), super().get_view_rect(), border_radius=10)
+            pygame.draw.rect(screen, style.background_color_hover, super().get_view_rect(), border_radius=10)
         else:
-            pygame.draw.rect(screen, super().get_style()["background_color"], super().get_view_rect(), border_radius=10)
+            pygame.draw.rect(screen, style.background_color, super().get_view_rect(), border_radius=10)
         # Draw selected value text
         if len(self.values[0]) != 0:
-            screen.set_clip(super().get_view_rect())
-            text = self.font.render(
+            prev_clip = screen.get_clip()
+            screen.set_clip(super().get_view_rect().clip(prev_clip))
+            text_width, text_height = text_size(self.font, self.selected_item)
+            draw_text(
+                screen,
+                self.font,
                 self.selected_item,
                 1,
-                super().get_style()["foreground_color"]
-            )
-            screen.blit(
-                text,
+                style.foreground_color,
                 (
-                    super().get_x() + (super().get_width() - text.get_width())/2,
-                    super().get_y() + (super().get_height() - text.get_height())/2
+                    super().get_x() + (super().get_width() - text_width)/2,
+                    super().get_y() + (super().get_height() - text_height)/2
                 )
             )
-            screen.set_clip(None)
+            screen.set_clip(prev_clip)
         # Draw ComboBox outline
-        pygame.draw.rect(screen, super().get_style()["outline_color"], super().get_view_rect(), 2, border_radius=10)
+        pygame.draw.rect(screen, style.outline_color, super().get_view_rect(), 2, border_radius=10)
         # Draw dropdown button
         self.button.draw(view, screen)
         # Draw popup panel if visible (on top)
         if self.listpanel.is_visible():
-            self.get_view().get_app().draw_later(1000, self.listpanel.draw)
+            self.get_view().get_app().draw_later(
+                1000, self.listpanel.draw, self.listpanel.get_view_rect(), self)
 
     @overrides(GUIElement)
     def process_event(self, view, event):
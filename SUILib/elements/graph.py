@@ -45,27 +45,13 @@ class Graph(GUIElement):
                   should draw the desired graph on it.
         """
         self.fig_builder = func
-
-    @overrides(GUIElement)
-    def set_width(self, width):
-        """
-        Set the width of the graph and refresh the rendered figure.
-
-        Args:
-            width (int): New width in pixels.
-        """
-        super().set_width(width)
         self.refresh_graph()
 
     @overrides(GUIElement)
-    def set_height(self, height):
+    def size_changed(self):
         """
-        Set the height of the graph and refresh the rendered figure.
-
-        Args:
-            height (int): New height in pixels.
+        Refresh the rendered figure when the size of the graph changes.
         """
-        super().set_height(height)
         self.refresh_graph()
 
     def refresh_graph(self):
@@ -82,6 +68,7 @@ class Graph(GUIElement):
                 fig,
                 super().get_style()["theme"]
             )
+            self.invalidate()
 
     @overrides(GUIElement)
     def draw(self, view, screen):
@@ -43,6 +43,7 @@ class Image(GUIElement):
             image_path (str): The file path to the new image.
         """
         self.image = load_image(image_path)
+        self.invalidate()
 
     def get_image(self) -> pygame.Surface:
         """
@@ -6,6 +6,7 @@ import pygame
 from ..utils import *
 from ..colors import *
 from ..guielement import *
+from ..textcache import draw_text, text_size
 
 
 class Label(GUIElement):
@@ -42,11 +43,7 @@ class Label(GUIElement):
         self.text = text
         self.h_centered = h_centered
         self.v_centered = v_centered
-        self.font = pygame.font.SysFont(
-            super().get_style()["font_name"],
-            super().get_style()["font_size"],
-            bold=super().get_style()["font_bold"]
-        )
+        self.font = self.acquire_font()
 
     def set_h_centered(self, centered: bool):
         """
@@ -55,7 +52,9 @@ class Label(GUIElement):
         Args:
             centered (bool): If True, text will be horizontally centered at the label's X coordinate.
         """
+        self.invalidate()
         self.h_centered = centered
+        self.invalidate()
 
     def set_v_centered(self, centered: bool):
         """
@@ -64,7 +63,9 @@ class Label(GUIElement):
         Args:
             centered (bool): If True, text will be vertically centered at the label's Y coordinate.
         """
+        self.invalidate()
         self.v_centered = centered
+        self.invalidate()
 
     def set_text(self, text: str):
         """
@@ -73,7 +74,11 @@ class Label(GUIElement):
         Args:
             text (str): New label text.
         """
-        self.text = text
+        if self.text != text:
+            self.invalidate()
+            self.text = text
+            self.invalidate_measure()
+            self.invalidate()
 
     def get_text(self) -> str:
         """
@@ -84,6 +89,39 @@ class Label(GUIElement):
         """
         return self.text
 
+    @overrides(GUIElement)
+    def measure(self) -> tuple:
+        """
+        Compute the intrinsic size: the size of the rendered text.
+
+        Returns:
+            tuple: Width and height in pixels.
+        """
+        font = getattr(self, "font", None)
+        if font is None or len(self.text) == 0:
+            return (0, 0)
+        return text_size(font, self.text)
+
+    @overrides(GUIElement)
+    def get_paint_rect(self) -> pygame.Rect:
+        """
+        Get the area covered by the label text (labels have no size of their own).
+
+        Returns:
+            pygame.Rect: The rectangle covering the rendered text.
+        """
+        font = getattr(self, "font", None)
+        if font is None or len(self.text) == 0:
+            return super().get_view_rect()
+        width, height = text_size(font, self.text)
+        x = super().get_x()
+        if self.h_centered:
+            x -= width / 2
+        y = super().get_y()
+        if self.v_centered:
+            y -= height / 2
+        return pygame.Rect(int(x), int(y), width + 1, height + 1)
+
     @overrides(GUIElement)
     def draw(self, view, screen):
         """
@@ -93,15 +131,16 @@ class Label(GUIElement):
             view: The parent View instance.
             screen (pygame.Surface): The surface to render the label onto.
         """
+        style = self.get_style_record()
         if len(self.text) != 0:
-            text_surface = self.font.render(self.text, True, super().get_style()["foreground_color"])
+            text_width, text_height = text_size(self.font, self.text)
             x = super().get_x()
             if self.h_centered:
-                x -= text_surface.get_width() / 2
+                x -= text_width / 2
             y = super().get_y()
             if self.v_centered:
-                y -= text_surface.get_height() / 2
-            screen.blit(text_surface, (x, y))
+                y -= text_height / 2
+            draw_text(screen, self.font, self.text, True, style.foreground_color, (x, y))
 
     @overrides(GUIElement)
     def process_event(self, view, event):
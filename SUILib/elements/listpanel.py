@@ -7,6 +7,7 @@ import pygame
 from ..utils import *
 from ..colors import *
 from ..guielement import *
+from ..textcache import draw_text, text_size
 from ..application import *
 
 
@@ -48,6 +49,7 @@ class ListPanel(GUIElement, Container):
         self.v_scroll = VerticalScrollbar(
             view, super().get_style()["scrollbar"], super().get_style()["scrollbar_width"])
         self.v_scroll.set_on_scroll_evt(self.scroll_vertical)
+        self.v_scroll.parent = self
         self.layoutmanager = None
         self.callback = None
         self.refresh_list()
@@ -79,6 +81,7 @@ class ListPanel(GUIElement, Container):
         total_body_data_height = 10 + (self.font.get_height() + 10) * len(self.data)
         h = super().get_height()
         self.body_offset_y = -max(0, (total_body_data_height - h)) * position
+        self.invalidate()
 
     def refresh_list(self, new_data: list = None):
         """
@@ -90,12 +93,9 @@ class ListPanel(GUIElement, Container):
         """
         if new_data is not None:
             self.data = new_data
+        self.invalidate()
 
-        self.font = pygame.font.SysFont(
-            super().get_style()["font_name"],
-            super().get_style()["font_size"],
-            bold=super().get_style()["font_bold"]
-        )
+        self.font = self.acquire_font()
         self.height = 10 + (self.font.get_height() + 10) * min(5, len(self.data))
 
         if self.v_scroll is not None:
@@ -119,25 +119,29 @@ class ListPanel(GUIElement, Container):
             view: The parent View instance.
             screen (pygame.Surface): The surface to render the panel onto.
         """
+        style = self.get_style_record()
         # Draw background
-        pygame.draw.rect(screen, super().get_style()["background_color"], super().get_view_rect(), border_radius=5)
+        pygame.draw.rect(screen, style.background_color, super().get_view_rect(), border_radius=5)
 
         # Draw list items
         if len(self.data) != 0:
-            screen.set_clip(super().get_view_rect())
+            prev_clip = screen.get_clip()
+            screen.set_clip(super().get_view_rect().clip(prev_clip))
             offset = super().get_y() + 10 + self.body_offset_y
             for line in self.data:
-                text = self.font.render(
-                    line, 1, super().get_style()["foreground_color"])
-                screen.blit(text, (super().get_x() + 10, offset))
-                offset += text.get_height() + 10
-            screen.set_clip(None)
+                draw_text(
+                    screen,
+                    self.font,
+                    line, 1, style.foreground_color,
+                    (super().get_x() + 10, offset))
+                offset += text_size(self.font, line)[1] + 10
+            screen.set_clip(prev_clip)
 
         # Draw vertical scrollbar
         self.v_scroll.draw(view, screen)
 
         # Draw outline
-        pygame.draw.rect(screen, super().get_style()["outline_color"], super().get_view_rect(), 2, border_radius=5)
+        pygame.draw.rect(screen, style.outline_color, super().get_view_rect(), 2, border_radius=5)
 
     @overrides(GUIElement)
     def process_event(self, view, event):
@@ -163,7 +167,7 @@ class ListPanel(GUIElement, Container):
                             self.font.get_height()
                         )):
                     if self.callback is not None:
-                        self.callback(line)
+                        self.call_callback(self.callback, line)
                 offset += self.font.get_height() + 10
 
     @overrides(GUIElement)
@@ -47,6 +47,21 @@ class Panel(GUIElement, Layout, Container):
         """
         self.layoutmanager = layoutmanager
         self.get_view().unregister_layout_manager(self.layoutmanager)
+        self.invalidate_layout()
+
+    @overrides(Layout)
+    def add_element(self, element: GUIElement, propt=None):
+        """
+        Add a child element to the panel.
+
+        Args:
+            element (GUIElement): The GUI element to add.
+            propt (any, optional): Property of the element for the panel's layout manager.
+        """
+        if isinstance(element, GUIElement):
+            element.parent = self
+        super().add_element(element, propt)
+        self.invalidate()
 
     @overrides(GUIElement)
     def draw(self, view, screen):
@@ -57,12 +72,14 @@ class Panel(GUIElement, Layout, Container):
             view: The parent View instance.
             screen (pygame.Surface): The surface to render the panel onto.
         """
+        style = self.get_style_record()
         # Draw background
-        pygame.draw.rect(screen, super().get_style()["background_color"], super().get_view_rect(), border_radius=5)
+        pygame.draw.rect(screen, style.background_color, super().get_view_rect(), border_radius=5)
 
         # Draw child elements within panel area
         if len(self.get_layout_elements()) != 0:
-            panel_screen = screen.subsurface(
+            panel_screen = clipped_subsurface(
+                screen,
                 pygame.Rect(
                     super().get_x() + 5,
                     super().get_y() + 5,
@@ -71,10 +88,10 @@ class Panel(GUIElement, Layout, Container):
                 )
             )
             for el in self.get_layout_elements():
-                el["element"].draw(view, panel_screen)
+                el["element"].draw_cached(view, panel_screen)
 
         # Draw outline
-        pygame.draw.rect(screen, super().get_style()["outline_color"], super().get_view_rect(), 2, border_radius=5)
+        pygame.draw.rect(screen, style.outline_color, super().get_view_rect(), 2, border_radius=5)
 
     @overrides(GUIElement)
     def process_event(self, view, event):
@@ -117,6 +134,45 @@ class Panel(GUIElement, Layout, Container):
         for el in self.get_layout_elements():
             el["element"].update(view)
 
+    @overrides(GUIElement)
+    def size_changed(self):
+        """
+        Mark the layout of the panel dirty when the panel is resized.
+        """
+        self.invalidate_layout()
+
+    @overrides(Layout)
+    def element_measure_changed(self, element) -> bool:
+        """
+        Forward the change of an intrinsic size to the layout manager of the panel.
+
+        Args:
+            element (GUIElement): Element whose intrinsic size changed.
+
+        Returns:
+            bool: True if the layout of the panel was invalidated.
+        """
+        if self.layoutmanager is None or not self.layoutmanager.element_measure_changed(element):
+            return False
+        self.invalidate_layout()
+        return True
+
+    @overrides(Layout)
+    def needs_layout(self, width, height) -> bool:
+        """
+        Check whether the child elements must be laid out again. The panel lays out
+        its children in its own area, so only its dirty flag matters (it is set when
+        children are added or the panel is resized), not the size of the view.
+
+        Args:
+            width (int): Width of the view/screen.
+            height (int): Height of the view/screen.
+
+        Returns:
+            bool: True if the layout of the panel is dirty.
+        """
+        return self._layout_dirty
+
     @overrides(Layout)
     def update_layout(self, width, height):
         """
@@ -38,8 +38,11 @@ class RadioButton(GUIElement):
             x (int, optional): X coordinate of the radio button. Defaults to 0.
             y (int, optional): Y coordinate of the radio button. Defaults to 0.
         """
+        self.label = None
         super().__init__(view, x, y, size, size, style)
         self.label = Label(view, super().get_style()["label"], text, False, True, x, y)
+        self.label.parent = self
+        self.update_view_rect()
         self.group = group
         group.add_radio_button(self)
         self.checked = False
@@ -81,7 +84,9 @@ class RadioButton(GUIElement):
         Args:
             checked (bool): True if the radio button should be checked, False otherwise.
         """
-        self.checked = checked
+        if self.checked != checked:
+            self.checked = checked
+            self.invalidate()
 
     def is_checked(self) -> bool:
         """
@@ -92,6 +97,28 @@ class RadioButton(GUIElement):
         """
         return self.checked
 
+    @overrides(GUIElement)
+    def update_view_rect(self):
+        """
+        Update the view rectangle of the radio button and move its label next to it.
+        """
+        super().update_view_rect()
+        if self.label is not None:
+            self.label.set_x(super().get_x() + super().get_width() + 5)
+            self.label.set_y(super().get_y() + super().get_height() / 2)
+
+    @overrides(GUIElement)
+    def get_paint_rect(self) -> pygame.Rect:
+        """
+        Get the area covered by the radio button together with its label.
+
+        Returns:
+            pygame.Rect: The rectangle covering the radio button and its label.
+        """
+        if self.label is None:
+            return super().get_view_rect()
+        return super().get_view_rect().union(self.label.get_paint_rect())
+
     @overrides(GUIElement)
     def draw(self, view, screen):
         """
@@ -101,10 +128,9 @@ class RadioButton(GUIElement):
             view: The parent View instance.
             screen (pygame.Surface): The surface to render the radio button onto.
         """
+        style = self.get_style_record()
         # Draw label
         if self.label is not None:
-            self.label.set_x(super().get_x() + super().get_width() + 5)
-            self.label.set_y(super().get_y() + super().get_height() / 2)
             self.label.draw(view, screen)
         # Draw radio button circle
         center = (
@@ -112,14 +138,13 @@ class RadioButton(GUIElement):
             super().get_y() + super().get_width() / 2
         )
         if super().is_selected():
-            c = super().get_style()["background_color"]
-            pygame.draw.circle(screen, color_change(c, -0.2 if c[0] > 128 else 0.6), center, super().get_width() / 2)
+            pygame.draw.circle(screen, style.background_color_hover, center, super().get_width() / 2)
         else:
-            pygame.draw.circle(screen, super().get_style()["background_color"], center, super().get_width() / 2)
-        pygame.draw.circle(screen, super().get_style()["outline_color"], center, super().get_width() / 2, 2)
+            pygame.draw.circle(screen, style.background_color, center, super().get_width() / 2)
+        pygame.draw.circle(screen, style.outline_color, center, super().get_width() / 2, 2)
         # Draw check indicator if checked
         if self.checked:
-            pygame.draw.circle(screen, super().get_style()["foreground_color"], center, super().get_width() / 4)
+            pygame.draw.circle(screen, style.foreground_color, center, super().get_width() / 4)
 
     @overrides(GUIElement)
     def process_event(self, view, event):
@@ -133,7 +158,7 @@ class RadioButton(GUIElement):
         if event.type == pygame.MOUSEBUTTONDOWN:
             if in_rect(event.pos[0], event.pos[1], super().get_view_rect()):
                 if self.callback is not None:
-                    self.callback(self)
+                    self.call_callback(self.callback, self)
                 self.group.check_radio_button(self)
         elif event.type == pygame.MOUSEMOTION:
             if in_rect(event.pos[0], event.pos[1], super().get_view_rect()):
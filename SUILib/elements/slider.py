@@ -46,6 +46,7 @@ class Slider(GUIElement):
         self.label = None
         super().__init__(view, x, y, width, height, style, pygame.SYSTEM_CURSOR_SIZEWE)
         self.label = Label(view, super().get_style()["label"], " ", False, True)
+        self.label.parent = self
         self.callback = None
         self.format = "@"
         self.min = min
@@ -117,6 +118,7 @@ class Slider(GUIElement):
         # set position
         self.position = dot_radius + value / 100.0 * \
             (super().get_width() - dot_radius * 2)
+        self.invalidate()
 
     def set_number(self, value: int):
         """
@@ -159,22 +161,26 @@ class Slider(GUIElement):
             self.label.set_y(super().get_y() + super().get_height() / 2)
 
     @overrides(GUIElement)
-    def set_width(self, width):
+    def size_changed(self):
         """
-        Set the width of the slider and update the handle position and label.
+        Update the handle position and label when the size of the slider changes.
         """
-        super().set_width(width)
         self.set_value(None)
         self.refresh_label()
 
     @overrides(GUIElement)
-    def set_height(self, height):
+    def get_paint_rect(self) -> pygame.Rect:
         """
-        Set the height of the slider and update the handle position and label.
+        Get the area covered by the slider, its handle and its value label.
+
+        Returns:
+            pygame.Rect: The rectangle covering everything drawn by the slider.
         """
-        super().set_height(height)
-        self.set_value(None)
-        self.refresh_label()
+        radius = int(super().get_height() * 0.8) + 1
+        rect = super().get_view_rect().inflate(radius * 2, radius * 2)
+        if self.label is not None:
+            rect.union_ip(self.label.get_paint_rect())
+        return rect
 
     @overrides(GUIElement)
     def draw(self, view, screen):
@@ -185,13 +191,13 @@ class Slider(GUIElement):
             view: The parent View instance.
             screen (pygame.Surface): The surface to render the slider onto.
         """
+        style = self.get_style_record()
         # background
-        pygame.draw.rect(screen, super().get_style()[
-                         "background_color"], super().get_view_rect(), border_radius=10)
+        pygame.draw.rect(screen, style.background_color, super().get_view_rect(), border_radius=10)
         # slider bar
         pygame.draw.rect(
             screen,
-            color_change(super().get_style()["foreground_color"], 0.8),
+            style.foreground_color_pressed,
             pygame.Rect(
                 super().get_x(),
                 super().get_y(),
@@ -201,12 +207,11 @@ class Slider(GUIElement):
             border_radius=10
         )
         # outline
-        pygame.draw.rect(screen, super().get_style()[
-                         "outline_color"], super().get_view_rect(), 2, border_radius=10)
+        pygame.draw.rect(screen, style.outline_color, super().get_view_rect(), 2, border_radius=10)
         # slider
         pygame.draw.circle(
             screen,
-            super().get_style()["foreground_color"],
+            style.foreground_color,
             (super().get_x() + self.position,
              super().get_y() + super().get_height() / 2),
             super().get_height() * 0.8
@@ -242,9 +247,10 @@ class Slider(GUIElement):
                 dot_radius = super().get_height() / 2
                 self.position = min(
                     max(dot_radius, self.position), super().get_width() - dot_radius)
+                self.invalidate()
                 self.refresh_label()
                 if self.callback is not None:
-                    self.callback(self.get_number())
+                    self.call_callback(self.callback, self.get_number())
 
     @overrides(GUIElement)
     def update(self, view):
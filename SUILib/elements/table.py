@@ -6,6 +6,7 @@ import pygame
 from ..utils import *
 from ..colors import *
 from ..guielement import *
+from ..textcache import draw_text, text_size
 from SUILib.elements.vertical_scrollbar import VerticalScrollbar
 from SUILib.elements.horizontal_scrollbar import HorizontalScrollbar
 
@@ -44,6 +45,13 @@ class Table(GUIElement, Container):
             y (int, optional): Y coordinate of the table. Defaults to 0.
         """
         self.last_data = None
+        self.header_font = None
+        self.body_font = None
+        self.header = []
+        self.body = []
+        self._content_width = []
+        self._header_width = []
+        self._cell_widths = []
         self.body_offset_x = 0
         self.body_offset_y = 0
         super().__init__(view, x, y, width, height, style)
@@ -54,6 +62,7 @@ class Table(GUIElement, Container):
             super().get_style()["body"]["scrollbar_width"]
         )
         self.v_scroll.set_on_scroll_evt(self.table_scroll_vertical)
+        self.v_scroll.parent = self
         # horizontal scrollbar
         self.h_scroll = HorizontalScrollbar(
             view,
@@ -61,6 +70,7 @@ class Table(GUIElement, Container):
             super().get_style()["body"]["scrollbar_width"]
         )
         self.h_scroll.set_on_scroll_evt(self.table_scroll_horizontal)
+        self.h_scroll.parent = self
         # initialize table data
         self.refresh_table(data)
 
@@ -75,6 +85,7 @@ class Table(GUIElement, Container):
         total_body_data_height = header_height + self.body_font.get_height() * 1.4 * len(self.body)
         h = super().get_height() - super().get_style()["body"]["scrollbar_width"]
         self.body_offset_y = -max(0, (total_body_data_height - h)) * position
+        self.invalidate()
 
     def table_scroll_horizontal(self, position: float):
         """
@@ -86,43 +97,121 @@ class Table(GUIElement, Container):
         total_body_data_width = sum(self.col_width)
         w = super().get_width() - super().get_style()["body"]["scrollbar_width"]
         self.body_offset_x = -max(0, (total_body_data_width - w)) * position
+        self.invalidate()
 
     def refresh_table(self, data: dict = None):
         """
         Refresh or update the table data and recompute layout.
 
+        Cells are measured again only if new data is given or the fonts changed, otherwise
+        only the layout is updated. Use add_row(), set_row() and remove_row() for small changes.
+
         Args:
             data (dict, optional): Dictionary with table data: {"header": [...], "body": [[...], ...]}.
                 If None, uses the last data provided.
         """
+        remeasure = data is not None
         if data is None:
             data = self.last_data
         self.last_data = data
         if data is None:
             return
+        self.invalidate()
+
+        header_font = self.acquire_font(super().get_style()["header"], self.header_font)
+        body_font = self.acquire_font(super().get_style()["body"], self.body_font)
+        if header_font is not self.header_font or body_font is not self.body_font:
+            remeasure = True
+        self.header_font = header_font
+        self.body_font = body_font
+        if remeasure:
+            self.header = data["header"]
+            self.body = data["body"]
+            self.measure_columns()
+        self.update_columns()
+
+    def add_row(self, row: list):
+        """
+        Append a row to the table body.
 
-        self.header_font = pygame.font.SysFont(
-            super().get_style()["header"]["font_name"],
-            super().get_style()["header"]["font_size"],
-            bold=super().get_style()["header"]["font_bold"]
-        )
-        self.body_font = pygame.font.SysFont(
-            super().get_style()["body"]["font_name"],
-            super().get_style()["body"]["font_size"],
-            bold=super().get_style()["body"]["font_bold"]
-        )
-        self.header = data["header"]
-        self.body = data["body"]
+        Args:
+            row (list): Cell strings of the row.
+        """
+        self.body.append(row)
+        self._add_cell_widths(row)
+        self.update_columns()
 
-        scroll_size = super().get_style()["body"]["scrollbar_width"]
+    def set_row(self, index: int, row: list):
+        """
+        Replace a row of the table body.
 
-        # calculate max width for each col of table
-        self.col_width = [0] * len(self.header)
-        for row in self.body:
-            for i, cell in enumerate(row):
-                self.col_width[i] = max(self.body_font.size(cell)[0] + 10, self.col_width[i])
+        Args:
+            index (int): Index of the row.
+            row (list): New cell strings of the row.
+        """
+        self._remove_cell_widths(self.body[index])
+        self.body[index] = row
+        self._add_cell_widths(row)
+        self.update_columns()
+
+    def remove_row(self, index: int):
+        """
+        Remove a row from the table body.
+
+        Args:
+            index (int): Index of the row.
+        """
+        self._remove_cell_widths(self.body.pop(index))
+        self.update_columns()
+
+    def measure_columns(self):
+        """
+        Measure all cells and compute the content width of each column.
+        """
+        self._cell_widths = [{} for _ in self.header]
+        self._content_width = [0] * len(self.header)
         for i, cell in enumerate(self.header):
-            self.col_width[i] = max(self.header_font.size(cell)[0] + 10, self.col_width[i])
+            self._content_width[i] = text_size(self.header_font, cell)[0] + 10
+        self._header_width = list(self._content_width)
+        for row in self.body:
+            self._add_cell_widths(row)
+
+    def _add_cell_widths(self, row: list):
+        """
+        Internal: Count the widths of the cells of an added row.
+        """
+        for i, cell in enumerate(row):
+            width = text_size(self.body_font, cell)[0] + 10
+            counts = self._cell_widths[i]
+            counts[width] = counts.get(width, 0) + 1
+            if width > self._content_width[i]:
+                self._content_width[i] = width
+
+    def _remove_cell_widths(self, row: list):
+        """
+        Internal: Uncount the widths of the cells of a removed row.
+        """
+        for i, cell in enumerate(row):
+            width = text_size(self.body_font, cell)[0] + 10
+            counts = self._cell_widths[i]
+            counts[width] -= 1
+            if counts[width] == 0:
+                del counts[width]
+                if width == self._content_width[i]:
+                    # the widest cell was removed
+                    self._content_width[i] = max(max(counts, default=0), self._header_width[i])
+
+    def update_columns(self):
+        """
+        Update the column widths and scrollbars from the measured content widths (no cells are measured).
+        """
+        if self.header_font is None:
+            return
+        self.invalidate()
+        scroll_size = super().get_style()["body"]["scrollbar_width"]
+
+        # the columns are stretched if the content is narrower than the table
+        self.col_width = list(self._content_width)
         if sum(self.col_width) <= super().get_width() - scroll_size:
             for i in range(len(self.header)):
                 self.col_width[i] = super().get_width() / len(self.header)
@@ -165,19 +254,21 @@ class Table(GUIElement, Container):
             view: The parent View instance.
             screen (pygame.Surface): The surface to render the table onto.
         """
+        style = self.get_style_record()
         # set clip
+        prev_clip = screen.get_clip()
         screen.set_clip(
             pygame.Rect(
                 super().get_x(),
                 super().get_y(),
                 super().get_width() - 1,
                 super().get_height() - 1,
-            )
+            ).clip(prev_clip)
         )
 
         # size of table body + header
-        w = super().get_width() - super().get_style()["body"]["scrollbar_width"]
-        h = super().get_height() - super().get_style()["body"]["scrollbar_width"]
+        w = super().get_width() - style.body.scrollbar_width
+        h = super().get_height() - style.body.scrollbar_width
         rect = pygame.Rect(
             super().get_x(),
             super().get_y(),
@@ -187,44 +278,37 @@ class Table(GUIElement, Container):
         # draw table body background
         pygame.draw.rect(
             screen,
-            super().get_style()["body"]["background_color"],
+            style.body.background_color,
             rect
         )
         # draw col lines
+        x = super().get_x()
+        y = super().get_y()
+        line_color = style.body.background_color_shade
         offset = self.body_offset_x
         for i in range(len(self.header)):
-            pygame.draw.line(
-                screen,
-                color_change(super().get_style()["body"]["background_color"], -0.5),
-                (super().get_x() + offset, super().get_y()),
-                (super().get_x() + offset, super().get_y() + h - 4),
-                2
-            )
+            pygame.draw.line(screen, line_color, (x + offset, y), (x + offset, y + h - 4), 2)
             offset += self.col_width[i]
 
         # draw body data
+        body_font = self.body_font
+        body_color = style.body.foreground_color
+        col_width = self.col_width
+        header_offset = self.header_font.get_height() * 1.8
+        row_height = body_font.get_height() * 1.4
         for j, row in enumerate(self.body):
             offset = self.body_offset_x
+            row_y = y + header_offset + row_height * j + self.body_offset_y
             for i, cell in enumerate(row):
                 if len(cell) != 0:
-                    text = self.body_font.render(
-                        cell, 1, super().get_style()["body"]["foreground_color"])
-                    header_offset = self.header_font.get_height() * 1.8
-                    screen.blit(
-                        text,
-                        (
-                            super().get_x() + 5 + offset,
-                            super().get_y() + header_offset +
-                            self.body_font.get_height() * 1.4 * j + self.body_offset_y
-                        )
-                    )
-                    offset += self.col_width[i]
+                    draw_text(screen, body_font, cell, 1, body_color, (x + 5 + offset, row_y))
+                    offset += col_width[i]
 
         # draw table header
         if self.header is not None:
             pygame.draw.rect(
                 screen,
-                super().get_style()["header"]["background_color"],
+                style.header.background_color,
                 pygame.Rect(
                     super().get_x(),
                     super().get_y(),
@@ -235,10 +319,10 @@ class Table(GUIElement, Container):
             offset = self.body_offset_x
             for i, col in enumerate(self.header):
                 if len(col) != 0:
-                    text = self.header_font.render(
-                        col, 1, super().get_style()["header"]["foreground_color"])
-                    screen.blit(
-                        text,
+                    draw_text(
+                        screen,
+                        self.header_font,
+                        col, 1, style.header.foreground_color,
                         (
                             super().get_x() + 5 + offset,
                             super().get_y() + self.header_font.get_height() * 0.4
@@ -254,13 +338,13 @@ class Table(GUIElement, Container):
         # draw outline
         pygame.draw.rect(
             screen,
-            super().get_style()["header"]["background_color"],
+            style.header.background_color,
             rect,
             2
         )
 
         # reset clip
-        screen.set_clip(None)
+        screen.set_clip(prev_clip)
 
     @overrides(GUIElement)
     def process_event(self, view, event):
@@ -6,6 +6,7 @@ import pygame
 from ..utils import *
 from ..colors import *
 from ..guielement import *
+from ..textcache import draw_text, text_size
 from ..application import *
 
 
@@ -40,11 +41,7 @@ class TabPanel(GUIElement, Container):
         GUIElement.__init__(self, view, x, y, width, height, style)
         self.layoutmanager = None
         self.selected_tab = 0
-        self.font = pygame.font.SysFont(
-            super().get_style()["font_name"],
-            super().get_style()["font_size"],
-            bold=super().get_style()["font_bold"]
-        )
+        self.font = self.acquire_font()
         self.tabs = []
         for t in tabs:
             if isinstance(t, Tab):
@@ -70,6 +67,7 @@ class TabPanel(GUIElement, Container):
             index (int): The index of the tab to select.
         """
         self.selected_tab = index
+        self.invalidate()
 
     def add_tab(self, tab):
         """
@@ -80,7 +78,10 @@ class TabPanel(GUIElement, Container):
         """
         if isinstance(tab, Tab):
             self.tabs.append(tab)
+            if tab.get_content() is not None:
+                tab.get_content().parent = self
             self.update_tab_size(tab)
+            self.invalidate()
 
     def update_tab_size(self, tab):
         """
@@ -91,9 +92,7 @@ class TabPanel(GUIElement, Container):
         """
         content = tab.get_content()
         if content is not None:
-            tab_header_height = self.font.render(
-                "W", 1, super().get_style()["foreground_color"]
-            ).get_height() + 10
+            tab_header_height = text_size(self.font, "W")[1] + 10
             content.set_x(0)
             content.set_y(0)
             content.set_width(super().get_width())
@@ -109,16 +108,10 @@ class TabPanel(GUIElement, Container):
             tab (Tab): The Tab object to remove.
         """
         self.tabs.remove(tab)
+        self.invalidate()
 
     @overrides(GUIElement)
-    def set_width(self, width):
-        super().set_width(width)
-        for tab in self.tabs:
-            self.update_tab_size(tab)
-
-    @overrides(GUIElement)
-    def set_height(self, height):
-        super().set_height(height)
+    def size_changed(self):
         for tab in self.tabs:
             self.update_tab_size(tab)
 
@@ -127,24 +120,21 @@ class TabPanel(GUIElement, Container):
         if len(self.tabs) == 0:
             return
 
+        style = self.get_style_record()
         tab_header_height = 0
         selected_x = [0, 0]
         x_offset = 5 + super().get_x()
         # Draw tab headers
         for i, tab in enumerate(self.tabs):
             if len(tab.get_name()) != 0:
-                text = self.font.render(
-                    tab.get_name(),
-                    1,
-                    super().get_style()["foreground_color"]
-                )
-                tab_header_height = max(tab_header_height, text.get_height() + 10)
+                text_width, text_height = text_size(self.font, tab.get_name())
+                tab_header_height = max(tab_header_height, text_height + 10)
                 x1 = x_offset
-                x2 = x_offset + text.get_width() + 10
+                x2 = x_offset + text_width + 10
                 if i == self.selected_tab:
                     pygame.draw.rect(
                         screen,
-                        super().get_style()["background_color"],
+                        style.background_color,
                         pygame.Rect(
                             x1,
                             super().get_y(),
@@ -155,7 +145,7 @@ class TabPanel(GUIElement, Container):
                     selected_x = [x1 + 2, x2 - 1]
                 pygame.draw.lines(
                     screen,
-                    super().get_style()["outline_color"],
+                    style.outline_color,
                     False,
                     [
                         (x1, super().get_y() + tab_header_height),
@@ -165,11 +155,15 @@ class TabPanel(GUIElement, Container):
                     ],
                     2
                 )
-                screen.blit(
-                    text,
+                draw_text(
+                    screen,
+                    self.font,
+                    tab.get_name(),
+                    1,
+                    style.foreground_color,
                     (x_offset + 5, 5 + super().get_y())
                 )
-                x_offset += text.get_width() + 10
+                x_offset += text_width + 10
 
         rect = pygame.Rect(
             super().get_x(),
@@ -181,27 +175,27 @@ class TabPanel(GUIElement, Container):
         # Draw tab content background
         pygame.draw.rect(
             screen,
-            super().get_style()["background_color"],
+            style.background_color,
             rect,
             border_radius=5
         )
         pygame.draw.rect(
             screen,
-            super().get_style()["outline_color"],
+            style.outline_color,
             rect,
             2,
             border_radius=5
         )
         # Draw content of selected tab
         if self.selected_tab >= 0 and self.selected_tab < len(self.tabs):
-            tab_screen = screen.subsurface(rect)
+            tab_screen = clipped_subsurface(screen, rect)
             content = self.tabs[self.selected_tab].get_content()
             if content is not None:
-                content.draw(view, tab_screen)
+                content.draw_cached(view, tab_screen)
         # Draw line under selected tab header to blend it with background
         pygame.draw.line(
             screen,
-            super().get_style()["background_color"],
+            style.background_color,
             (selected_x[0], super().get_y() + tab_header_height),
             (selected_x[1], super().get_y() + tab_header_height),
             2
@@ -214,28 +208,22 @@ class TabPanel(GUIElement, Container):
             x_offset = 5 + super().get_x()
             for i, tab in enumerate(self.tabs):
                 if len(tab.get_name()) != 0:
-                    text = self.font.render(
-                        tab.get_name(),
-                        1,
-                        super().get_style()["foreground_color"]
-                    )
+                    text_width, text_height = text_size(self.font, tab.get_name())
                     x1 = x_offset
-                    x2 = x_offset + text.get_width() + 10
+                    x2 = x_offset + text_width + 10
                     rect = pygame.Rect(
                         x1,
                         super().get_y(),
                         x2 - x1,
-                        text.get_height() + 10
+                        text_height + 10
                     )
-                    x_offset += text.get_width() + 10
+                    x_offset += text_width + 10
                     if in_rect(event.pos[0], event.pos[1], rect):
-                        self.selected_tab = i
+                        self.set_selected_tab(i)
                         break
 
         # Offset event for content (so children receive proper local coords)
-        tab_header_height = self.font.render(
-            "W", 1, super().get_style()["foreground_color"]
-        ).get_height() + 10
+        tab_header_height = text_size(self.font, "W")[1] + 10
         if event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONUP, pygame.MOUSEBUTTONDOWN):
             event.pos = (
                 event.pos[0] - super().get_x(),
@@ -8,6 +8,7 @@ import string
 from ..utils import *
 from ..colors import *
 from ..guielement import *
+from ..textcache import draw_text, text_size
 
 
 class TextInput(GUIElement):
@@ -25,6 +26,9 @@ class TextInput(GUIElement):
         font (pygame.font.Font): Font object used for rendering the text.
     """
 
+    # the caret blinks while the input is selected
+    RENDER_CACHEABLE = False
+
     def __init__(self, view, style: dict, text: str, width: int = 0, height: int = 0, x: int = 0, y: int = 0):
         """
         Initialize a new TextInput element.
@@ -44,11 +48,7 @@ class TextInput(GUIElement):
         self.filter_pattern = None
         self.text = text
         self.caret_position = len(text)
-        self.font = pygame.font.SysFont(
-            super().get_style()["font_name"],
-            super().get_style()["font_size"],
-            bold=super().get_style()["font_bold"]
-        )
+        self.font = self.acquire_font()
 
     def set_text(self, text: str):
         """
@@ -59,6 +59,7 @@ class TextInput(GUIElement):
         """
         self.text = text
         self.caret_position = len(text)
+        self.invalidate()
 
     def get_text(self):
         """
@@ -96,43 +97,43 @@ class TextInput(GUIElement):
             view: The parent View instance.
             screen (pygame.Surface): The surface to render the input onto.
         """
+        style = self.get_style_record()
         # background
         if super().is_selected():
-            c = super().get_style()["background_color"]
-            pygame.draw.rect(screen, color_change(
-                c, 0.4 if c[0] > 128 else 0.7), super().get_view_rect(), border_radius=5)
+            pygame.draw.rect(screen, style.background_color_focus, super().get_view_rect(), border_radius=5)
         else:
-            pygame.draw.rect(screen, super().get_style()["background_color"], super().get_view_rect(), border_radius=5)
+            pygame.draw.rect(screen, style.background_color, super().get_view_rect(), border_radius=5)
 
         # create subsurface for text (clipping)
-        surface = screen.subsurface(super().get_view_rect())
+        surface = clipped_subsurface(screen, super().get_view_rect())
         text_offset = 0
         caret_offset = 0
         if len(self.text) != 0:
-            text_surface = self.font.render(
-                self.text,
-                1,
-                super().get_style()["foreground_color"]
-            )
+            text_height = text_size(self.font, self.text)[1]
             # calculate caret offset
-            caret_offset = self.font.size(self.text[0: self.caret_position])[0]
+            caret_offset = text_size(self.font, self.text[:self.caret_position])[0]
             # offset for text
             text_offset = max(caret_offset + 20 - super().get_width(), 0)
             if not super().is_selected():
                 text_offset = 0
             # draw text
-            surface.blit(
-                text_surface, (5 - text_offset, (super().get_height() - text_surface.get_height()) / 2)
+            draw_text(
+                surface,
+                self.font,
+                self.text,
+                1,
+                style.foreground_color,
+                (5 - text_offset, (super().get_height() - text_height) / 2)
             )
 
         # caret
         if super().is_selected() and generate_signal(400):
             x = 5 - text_offset + caret_offset
             y = surface.get_height() * 0.2
-            pygame.draw.line(surface, super().get_style()["foreground_color"], (x, y), (x, surface.get_height() - y), 2)
+            pygame.draw.line(surface, style.foreground_color, (x, y), (x, surface.get_height() - y), 2)
 
         # outline
-        pygame.draw.rect(screen, super().get_style()["outline_color"], super().get_view_rect(), 2, border_radius=5)
+        pygame.draw.rect(screen, style.outline_color, super().get_view_rect(), 2, border_radius=5)
 
     @overrides(GUIElement)
     def process_event(self, view, event):
@@ -146,12 +147,15 @@ class TextInput(GUIElement):
         if event.type == pygame.MOUSEBUTTONDOWN:
             if in_rect(event.pos[0], event.pos[1], super().get_view_rect()):
                 super().select()
+                super().focus()
                 # Move caret to end on focus
                 self.caret_position = len(self.text)
+                self.invalidate()
             else:
                 self.unselect_ti()
         elif event.type == pygame.KEYDOWN:
             if super().is_selected():
+                self.invalidate()
                 if event.key == pygame.K_RETURN:
                     self.unselect_ti()
                 elif event.key == pygame.K_BACKSPACE:
@@ -179,7 +183,9 @@ class TextInput(GUIElement):
         Args:
             view: The parent View instance.
         """
-        pass
+        # keep the blinking caret repainted
+        if super().is_selected():
+            self.invalidate()
 
     def unselect_ti(self):
         """
@@ -192,5 +198,6 @@ class TextInput(GUIElement):
                     # clear text if invalid
                     self.text = ""
             if self.callback is not None:
-                self.callback(self.text)
-        super().un_select()
\ No newline at end of file
+                self.call_callback(self.callback, self.text)
+        super().un_select()
+        super().un_focus()
\ No newline at end of file
@@ -37,8 +37,11 @@ class ToggleButton(GUIElement):
             x (int, optional): X coordinate of the toggle. Defaults to 0.
             y (int, optional): Y coordinate of the toggle. Defaults to 0.
         """
+        self.label = None
         super().__init__(view, x, y, width, height, style)
         self.label = Label(view, super().get_style()["label"], text, False, True)
+        self.label.parent = self
+        self.update_view_rect()
         self.callback = None
         self.hover = False
         self.status = status
@@ -80,6 +83,28 @@ class ToggleButton(GUIElement):
         """
         self.callback = callback
 
+    @overrides(GUIElement)
+    def update_view_rect(self):
+        """
+        Update the view rectangle of the toggle button and move its label next to it.
+        """
+        super().update_view_rect()
+        if self.label is not None:
+            self.label.set_x(super().get_x() + super().get_width() + 5)
+            self.label.set_y(super().get_y() + super().get_height() / 2)
+
+    @overrides(GUIElement)
+    def get_paint_rect(self) -> pygame.Rect:
+        """
+        Get the area covered by the toggle together with its label.
+
+        Returns:
+            pygame.Rect: The rectangle covering the toggle and its label.
+        """
+        if self.label is None:
+            return super().get_view_rect()
+        return super().get_view_rect().union(self.label.get_paint_rect())
+
     @overrides(GUIElement)
     def draw(self, view, screen):
         """
@@ -89,11 +114,12 @@ class ToggleButton(GUIElement):
             view: The parent View instance.
             screen (pygame.Surface): The surface to render the toggle onto.
         """
+        style = self.get_style_record()
         # Background and outline
         if self.status:
-            bg_color = color_change(super().get_style()["foreground_color"], 0.8)
+            bg_color = style.foreground_color_pressed
         else:
-            bg_color = super().get_style()["background_color"]
+            bg_color = style.background_color
         pygame.draw.rect(
             screen,
             bg_color,
@@ -102,7 +128,7 @@ class ToggleButton(GUIElement):
         )
         pygame.draw.rect(
             screen,
-            super().get_style()["outline_color"],
+            style.outline_color,
             super().get_view_rect(),
             2,
             border_radius=int(super().get_height() / 2)
@@ -112,21 +138,19 @@ class ToggleButton(GUIElement):
             pos = super().get_width() - super().get_height() / 2
             pygame.draw.circle(
                 screen,
-                super().get_style()["foreground_color"],
+                style.foreground_color,
                 (super().get_x() + pos, super().get_y() + super().get_height() / 2),
                 super().get_height() / 2
             )
         else:
             pygame.draw.circle(
                 screen,
-                super().get_style()["foreground_color"],
+                style.foreground_color,
                 (super().get_x() + super().get_height() / 2, super().get_y() + super().get_height() / 2),
                 super().get_height() / 2
             )
         # Label
         if self.label is not None:
-            self.label.set_x(super().get_x() + super().get_width() + 5)
-            self.label.set_y(super().get_y() + super().get_height() / 2)
             self.label.draw(view, screen)
 
     @overrides(GUIElement)
@@ -141,8 +165,9 @@ class ToggleButton(GUIElement):
         if event.type == pygame.MOUSEBUTTONDOWN:
             if in_rect(event.pos[0], event.pos[1], super().get_view_rect()):
                 self.status = not self.status
+                self.invalidate()
                 if self.callback is not None:
-                    self.callback(self.status)
+                    self.call_callback(self.callback, self.status)
         elif event.type == pygame.MOUSEMOTION:
             if in_rect(event.pos[0], event.pos[1], super().get_view_rect()):
                 self.select()
@@ -49,6 +49,7 @@ class VerticalScrollbar(GUIElement):
             size (int): New height of the scroller handle in pixels.
         """
         self.scroller_size = max(size, super().get_width())
+        self.invalidate()
 
     def set_on_scroll_evt(self, callback):
         """
@@ -68,12 +69,13 @@ class VerticalScrollbar(GUIElement):
             view: The parent View instance.
             screen (pygame.Surface): The surface to render the scrollbar onto.
         """
+        style = self.get_style_record()
         # Background
-        pygame.draw.rect(screen, super().get_style()["background_color"], super().get_view_rect())
+        pygame.draw.rect(screen, style.background_color, super().get_view_rect())
         # Scroller handle
         pygame.draw.rect(
             screen,
-            super().get_style()["foreground_color"],
+            style.foreground_color,
             pygame.Rect(
                 super().get_x(),
                 super().get_y() + self.scroller_pos,
@@ -83,7 +85,7 @@ class VerticalScrollbar(GUIElement):
             border_radius=6
         )
         # Outline
-        pygame.draw.rect(screen, super().get_style()["outline_color"], super().get_view_rect(), 2)
+        pygame.draw.rect(screen, style.outline_color, super().get_view_rect(), 2)
 
     @overrides(GUIElement)
     def process_event(self, view, event):
@@ -105,11 +107,12 @@ class VerticalScrollbar(GUIElement):
             super().un_select()
         elif event.type == pygame.MOUSEMOTION:
             if super().is_selected():
+                self.invalidate()
                 self.scroller_pos = self.def_scroller_pos + (event.pos[1] - self.drag_start)
                 self.scroller_pos = min(
                     max(0, self.scroller_pos), super().get_height() - self.scroller_size)
                 if self.callback is not None:
-                    self.callback(self.scroller_pos / (super().get_height() - self.scroller_size))
+                    self.call_callback(self.callback, self.scroller_pos / (super().get_height() - self.scroller_size))
 
     @overrides(GUIElement)
     def update(self, view):
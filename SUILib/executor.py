@@ -0,0 +1,178 @@
+"""
+Background task execution for SUILib applications
+
+This module provides the TaskExecutor class, a bounded thread pool (and an
+optional process pool) for work which must not block the main loop. Tasks
+return futures; their completion callbacks are not called from the worker
+threads but are delivered back to the main loop with TASK_DONE_EVENT and
+run on the UI thread, where it is safe to modify GUI elements.
+"""
+
+import threading
+import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import pygame
+
+# Event posted to the main loop when a background task finishes
+TASK_DONE_EVENT = pygame.USEREVENT + 2
+
+
+class TaskExecutor:
+    """
+    Runs tasks in worker threads or processes and delivers their results to the UI thread.
+
+    Pools are created lazily on the first submitted task and recreated after shutdown().
+
+    Attributes:
+        max_threads (int): Maximum number of worker threads.
+        max_processes (int): Maximum number of worker processes (None = number of CPUs).
+    """
+
+    def __init__(self, max_threads: int = 4, max_processes: int = None):
+        """
+        Initialize the executor without starting any workers.
+
+        Args:
+            max_threads (int): Maximum number of worker threads.
+            max_processes (int, optional): Maximum number of worker processes.
+        """
+        self.max_threads = max(int(max_threads), 1)
+        self.max_processes = max_processes
+        self._thread_pool = None
+        self._process_pool = None
+        self._completed = deque()
+        # callbacks and pending futures are shared with the worker threads, guarded by _lock
+        self._callbacks = {}
+        self._futures = set()
+        self._lock = threading.Lock()
+
+    def submit(self, task, *args, callback=None, error_callback=None, process: bool = False, **kwargs):
+        """
+        Submit a task for background execution.
+
+        Args:
+            task (callable): Function to run. Tasks run in a process must be picklable.
+            *args: Positional arguments for the task.
+            callback (callable, optional): Called on the UI thread with the result of the task.
+            error_callback (callable, optional): Called on the UI thread with the exception
+                raised by the task.
+            process (bool): If True, the task runs in the process pool instead of a thread.
+            **kwargs: Keyword arguments for the task.
+
+        Returns:
+            concurrent.futures.Future: Future of the task (can be used to cancel it).
+        """
+        with self._lock:
+            if process:
+                if self._process_pool is None:
+                    self._process_pool = ProcessPoolExecutor(max_workers=self.max_processes)
+                pool = self._process_pool
+            else:
+                if self._thread_pool is None:
+                    self._thread_pool = ThreadPoolExecutor(
+                        max_workers=self.max_threads, thread_name_prefix="SUILib-worker")
+                pool = self._thread_pool
+        future = pool.submit(task, *args, **kwargs)
+        with_callbacks = callback is not None or error_callback is not None
+        with self._lock:
+            self._futures.add(future)
+            if with_callbacks:
+                self._callbacks[future] = (callback, error_callback)
+        future.add_done_callback(self._forget)
+        if with_callbacks:
+            future.add_done_callback(self._task_done)
+        return future
+
+    def _forget(self, future):
+        """
+        Internal: Called when a task finishes or is cancelled, drops it from the pending tasks.
+        """
+        with self._lock:
+            self._futures.discard(future)
+
+    def _task_done(self, future):
+        """
+        Internal: Called in the worker thread when a task with callbacks finishes.
+        """
+        self._completed.append(future)
+        if pygame.display.get_init():
+            try:
+                # wake up the main loop, the callbacks are run by dispatch_completed()
+                pygame.event.post(pygame.event.Event(TASK_DONE_EVENT))
+            except pygame.error:
+                pass
+
+    def dispatch_completed(self) -> int:
+        """
+        Run the callbacks of finished tasks. Must be called from the UI thread.
+
+        Returns:
+            int: Number of finished tasks whose callbacks were run.
+        """
+        count = 0
+        while len(self._completed) != 0:
+            future = self._completed.popleft()
+            with self._lock:
+                callback, error_callback = self._callbacks.pop(future, (None, None))
+            count += 1
+            if future.cancelled():
+                continue
+            error = future.exception()
+            if error is not None:
+                if error_callback is not None:
+                    error_callback(error)
+                else:
+                    # report like an exception of a plain thread, the loop keeps running
+                    traceback.print_exception(type(error), error, error.__traceback__)
+            elif callback is not None:
+                callback(future.result())
+        return count
+
+    def has_pending(self) -> bool:
+        """
+        Check whether there are submitted tasks with callbacks which were not dispatched yet.
+
+        Returns:
+            bool: True if some callbacks are still waiting.
+        """
+        with self._lock:
+            return len(self._callbacks) != 0
+
+    def shutdown(self, wait: bool = False):
+        """
+        Stop the worker pools and cancel tasks which did not start yet.
+
+        Args:
+            wait (bool): If True, block until the running tasks finish.
+        """
+        with self._lock:
+            pools = (self._thread_pool, self._process_pool)
+            self._thread_pool = None
+            self._process_pool = None
+            futures = list(self._futures)
+            self._callbacks = {}
+        # cancelled here instead of shutdown(cancel_futures=True), which needs Python 3.9
+        for future in futures:
+            future.cancel()
+        for pool in pools:
+            if pool is not None:
+                pool.shutdown(wait=wait)
+        self._completed.clear()
+
+
+_shared_executor = None
+
+
+def get_shared_executor() -> TaskExecutor:
+    """
+    Get the executor shared by utils.run_task_async() calls. It is never shut down by
+    an Application (every application has its own TaskExecutor).
+
+    Returns:
+        TaskExecutor: The shared executor.
+    """
+    global _shared_executor
+    if _shared_executor is None:
+        _shared_executor = TaskExecutor()
+    return _shared_executor
@@ -0,0 +1,157 @@
+"""
+Focus and pointer capture tracking for SUILib views
+
+This module provides the FocusManager class. Every View owns one; GUI elements
+report changes of their selected and focused state to it, so the view knows the
+focused, hovered and capturing elements without searching the element tree.
+"""
+
+
+class FocusManager:
+    """
+    Tracks selected (hovered or dragged), focused and hovered GUI elements of a view.
+
+    Attributes:
+        selected (list): Selected elements, the most recently selected one is last.
+        focused (GUIElement): Element with the keyboard focus (None if no element is focused).
+        hovered (GUIElement): Top-level element under the mouse cursor (None if there is none).
+    """
+
+    def __init__(self):
+        """
+        Initialize a focus manager without any tracked elements.
+        """
+        self.selected = []
+        self.focused = None
+        self.hovered = None
+
+    def clear(self):
+        """
+        Unselect and unfocus all tracked elements.
+        """
+        for el in list(self.selected):
+            el.un_select()
+        if self.focused is not None:
+            self.focused.un_focus()
+        self.selected = []
+        self.focused = None
+        self.hovered = None
+
+    def element_selected(self, element):
+        """
+        Internal: Called by GUIElement.select().
+
+        Args:
+            element (GUIElement): The selected element.
+        """
+        if element in self.selected:
+            self.selected.remove(element)
+        self.selected.append(element)
+
+    def element_unselected(self, element):
+        """
+        Internal: Called by GUIElement.un_select().
+
+        Args:
+            element (GUIElement): The unselected element.
+        """
+        if element in self.selected:
+            self.selected.remove(element)
+
+    def element_focused(self, element):
+        """
+        Internal: Called by GUIElement.focus().
+
+        Args:
+            element (GUIElement): The focused element.
+        """
+        self.focused = element
+
+    def element_unfocused(self, element):
+        """
+        Internal: Called by GUIElement.un_focus().
+
+        Args:
+            element (GUIElement): The unfocused element.
+        """
+        if self.focused is element:
+            self.focused = None
+
+    def element_removed(self, element):
+        """
+        Forget a removed top-level element and all its children.
+
+        Args:
+            element (GUIElement): The removed element.
+        """
+        self.selected = [el for el in self.selected if get_root_element(el) is not element]
+        if self.focused is not None and get_root_element(self.focused) is element:
+            self.focused = None
+        if self.hovered is element:
+            self.hovered = None
+
+    def set_hovered(self, element):
+        """
+        Set the top-level element under the mouse cursor.
+
+        Args:
+            element (GUIElement): The hovered element or None.
+        """
+        self.hovered = element
+
+    def get_focused_root(self):
+        """
+        Get the top-level element containing the focused element.
+
+        Returns:
+            GUIElement: The top-level element, or None if no element is focused.
+        """
+        if self.focused is None:
+            return None
+        return get_root_element(self.focused)
+
+    def has_capture(self, element) -> bool:
+        """
+        Check whether a top-level element (or one of its children) is selected or focused.
+
+        Args:
+            element (GUIElement): Top-level element.
+
+        Returns:
+            bool: True if the element captures the mouse.
+        """
+        if self.focused is not None and get_root_element(self.focused) is element:
+            return True
+        for el in self.selected:
+            if get_root_element(el) is element:
+                return True
+        return False
+
+    def get_cursor(self, default):
+        """
+        Get the mouse cursor of the most recently selected element.
+
+        Args:
+            default: Cursor used when no element is selected.
+
+        Returns:
+            int: Pygame cursor type constant.
+        """
+        if len(self.selected) == 0:
+            return default
+        return self.selected[-1].get_focused_cursor()
+
+
+def get_root_element(element):
+    """
+    Get the top-level element (placed directly in the view) which draws an element.
+
+    Args:
+        element (GUIElement): The element.
+
+    Returns:
+        GUIElement: The element itself or its outermost parent.
+    """
+    while element.parent is not None:
+        element = element.parent
+    return element
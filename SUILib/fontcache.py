@@ -0,0 +1,184 @@
+"""
+Persistent font discovery cache for SUILib
+
+pygame.font.SysFont() enumerates the installed fonts on its first call (with
+fc-list on Linux), which is a noticeable part of the application startup.
+This module stores the resulting font-name-to-file map on disk and fills the
+pygame.sysfont tables from it on later runs, so fonts are loaded directly by
+path. The cache is keyed by the state of the fontconfig caches and the font
+directories and is rebuilt when any of them changes.
+"""
+
+import os
+import sys
+import json
+import shutil
+import pygame
+import pygame.sysfont
+
+# Format version of the cache file
+CACHE_VERSION = 1
+
+
+def get_default_cache_path() -> str:
+    """
+    Get the default location of the font cache file.
+
+    Returns:
+        str: Path of the cache file (in XDG_CACHE_HOME, or ~/.cache).
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "SUILib", "fonts.json")
+
+
+def get_font_dirs() -> list:
+    """
+    Get the directories whose modification invalidates the font cache.
+
+    Returns:
+        list: Fontconfig cache and font directories of the current platform.
+    """
+    home = os.path.expanduser("~")
+    if sys.platform == "win32":
+        windir = os.environ.get("WINDIR", "C:\\Windows")
+        return [
+            os.path.join(windir, "Fonts"),
+            os.path.join(os.environ.get("LOCALAPPDATA", home), "Microsoft", "Windows", "Fonts")
+        ]
+    if sys.platform == "darwin":
+        return ["/System/Library/Fonts", "/Library/Fonts", os.path.join(home, "Library", "Fonts")]
+    return [
+        "/var/cache/fontconfig",
+        os.path.join(home, ".cache", "fontconfig"),
+        os.path.join(home, ".fontconfig"),
+        "/usr/share/fonts",
+        "/usr/local/share/fonts",
+        os.path.join(home, ".local", "share", "fonts"),
+        os.path.join(home, ".fonts")
+    ]
+
+
+def get_cache_stamp() -> list:
+    """
+    Get the key of the font cache: platform, pygame version, fc-list location
+    and modification times of the font directories.
+
+    Returns:
+        list: JSON serializable stamp.
+    """
+    stamp = [CACHE_VERSION, sys.platform, pygame.version.ver, shutil.which("fc-list")]
+    for path in get_font_dirs():
+        try:
+            stamp.append([path, os.stat(path).st_mtime_ns])
+        except OSError:
+            pass
+    return stamp
+
+
+def _sysfont_supported() -> bool:
+    """
+    Internal: Check that pygame.sysfont has the (private) tables used by the cache.
+    """
+    return (
+        isinstance(getattr(pygame.sysfont, "Sysfonts", None), dict)
+        and callable(getattr(pygame.sysfont, "create_aliases", None))
+        and callable(getattr(pygame.sysfont, "initsysfonts", None))
+        and hasattr(pygame.sysfont, "is_init")
+    )
+
+
+def load_font_cache(path: str = None) -> bool:
+    """
+    Fill the pygame.sysfont tables from the cache file if it is up to date.
+
+    Nothing is loaded if pygame already enumerated the fonts or if the installed
+    pygame does not have the expected sysfont tables.
+
+    Args:
+        path (str, optional): Cache file (see get_default_cache_path()).
+
+    Returns:
+        bool: True only if the fonts were read from the cache file and applied.
+    """
+    if not _sysfont_supported() or pygame.sysfont.is_init:
+        return False
+    if path is None:
+        path = get_default_cache_path()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return False
+    if not isinstance(data, dict) or data.get("stamp") != get_cache_stamp():
+        return False
+
+    try:
+        fonts = {}
+        for name, styles in data.get("fonts", {}).items():
+            # style keys are stored as "<bold><italic>" (e.g. "10" = bold)
+            fonts[name] = {(style[0] == "1", style[1] == "1"): file for style, file in styles.items()}
+        pygame.sysfont.Sysfonts.update(fonts)
+        pygame.sysfont.create_aliases()
+        pygame.sysfont.is_init = True
+    except Exception:
+        # malformed cache or changed pygame internals, let pygame enumerate the fonts
+        pygame.sysfont.Sysfonts.clear()
+        if isinstance(getattr(pygame.sysfont, "Sysalias", None), dict):
+            pygame.sysfont.Sysalias.clear()
+        return False
+    return True
+
+
+def save_font_cache(path: str = None) -> bool:
+    """
+    Write the pygame.sysfont tables to the cache file.
+
+    Args:
+        path (str, optional): Cache file (see get_default_cache_path()).
+
+    Returns:
+        bool: True if the cache was written.
+    """
+    if not _sysfont_supported():
+        return False
+    if path is None:
+        path = get_default_cache_path()
+    try:
+        fonts = {}
+        for name, styles in pygame.sysfont.Sysfonts.items():
+            fonts[name] = {"%d%d" % (bold, italic): file for (bold, italic), file in styles.items()}
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"stamp": get_cache_stamp(), "fonts": fonts}, f)
+        os.replace(tmp_path, path)
+    except Exception:
+        return False
+    return True
+
+
+def init_system_fonts(path: str = None) -> bool:
+    """
+    Initialize the system font tables of pygame, from the cache if possible.
+
+    If the cache is missing or outdated, the fonts are enumerated by pygame
+    and the cache is rewritten. If the installed pygame does not have the
+    expected sysfont tables, nothing is done and pygame.font.SysFont()
+    enumerates the fonts itself on its first call.
+
+    Args:
+        path (str, optional): Cache file (see get_default_cache_path()).
+
+    Returns:
+        bool: True if the fonts were loaded from the cache file.
+    """
+    if not _sysfont_supported() or pygame.sysfont.is_init:
+        return False
+    if load_font_cache(path):
+        return True
+    try:
+        pygame.sysfont.initsysfonts()
+    except Exception:
+        return False
+    save_font_cache(path)
+    return False
@@ -0,0 +1,294 @@
+"""
+Font registry for SUILib
+
+This module provides the FontRegistry class and the process-wide registry used
+by all GUI elements. Fonts are looked up and loaded once per (name, size, bold)
+and shared by every element using them; reference counting drops a font from
+the registry when the last element using it releases it.
+
+Fonts are loaded by one of two text backends: "font" (pygame.font, the default)
+or "freetype" (pygame.freetype, see FreetypeFont).
+"""
+
+import warnings
+import pygame
+
+try:
+    import pygame.freetype as freetype
+except ImportError:
+    freetype = None
+
+# Names of the supported text backends
+TEXT_BACKENDS = ("font", "freetype")
+
+
+class FreetypeFont:
+    """
+    pygame.freetype font with the interface of pygame.font.Font used by SUILib elements.
+
+    Unlike pygame.font.Font it can draw text directly onto a surface (see render_to()),
+    without creating a temporary surface. Fonts are matched and sized the same way as
+    pygame.font.SysFont() does it, so the layout of the elements does not change.
+    """
+
+    def __init__(self, name: str, size: int, bold: bool = False):
+        """
+        Load a system font.
+
+        Args:
+            name (str): Font name (see pygame.font.SysFont()).
+            size (int): Font size.
+            bold (bool): True for a bold font.
+        """
+        if not freetype.get_init():
+            freetype.init()
+        path = pygame.font.match_font(name, bold=bold) if name else None
+        strong = False
+        if path is None and bold:
+            # no bold face, the regular one is emboldened
+            path = pygame.font.match_font(name) if name else None
+            strong = True
+        if path is None:
+            # pygame.font scales its default font the same way
+            self._font = freetype.Font(None, max(int(size * 0.6875), 1))
+        else:
+            self._font = freetype.Font(path, size)
+        self._font.strong = strong
+        self._font.pad = True
+        self._font.origin = False
+
+    def render(self, text: str, antialias, color, background=None) -> pygame.Surface:
+        """
+        Render text into a new surface (see pygame.font.Font.render()).
+
+        Args:
+            text (str): The text.
+            antialias: True to render antialiased text.
+            color (tuple): Text color.
+            background (tuple, optional): Background color (transparent if None).
+
+        Returns:
+            pygame.Surface: The rendered text.
+        """
+        self._font.antialiased = bool(antialias)
+        return self._font.render(text, color, background)[0]
+
+    def render_to(self, surface: pygame.Surface, pos: tuple, text: str, antialias, color) -> pygame.Rect:
+        """
+        Draw text directly onto a surface.
+
+        Args:
+            surface (pygame.Surface): Target surface.
+            pos (tuple): Top left corner of the text.
+            text (str): The text.
+            antialias: True to render antialiased text.
+            color (tuple): Text color.
+
+        Returns:
+            pygame.Rect: Area covered by the text.
+        """
+        self._font.antialiased = bool(antialias)
+        return self._font.render_to(surface, (int(pos[0]), int(pos[1])), text, color)
+
+    def size(self, text: str) -> tuple:
+        """
+        Get the size of rendered text (see pygame.font.Font.size()).
+
+        Args:
+            text (str): The text.
+
+        Returns:
+            tuple: Width and height in pixels.
+        """
+        return self._font.get_rect(text).size
+
+    def get_height(self) -> int:
+        """
+        Get the height of the font.
+
+        Returns:
+            int: Height in pixels.
+        """
+        return self._font.get_sized_height()
+
+    def get_linesize(self) -> int:
+        """
+        Get the line spacing of the font.
+
+        Returns:
+            int: Line size in pixels.
+        """
+        return self._font.get_sized_height()
+
+    def get_ascent(self) -> int:
+        """
+        Get the ascent of the font.
+
+        Returns:
+            int: Ascent in pixels.
+        """
+        return self._font.get_sized_ascender()
+
+    def get_descent(self) -> int:
+        """
+        Get the descent of the font.
+
+        Returns:
+            int: Descent in pixels (negative).
+        """
+        return self._font.get_sized_descender()
+
+
+class FontRegistry:
+    """
+    Reference-counted cache of pygame fonts keyed by (name, size, bold).
+
+    Attributes:
+        backend (str): Text backend used to load new fonts (see TEXT_BACKENDS).
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty registry.
+        """
+        self._fonts = {}
+        self._keys = {}
+        self.backend = "font"
+
+    def __len__(self) -> int:
+        """
+        Get the number of loaded fonts.
+
+        Returns:
+            int: Number of fonts in the registry.
+        """
+        return len(self._fonts)
+
+    def set_backend(self, backend: str):
+        """
+        Set the text backend used for fonts loaded from now on (already loaded fonts are kept).
+
+        Args:
+            backend (str): "font" or "freetype". If pygame.freetype is not available,
+                "font" is used instead.
+
+        Raises:
+            ValueError: If the backend name is unknown.
+        """
+        if backend not in TEXT_BACKENDS:
+            raise ValueError("Unknown text backend: %s" % backend)
+        if backend == "freetype" and freetype is None:
+            warnings.warn("pygame.freetype is not available, using the pygame.font text backend")
+            backend = "font"
+        self.backend = backend
+
+    def make_key(self, name: str, size: int, bold=False) -> tuple:
+        """
+        Get the registry key of a font.
+
+        The bold flag is converted with bool() the same way pygame.font.SysFont() does,
+        so the key matches the font actually loaded.
+
+        Args:
+            name (str): Font name.
+            size (int): Font size.
+            bold: Bold flag.
+
+        Returns:
+            tuple: The key (name, size, bold, backend).
+        """
+        return (name, int(size), bool(bold), self.backend)
+
+    def acquire(self, name: str, size: int, bold=False) -> pygame.font.Font:
+        """
+        Get a shared font and increase its reference count (the font is loaded on the first request).
+
+        With the freetype backend a FreetypeFont is returned.
+
+        Args:
+            name (str): Font name (see pygame.font.SysFont()).
+            size (int): Font size.
+            bold: Bold flag.
+
+        Returns:
+            pygame.font.Font: The shared font.
+        """
+        key = self.make_key(name, size, bold)
+        entry = self._fonts.get(key)
+        if entry is None:
+            if self.backend == "freetype":
+                font = FreetypeFont(key[0], key[1], bold=key[2])
+            else:
+                font = pygame.font.SysFont(key[0], key[1], bold=key[2])
+            entry = [font, 0]
+            self._fonts[key] = entry
+            self._keys[id(font)] = key
+        entry[1] += 1
+        return entry[0]
+
+    def release(self, font: pygame.font.Font):
+        """
+        Decrease the reference count of a font, the font is dropped when it is no longer used.
+
+        Args:
+            font (pygame.font.Font): Font returned by acquire() (other fonts are ignored).
+        """
+        key = self._keys.get(id(font))
+        if key is None:
+            return
+        entry = self._fonts[key]
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del self._fonts[key]
+            del self._keys[id(font)]
+
+    def get_refcount(self, name: str, size: int, bold=False) -> int:
+        """
+        Get the number of users of a font.
+
+        Args:
+            name (str): Font name.
+            size (int): Font size.
+            bold: Bold flag.
+
+        Returns:
+            int: Reference count (0 if the font is not loaded).
+        """
+        entry = self._fonts.get(self.make_key(name, size, bold))
+        return 0 if entry is None else entry[1]
+
+    def clear(self):
+        """
+        Drop all fonts (e.g. after pygame.font was reinitialized).
+        """
+        self._fonts = {}
+        self._keys = {}
+
+
+# Registry shared by all elements of all applications
+font_registry = FontRegistry()
+
+
+def get_font(name: str, size: int, bold=False) -> pygame.font.Font:
+    """
+    Get a shared font from the global registry (see FontRegistry.acquire()).
+
+    Args:
+        name (str): Font name.
+        size (int): Font size.
+        bold: Bold flag.
+
+    Returns:
+        pygame.font.Font: The shared font.
+    """
+    return font_registry.acquire(name, size, bold)
+
+
+def release_font(font: pygame.font.Font):
+    """
+    Release a font obtained with get_font() (see FontRegistry.release()).
+
+    Args:
+        font (pygame.font.Font): The font.
+    """
+    font_registry.release(font)
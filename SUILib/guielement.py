@@ -12,6 +12,8 @@ from typing import Callable, Dict, List, Optional, final
 import abc
 import inspect
 from .events import SUIEvents
+from .fonts import get_font, release_font
+from .stylemanager import style_record
 
 class GUIElement(metaclass=abc.ABCMeta):
     """
@@ -30,9 +32,17 @@ class GUIElement(metaclass=abc.ABCMeta):
         focused_cursor: Pygame cursor type shown when this element is focused.
         visible (bool): Visibility of the element.
         focused (bool): Whether the element is currently focused.
+        selected (bool): Whether the element is currently selected (hovered or dragged).
+        parent: Element that draws this element as its child (None for top-level elements).
+        layout_owners (set): Layout managers (or Panels) the element was added to, notified
+            when the intrinsic size of the element changes.
         rect (pygame.Rect): Rectangle representing the element's position and size.
+        render_cache (bool): True to cache the rendered element, None to follow the application setting.
     """
 
+    # False for elements whose appearance changes without invalidate() (e.g. custom paint callbacks)
+    RENDER_CACHEABLE = True
+
     def __init__(
         self,
         view,
@@ -63,18 +73,18 @@ class GUIElement(metaclass=abc.ABCMeta):
         self.focused_cursor = focused_cursor
         self.visible = True
         self.focused = False
+        self.selected = False
+        self.parent = None
+        self.render_cache = None
+        self._render_cache = None
+        self._fonts = []
+        self._style_record = None
+        self._preferred_size = (width, height)
+        self._intrinsic_size = None
+        self.layout_owners = set()
 
-        sm = view.get_app().get_style_manager()
         if style is None:
-            self.style = sm.get_style_with_name(self.__class__.__name__)
-            if not self.style:
-                for base in inspect.getmro(self.__class__)[1:]:
-                    if base is object:
-                        continue
-                    style = sm.get_style_with_name(base.__name__)
-                    if style:
-                        self.style = style
-                        break
+            self.style = view.get_app().get_style_manager().get_style_for_class(self.__class__)
         else:
             self.style = style
 
@@ -90,7 +100,9 @@ class GUIElement(metaclass=abc.ABCMeta):
         Args:
             visible (bool): True to make element visible, False to hide.
         """
-        self.visible = visible
+        if self.visible != visible:
+            self.visible = visible
+            self.invalidate()
 
     def is_visible(self) -> bool:
         """
@@ -155,6 +167,56 @@ class GUIElement(metaclass=abc.ABCMeta):
         """Get style dictionary of this element."""
         return self.style
 
+    def get_style_record(self):
+        """
+        Get the style of this element compiled into a StyleRecord (attribute access
+        and precomputed derived colors, see stylemanager.StyleRecord), for draw methods.
+
+        The record is cached until set_style() is called; a style dictionary
+        modified in place must be passed to set_style() again.
+
+        Returns:
+            StyleRecord: The record of the style.
+        """
+        record = self._style_record
+        if record is None:
+            record = self._style_record = style_record(self.style)
+        return record
+
+    def acquire_font(self, style: dict = None, previous: pygame.font.Font = None) -> pygame.font.Font:
+        """
+        Get the shared font described by the font_name, font_size and font_bold
+        attributes of a style (see fonts.FontRegistry).
+
+        Args:
+            style (dict, optional): Style (or sub-style) with the font attributes.
+                Defaults to the style of this element.
+            previous (pygame.font.Font, optional): Font replaced by the new one, it is released.
+
+        Returns:
+            pygame.font.Font: The shared font.
+        """
+        if style is None:
+            style = self.style
+        font = get_font(style["font_name"], style["font_size"], style["font_bold"])
+        self._fonts.append(font)
+        if previous is not None and previous in self._fonts:
+            self._fonts.remove(previous)
+            release_font(previous)
+        return font
+
+    def release_fonts(self):
+        """
+        Release all fonts acquired by this element and its children (called when the element is removed).
+        """
+        for font in self._fonts:
+            release_font(font)
+        self._fonts = []
+        if isinstance(self, Container):
+            for el in self.get_childs():
+                if el is not None:
+                    el.release_fonts()
+
     def set_x(self, x: int):
         """
         Set the X position of this element.
@@ -162,8 +224,9 @@ class GUIElement(metaclass=abc.ABCMeta):
         Args:
             x (int): New X position.
         """
+        self.invalidate()
         self.x = x
-        self.update_view_rect()
+        self.geometry_changed(False)
 
     def set_y(self, y: int):
         """
@@ -172,8 +235,9 @@ class GUIElement(metaclass=abc.ABCMeta):
         Args:
             y (int): New Y position.
         """
+        self.invalidate()
         self.y = y
-        self.update_view_rect()
+        self.geometry_changed(False)
 
     def set_width(self, width: int):
         """
@@ -183,8 +247,10 @@ class GUIElement(metaclass=abc.ABCMeta):
             width (int): New width in pixels.
         """
         if width >= 0:
+            self.invalidate()
+            changed = width != self.width
             self.width = width
-            self.update_view_rect()
+            self.geometry_changed(changed)
 
     def set_height(self, height: int):
         """
@@ -194,8 +260,121 @@ class GUIElement(metaclass=abc.ABCMeta):
             height (int): New height in pixels.
         """
         if height >= 0:
+            self.invalidate()
+            changed = height != self.height
             self.height = height
-            self.update_view_rect()
+            self.geometry_changed(changed)
+
+    def set_geometry(self, x: int = None, y: int = None, width: int = None, height: int = None):
+        """
+        Set the position and size of this element at once.
+
+        Unlike calling set_x(), set_y(), set_width() and set_height() one after
+        another, the view rectangle is updated only once (and not at all if the
+        geometry does not change), so elements with an expensive
+        update_view_rect() (e.g. Table, ListPanel) are refreshed only once.
+        To update several elements at once, see View.batch_layout().
+
+        Args:
+            x (int, optional): New X position (None = unchanged).
+            y (int, optional): New Y position (None = unchanged).
+            width (int, optional): New width in pixels (None or negative = unchanged).
+            height (int, optional): New height in pixels (None or negative = unchanged).
+        """
+        if x is None:
+            x = self.x
+        if y is None:
+            y = self.y
+        if width is None or width < 0:
+            width = self.width
+        if height is None or height < 0:
+            height = self.height
+        size_changed = width != self.width or height != self.height
+        if not size_changed and x == self.x and y == self.y:
+            return
+        self.invalidate()
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.geometry_changed(size_changed)
+
+    def geometry_changed(self, size_changed: bool):
+        """
+        Apply a change of the position or size of this element: update the view
+        rectangle, invalidate the new area and call size_changed() if needed.
+
+        Inside View.batch_layout() this is deferred until the batch ends, so the
+        element is updated only once however many times its geometry changed.
+
+        Args:
+            size_changed (bool): True if the width or height changed.
+        """
+        if self.view is not None and self.view.defer_geometry_update(self, size_changed):
+            return
+        self.update_view_rect()
+        self.invalidate()
+        if size_changed:
+            self.size_changed()
+
+    def size_changed(self):
+        """
+        Called after the width or height of this element changed (by set_width(),
+        set_height() or set_geometry()). Override it to update size dependent state.
+        """
+        pass
+
+    def measure(self) -> tuple:
+        """
+        Compute the intrinsic size of this element: the size it needs to show its content.
+
+        Layouts query it through get_intrinsic_size(), which caches the result. Elements
+        with content (text, ...) override it; the default is the preferred size (the
+        size the element was created with, see set_preferred_size()). It must not change
+        the element.
+
+        Returns:
+            tuple: Width and height in pixels.
+        """
+        return self._preferred_size
+
+    def get_intrinsic_size(self) -> tuple:
+        """
+        Get the intrinsic size of this element (result of measure(), cached until
+        invalidate_measure() is called).
+
+        Returns:
+            tuple: Width and height in pixels.
+        """
+        size = self._intrinsic_size
+        if size is None:
+            size = self._intrinsic_size = self.measure()
+        return size
+
+    def set_preferred_size(self, width: int, height: int):
+        """
+        Set the size this element prefers when a layout sizes it by its intrinsic size.
+
+        Args:
+            width (int): Preferred width in pixels.
+            height (int): Preferred height in pixels.
+        """
+        self._preferred_size = (width, height)
+        self.invalidate_measure()
+
+    def invalidate_measure(self):
+        """
+        Drop the cached intrinsic size (call it when the content of the element changes,
+        e.g. its text). If the layout managing the element uses intrinsic sizes, it is laid
+        out again at the end of the frame.
+        """
+        self._intrinsic_size = None
+        changed = False
+        for owner in self.layout_owners:
+            if owner.element_measure_changed(self):
+                changed = True
+        if changed and self.view is not None:
+            self.view.request_layout()
 
     def set_style(self, style: dict):
         """
@@ -205,12 +384,18 @@ class GUIElement(metaclass=abc.ABCMeta):
             style (dict): New style.
         """
         self.style = style
+        self._style_record = None
+        self.invalidate_measure()
+        self.invalidate()
 
     def update_view_rect(self):
         """
-        Update the pygame.Rect representing this element's area.
+        Update the pygame.Rect representing this element's area
+        (and its position in the spatial index of the view).
         """
         self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        if self.parent is None and self.view is not None:
+            self.view.element_moved(self)
 
     @final
     def get_view_rect(self) -> pygame.Rect:
@@ -222,15 +407,112 @@ class GUIElement(metaclass=abc.ABCMeta):
         """
         return self.rect
 
+    def get_paint_rect(self) -> pygame.Rect:
+        """
+        Get the area of the screen this element paints into.
+
+        Elements that draw outside of their view rect (e.g. labels attached
+        to a checkbox) override this, so the dirty-rectangle renderer knows
+        which area has to be redrawn.
+
+        Returns:
+            pygame.Rect: The rectangle covering everything drawn by the element.
+        """
+        return self.rect
+
+    def invalidate(self):
+        """
+        Mark the area painted by this element as needing a redraw.
+
+        Child elements invalidate their parent, because they are drawn by it.
+        The render cache of the element is dropped, the area is reported only
+        if the application uses dirty-rectangle rendering.
+        """
+        self._render_cache = None
+        if self.parent is not None:
+            self.parent.invalidate()
+        elif self.view is not None:
+            self.view.invalidate_element(self)
+
+    def set_render_cache(self, enabled: bool):
+        """
+        Enable or disable the render cache of this element.
+
+        A cached element is drawn into a surface once and then only blitted
+        until it is invalidated (state, style, text, size or position changes).
+
+        Args:
+            enabled (bool): True to enable, False to disable, None to follow the application setting.
+        """
+        self.render_cache = enabled
+        self._render_cache = None
+
+    def is_render_cacheable(self) -> bool:
+        """
+        Check whether the rendered element can be cached (including all its child elements).
+
+        Returns:
+            bool: True if the element and all its children are cacheable.
+        """
+        if not self.RENDER_CACHEABLE:
+            return False
+        if isinstance(self, Container):
+            for el in self.get_childs():
+                if el is not None and not el.is_render_cacheable():
+                    return False
+        return True
+
+    @final
+    def draw_cached(self, view, screen: pygame.Surface):
+        """
+        Draw the element, using its render cache if the cache is enabled.
+
+        Args:
+            view: The parent View calling this method.
+            screen (pygame.Surface): The surface to draw on.
+        """
+        app = view.get_app()
+        enabled = app.render_cache if self.render_cache is None else self.render_cache
+        if not enabled or app.is_building_render_cache():
+            self.draw(view, screen)
+            return
+
+        if self._render_cache is None:
+            if not self.is_render_cacheable():
+                self.draw(view, screen)
+                return
+            rect = self.get_paint_rect().clip(screen.get_rect())
+            if rect.width <= 0 or rect.height <= 0:
+                return
+            # draw into a transparent surface with the same coordinates as the target
+            scratch = app.begin_render_cache(screen.get_size(), rect)
+            try:
+                self.draw(view, scratch)
+            finally:
+                app.end_render_cache()
+            # draw() may resize the element or move its children, the cache would be clipped
+            if self.get_paint_rect().clip(screen.get_rect()) != rect:
+                self.draw(view, screen)
+                return
+            surface = scratch.subsurface(rect).copy()
+            self._render_cache = (rect, surface)
+        else:
+            rect, surface = self._render_cache
+        screen.blit(surface, rect)
+
     @final
     def focus(self):
-        """Mark this element as focused."""
+        """Mark this element as focused (it receives the keyboard events of the view)."""
         self.focused = True
+        if self.view is not None:
+            self.view.focus_manager.element_focused(self)
 
     @final
     def un_focus(self):
         """Mark this element as unfocused."""
         self.focused = False
+        if self.view is not None:
+            self.view.focus_manager.element_unfocused(self)
 
     @final
     def is_focused(self) -> bool:
@@ -242,6 +524,34 @@ class GUIElement(metaclass=abc.ABCMeta):
         """
         return self.focused
 
+    @final
+    def select(self):
+        """Mark this element as selected (hovered or dragged by the mouse)."""
+        if not self.selected:
+            self.selected = True
+            if self.view is not None:
+                self.view.focus_manager.element_selected(self)
+            self.invalidate()
+
+    @final
+    def un_select(self):
+        """Mark this element as not selected."""
+        if self.selected:
+            self.selected = False
+            if self.view is not None:
+                self.view.focus_manager.element_unselected(self)
+            self.invalidate()
+
+    @final
+    def is_selected(self) -> bool:
+        """
+        Check if this element is currently selected.
+
+        Returns:
+            bool: True if selected, False otherwise.
+        """
+        return self.selected
+
     @abc.abstractmethod
     def draw(self, view, screen: pygame.Surface):
         """
@@ -265,16 +575,15 @@ class GUIElement(metaclass=abc.ABCMeta):
         if not self.visible:
             return
 
-        # Aktuální pozice myši
-        mouse_pos = pygame.mouse.get_pos()
-
-        # MOUSE ENTER/LEAVE (detekce při každém eventu)
-        if self.get_view_rect().collidepoint(mouse_pos):
-            if not self._mouse_inside:
-                self._mouse_inside = True
-                self.trigger_event(SUIEvents.EVENT_ON_MOUSE_ENTER, event)
-        else:
-            if self._mouse_inside:
+        # MOUSE ENTER/LEAVE (podle pozice pointer eventů, ostatní eventy kurzorem nehýbou;
+        # view posílá pointer eventy i prvkům, nad kterými byl kurzor naposledy)
+        pos = getattr(event, "pos", None)
+        if pos is not None:
+            if self.get_view_rect().collidepoint(pos):
+                if not self._mouse_inside:
+                    self._mouse_inside = True
+                    self.trigger_event(SUIEvents.EVENT_ON_MOUSE_ENTER, event)
+            elif self._mouse_inside:
                 self._mouse_inside = False
                 self.trigger_event(SUIEvents.EVENT_ON_MOUSE_LEAVE, event)
 
@@ -285,13 +594,13 @@ class GUIElement(metaclass=abc.ABCMeta):
                 if event.button == 1:
                     self.trigger_event(SUIEvents.EVENT_ON_CLICK, event)
                     if not self.focused:
-                        self.focused = True
+                        self.focus()
                         self.trigger_event(SUIEvents.EVENT_ON_FOCUS, event)
                 elif event.button == 3:
                     self.trigger_event(SUIEvents.EVENT_ON_RIGHT_CLICK, event)
             else:
                 if self.focused:
-                    self.focused = False
+                    self.un_focus()
                     self.trigger_event(SUIEvents.EVENT_ON_BLUR, event)
         elif event.type == pygame.MOUSEBUTTONUP:
             if self.get_view_rect().collidepoint(event.pos):
@@ -362,7 +671,29 @@ class GUIElement(metaclass=abc.ABCMeta):
     def trigger_event(self, event_name: str, *args, **kwargs):
         """Spustí všechny callbacky pro daný event."""
         for callback in self._event_callbacks.get(event_name, []):
-            callback(*args, **kwargs)
+            self.call_callback(callback, *args, **kwargs)
+
+    def call_callback(self, callback: Callable, *args, **kwargs):
+        """
+        Call a user callback of the element.
+
+        The callback may be a coroutine function; the returned coroutine is scheduled
+        on the asyncio event loop of the application (see Application.run_coroutine()).
+
+        Args:
+            callback (Callable): The callback.
+            *args: Positional arguments for the callback.
+            **kwargs: Keyword arguments for the callback.
+
+        Returns:
+            The result of the callback (asyncio.Task for coroutine callbacks).
+        """
+        result = callback(*args, **kwargs)
+        if inspect.isawaitable(result) and self.view is not None:
+            app = self.view.get_app()
+            if app is not None:
+                return app.run_coroutine(result)
+        return result
 
 
 class Container(metaclass=abc.ABCMeta):
@@ -3,12 +3,16 @@ Layout managers for SUILib GUI framework
 
 This module provides layout manager classes for arranging GUI elements within a View.
 It includes AbsoluteLayout for pixel/percentage-based positioning and sizing,
-and RelativeLayout for stacking elements relative to a parent in horizontal or vertical fashion.
+RelativeLayout for stacking elements relative to a parent in horizontal or vertical fashion,
+and the responsive FlexLayout (rows/columns with grow and shrink factors) and
+GridLayout (fixed, fractional and auto sized tracks).
 """
 
+import abc
+import numpy as np
 from .utils import *
 from .colors import *
-from .application import Layout   
+from .application import Layout
 
 
 class AbsoluteLayout(Layout):
@@ -16,8 +20,11 @@ class AbsoluteLayout(Layout):
     Layout manager for absolute positioning and sizing of GUI elements.
 
     Allows setting element positions and sizes in pixels or percentages
-    (e.g., "50%", "120"). Percentage values are recalculated to pixels
-    on layout update, enabling responsive or fixed layouts.
+    (e.g., "50%", "120"). The properties are compiled once into a fraction of
+    the view size and a pixel offset per value; on layout update the geometry
+    of all elements is computed at once with NumPy and applied with
+    GUIElement.set_geometry(). Call invalidate_layout() after modifying the
+    properties of an element in place.
 
     Example usage:
         al = AbsoluteLayout(self)
@@ -38,6 +45,99 @@ class AbsoluteLayout(Layout):
             view (View): View instance for which the layout manager is registered.
         """
         super().__init__(view)
+        self._compiled = None
+        self._specs = []
+
+    @staticmethod
+    def compile_propt(propt) -> tuple:
+        """
+        Compile the properties of an element (x, y, width, height) into numbers.
+
+        Args:
+            propt (list): Properties in pixels ("120") or percentages ("50%"), may be None
+                or shorter than 4 (missing values are not changed by the layout).
+
+        Returns:
+            tuple: (fractions, offsets, count), the value of property i is
+                fractions[i] * (view width or height) + offsets[i].
+        """
+        fractions = [0.0, 0.0, 0.0, 0.0]
+        offsets = [0.0, 0.0, 0.0, 0.0]
+        if propt is None:
+            return fractions, offsets, 0
+        count = min(len(propt), 4)
+        for i in range(count):
+            value = propt[i]
+            if value[-1] == '%':
+                fractions[i] = float(value[0:-1]) / 100.0
+            else:
+                offsets[i] = float(value)
+        return fractions, offsets, count
+
+    @overrides(Layout)
+    def add_element(self, element, propt=None):
+        """
+        Add a GUI element with its position and size properties.
+
+        Args:
+            element (GUIElement): The GUI element to add.
+            propt (list, optional): Properties [x, y, width, height] in pixels or percentages.
+        """
+        super().add_element(element, propt)
+        self._compiled = None
+
+    @overrides(Layout)
+    def invalidate_layout(self):
+        """
+        Mark the layout as dirty; the properties of the elements are compiled again
+        (only the modified ones are parsed).
+        """
+        self._compiled = None
+        super().invalidate_layout()
+
+    @overrides(Layout)
+    def set_elements(self, layout_elements):
+        """
+        Replace the current list of layout elements (used by Panel).
+
+        Args:
+            layout_elements (list): New list of layout elements.
+        """
+        if layout_elements is not self.get_layout_elements():
+            self._compiled = None
+        super().set_elements(layout_elements)
+
+    def _compile(self) -> tuple:
+        """
+        Internal: Get the compiled properties of all elements as arrays, compile
+        them if the list of elements changed.
+
+        The compiled properties are kept in a list parallel to the layout
+        elements (self._specs) together with a snapshot of the property values;
+        entries whose element and property values did not change are reused.
+        """
+        elements = self.get_layout_elements()
+        compiled = self._compiled
+        if compiled is not None and compiled[0] is elements and compiled[1] == len(elements):
+            return compiled
+        old_specs = self._specs
+        specs = []
+        for i, el in enumerate(elements):
+            propt = el["propt"]
+            values = None if propt is None else tuple(propt)
+            if i < len(old_specs) and old_specs[i][0] is el and old_specs[i][1] == values:
+                specs.append(old_specs[i])
+            else:
+                specs.append((el, values, self.compile_propt(propt)))
+        self._specs = specs
+        self._compiled = (
+            elements,
+            len(elements),
+            np.array([spec[2][0] for spec in specs], dtype=np.float64).reshape(-1, 4),
+            np.array([spec[2][1] for spec in specs], dtype=np.float64).reshape(-1, 4),
+            [spec[2][2] for spec in specs]
+        )
+        return self._compiled
 
     @overrides(Layout)
     def update_layout(self, width, height):
@@ -48,27 +148,15 @@ class AbsoluteLayout(Layout):
             width (int): Width of the view/screen.
             height (int): Height of the view/screen.
         """
-        for el in super().get_layout_elements():
-            gui_el = el["element"]
-            propts = el["propt"]
-            if propts is not None:
-                for i, propt in enumerate(propts):
-                    if propt[-1] == '%':
-                        val = float(propt[0:-1])
-                        if i % 2 == 0:
-                            val = val / 100.0 * width
-                        else:
-                            val = val / 100.0 * height
-                    else:
-                        val = float(propt)
-                    if i == 0:
-                        gui_el.set_x(val)
-                    elif i == 1:
-                        gui_el.set_y(val)
-                    elif i == 2:
-                        gui_el.set_width(val)
-                    else:
-                        gui_el.set_height(val)
+        elements, _, fractions, offsets, counts = self._compile()
+        if len(elements) == 0:
+            return
+        geometry = fractions * np.array([width, height, width, height], dtype=np.float64) + offsets
+        for el, values, count in zip(elements, geometry.tolist(), counts):
+            if count == 4:
+                el["element"].set_geometry(*values)
+            elif count != 0:
+                el["element"].set_geometry(*values[:count])
 
 
 class RelativeLayout(Layout):
@@ -139,4 +227,410 @@ class RelativeLayout(Layout):
                         if gui_el != parent:
                             i = i + 1
                             gui_el.set_x(parent.get_x())
-                        gui_el.set_y(parent.get_y() + i * h_step)
\ No newline at end of file
+                        gui_el.set_y(parent.get_y() + i * h_step)
+
+class CachedLayout(Layout):
+    """
+    Base class of layout managers with a two-pass measure/arrange algorithm.
+
+    The measure pass (measure()) reads the intrinsic sizes of the elements
+    (GUIElement.get_intrinsic_size()) and runs only when the content changed:
+    elements were added, the intrinsic size of an element changed (e.g. its text,
+    see GUIElement.invalidate_measure()) or invalidate_layout() was called.
+    The arrange pass (arrange()) positions the elements and runs only when the
+    content or the available size changed, so update_layout() is nearly free
+    when nothing changed.
+    """
+
+    def __init__(self, view):
+        """
+        Initialize the layout for a given View.
+
+        Args:
+            view (View): View instance for which the layout manager is registered.
+        """
+        super().__init__(view)
+        self._constraints = None
+        self._measured_elements = None
+        self._measured_count = 0
+        self._members = set()
+
+    @overrides(Layout)
+    def element_measure_changed(self, element) -> bool:
+        """
+        Invalidate the layout if the element was measured by it.
+
+        Args:
+            element (GUIElement): Element whose intrinsic size changed.
+
+        Returns:
+            bool: True if the layout was invalidated.
+        """
+        if element not in self._members:
+            return False
+        self.invalidate_layout()
+        return True
+
+    def get_intrinsic_size(self, element) -> tuple:
+        """
+        Get the intrinsic size of an element (cached by the element, see GUIElement.measure()).
+
+        Args:
+            element (GUIElement): The element.
+
+        Returns:
+            tuple: Width and height in pixels.
+        """
+        return element.get_intrinsic_size()
+
+    @overrides(Layout)
+    def update_layout(self, width, height):
+        """
+        Measure (if the content changed) and arrange (if the content or size changed) the elements.
+
+        Args:
+            width (int): Width of the view/screen.
+            height (int): Height of the view/screen.
+        """
+        elements = self.get_layout_elements()
+        if elements is not self._measured_elements or len(elements) != self._measured_count:
+            # list replaced by a Panel or elements added directly
+            self._measured_elements = elements
+            self._measured_count = len(elements)
+            self._layout_dirty = True
+        if not self._layout_dirty and self._constraints == (width, height):
+            return
+        if self._layout_dirty:
+            self._members = {el["element"] for el in elements}
+            self.measure()
+            # cleared here too, Panel calls update_layout() of its manager directly
+            self._layout_dirty = False
+        self._constraints = (width, height)
+        self.arrange(width, height)
+
+    def measure(self):
+        """
+        Measure pass: compute the data which depends only on the content of the layout.
+        """
+        pass
+
+    @abc.abstractmethod
+    def arrange(self, width: int, height: int):
+        """
+        Arrange pass: position and size the elements in the available area.
+
+        Args:
+            width (int): Available width.
+            height (int): Available height.
+        """
+        pass
+
+
+def _parse_length(value, name: str) -> tuple:
+    """
+    Internal: Parse a length ("120", 120, "25%", "1fr", "auto") into (unit, value).
+    """
+    if isinstance(value, (int, float)):
+        return ("px", float(value))
+    value = str(value).strip()
+    try:
+        if value == "auto":
+            return ("auto", 0.0)
+        if value.endswith("fr"):
+            return ("fr", float(value[0:-2] or 1))
+        if value.endswith("%"):
+            return ("%", float(value[0:-1]) / 100.0)
+        return ("px", float(value))
+    except ValueError:
+        raise ValueError("Invalid %s: %s" % (name, value))
+
+
+def _round_edges(start: float, sizes: list, gap: float) -> list:
+    """
+    Internal: Convert float track sizes into integer (offset, size) pairs without gaps
+    caused by rounding (edges are rounded, not sizes).
+    """
+    result = []
+    pos = start
+    for size in sizes:
+        a = round(pos)
+        b = round(pos + size)
+        result.append((a, b - a))
+        pos += size + gap
+    return result
+
+
+class FlexLayout(CachedLayout):
+    """
+    Layout manager arranging elements in a row or a column (like CSS flexbox).
+
+    Elements keep their intrinsic size along the main axis (or the basis), the free
+    space is distributed by their grow factors, missing space is taken by their
+    shrink factors (weighted by the basis). Along the cross axis elements are
+    stretched or aligned.
+
+    Element properties (dict, all optional):
+        grow (float): Share of the free space, default 0.
+        shrink (float): Share of the missing space, default 1.
+        basis (int or str): Initial main size in pixels or percentage, default is the intrinsic size.
+        align (str): Cross axis alignment overriding the layout one.
+
+    Example usage:
+        fl = FlexLayout(self, "row", gap=10, padding=10)
+        fl.add_element(button1)
+        fl.add_element(text_input, {"grow": 1})
+        fl.add_element(button2, {"basis": "20%"})
+
+    Attributes:
+        direction (str): "row" (horizontal) or "column" (vertical).
+        gap (int): Space between elements in pixels.
+        padding (int): Space around the elements in pixels.
+        justify (str): Main axis placement of the elements if there is free space:
+            "start", "center", "end" or "space-between".
+        align (str): Cross axis alignment: "stretch", "start", "center" or "end".
+    """
+
+    DIRECTIONS = ("row", "column")
+    JUSTIFY = ("start", "center", "end", "space-between")
+    ALIGN = ("stretch", "start", "center", "end")
+
+    def __init__(self, view, direction: str = "row", gap: int = 0, padding: int = 0,
+                 justify: str = "start", align: str = "stretch"):
+        """
+        Initialize FlexLayout for a given View.
+
+        Args:
+            view (View): View instance for which the layout manager is registered.
+            direction (str): "row" or "column".
+            gap (int): Space between elements in pixels.
+            padding (int): Space around the elements in pixels.
+            justify (str): Main axis placement ("start", "center", "end", "space-between").
+            align (str): Cross axis alignment ("stretch", "start", "center", "end").
+
+        Raises:
+            ValueError: If direction, justify or align is not valid.
+        """
+        if direction not in FlexLayout.DIRECTIONS:
+            raise ValueError("Invalid direction: %s" % direction)
+        if justify not in FlexLayout.JUSTIFY:
+            raise ValueError("Invalid justify: %s" % justify)
+        if align not in FlexLayout.ALIGN:
+            raise ValueError("Invalid align: %s" % align)
+        super().__init__(view)
+        self.direction = direction
+        self.gap = gap
+        self.padding = padding
+        self.justify = justify
+        self.align = align
+        self._items = []
+
+    @overrides(CachedLayout)
+    def measure(self):
+        """
+        Read the intrinsic sizes and properties of the elements.
+        """
+        row = self.direction == "row"
+        items = []
+        for el in self.get_layout_elements():
+            element = el["element"]
+            propt = el["propt"] or {}
+            width, height = self.get_intrinsic_size(element)
+            basis = propt.get("basis")
+            items.append((
+                element,
+                float(propt.get("grow", 0)),
+                float(propt.get("shrink", 1)),
+                None if basis is None else _parse_length(basis, "basis"),
+                width if row else height,
+                height if row else width,
+                propt.get("align", self.align)
+            ))
+        self._items = items
+
+    @overrides(CachedLayout)
+    def arrange(self, width, height):
+        """
+        Distribute the main axis space and align the elements on the cross axis.
+
+        Args:
+            width (int): Available width.
+            height (int): Available height.
+        """
+        items = self._items
+        if len(items) == 0:
+            return
+        row = self.direction == "row"
+        main_size = (width if row else height) - 2 * self.padding
+        cross_size = (height if row else width) - 2 * self.padding
+
+        sizes = []
+        for item in items:
+            basis = item[3]
+            if basis is None or basis[0] == "auto":
+                sizes.append(float(item[4]))
+            elif basis[0] == "%":
+                sizes.append(basis[1] * main_size)
+            else:
+                sizes.append(basis[1])
+
+        free = main_size - self.gap * (len(items) - 1) - sum(sizes)
+        if free > 0:
+            total_grow = sum(item[1] for item in items)
+            if total_grow > 0:
+                sizes = [size + free * item[1] / total_grow for size, item in zip(sizes, items)]
+                free = 0
+        elif free < 0:
+            total_shrink = sum(item[2] * size for size, item in zip(sizes, items))
+            if total_shrink > 0:
+                sizes = [max(size + free * item[2] * size / total_shrink, 0.0) for size, item in zip(sizes, items)]
+            free = 0
+
+        start = self.padding
+        gap = self.gap
+        if self.justify == "end":
+            start += free
+        elif self.justify == "center":
+            start += free / 2
+        elif self.justify == "space-between" and len(items) > 1:
+            gap += free / (len(items) - 1)
+
+        for item, (pos, size) in zip(items, _round_edges(start, sizes, gap)):
+            align = item[6]
+            if align == "stretch":
+                cross_pos, cross = self.padding, cross_size
+            else:
+                cross = min(item[5], cross_size)
+                cross_pos = self.padding
+                if align == "end":
+                    cross_pos += cross_size - cross
+                elif align == "center":
+                    cross_pos += round((cross_size - cross) / 2)
+            if row:
+                item[0].set_geometry(pos, cross_pos, size, cross)
+            else:
+                item[0].set_geometry(cross_pos, pos, cross, size)
+
+
+class GridLayout(CachedLayout):
+    """
+    Layout manager placing elements into the cells of a grid.
+
+    Column and row tracks are sized in pixels ("120"), percentages of the available
+    size ("25%"), by the largest intrinsic size of their elements ("auto"), or by a
+    fraction of the remaining space ("1fr", "2fr"). Elements fill their cell (or the
+    cells they span); elements spanning several tracks do not affect auto tracks.
+
+    Element properties (dict):
+        column (int): Column index, default 0.
+        row (int): Row index, default 0.
+        column_span (int): Number of spanned columns, default 1.
+        row_span (int): Number of spanned rows, default 1.
+
+    Example usage:
+        gl = GridLayout(self, ["auto", "1fr"], ["40", "40", "1fr"], gap=5, padding=10)
+        gl.add_element(label, {"column": 0, "row": 0})
+        gl.add_element(text_input, {"column": 1, "row": 0})
+        gl.add_element(table, {"column": 0, "row": 2, "column_span": 2})
+
+    Attributes:
+        columns (list): Parsed column tracks.
+        rows (list): Parsed row tracks.
+        gap (int): Space between tracks in pixels.
+        padding (int): Space around the grid in pixels.
+    """
+
+    def __init__(self, view, columns: list, rows: list, gap: int = 0, padding: int = 0):
+        """
+        Initialize GridLayout for a given View.
+
+        Args:
+            view (View): View instance for which the layout manager is registered.
+            columns (list): Sizes of the column tracks ("120", "25%", "auto", "1fr").
+            rows (list): Sizes of the row tracks.
+            gap (int): Space between tracks in pixels.
+            padding (int): Space around the grid in pixels.
+
+        Raises:
+            ValueError: If a track size is not valid.
+        """
+        super().__init__(view)
+        self.columns = [_parse_length(track, "column size") for track in columns]
+        self.rows = [_parse_length(track, "row size") for track in rows]
+        self.gap = gap
+        self.padding = padding
+        self._items = []
+        self._auto_columns = []
+        self._auto_rows = []
+
+    @overrides(CachedLayout)
+    def measure(self):
+        """
+        Resolve the cells of the elements and the sizes of the auto tracks.
+        """
+        items = []
+        auto_columns = [0] * len(self.columns)
+        auto_rows = [0] * len(self.rows)
+        for el in self.get_layout_elements():
+            propt = el["propt"] or {}
+            column = int(propt.get("column", 0))
+            row = int(propt.get("row", 0))
+            if column < 0 or column >= len(self.columns) or row < 0 or row >= len(self.rows):
+                continue
+            column_span = max(min(int(propt.get("column_span", 1)), len(self.columns) - column), 1)
+            row_span = max(min(int(propt.get("row_span", 1)), len(self.rows) - row), 1)
+            width, height = self.get_intrinsic_size(el["element"])
+            if column_span == 1:
+                auto_columns[column] = max(auto_columns[column], width)
+            if row_span == 1:
+                auto_rows[row] = max(auto_rows[row], height)
+            items.append((el["element"], column, row, column_span, row_span))
+        self._items = items
+        self._auto_columns = auto_columns
+        self._auto_rows = auto_rows
+
+    def _track_sizes(self, tracks: list, auto: list, available: float) -> list:
+        """
+        Internal: Resolve the sizes of tracks along one axis.
+        """
+        space = available - self.gap * (len(tracks) - 1)
+        sizes = []
+        fr_total = 0.0
+        for (unit, value), auto_size in zip(tracks, auto):
+            if unit == "px":
+                sizes.append(value)
+            elif unit == "%":
+                sizes.append(value * space)
+            elif unit == "auto":
+                sizes.append(float(auto_size))
+            else:
+                sizes.append(0.0)
+                fr_total += value
+        if fr_total > 0:
+            remaining = max(space - sum(sizes), 0.0)
+            sizes = [
+                remaining * value / fr_total if unit == "fr" else size
+                for (unit, value), size in zip(tracks, sizes)
+            ]
+        return sizes
+
+    @overrides(CachedLayout)
+    def arrange(self, width, height):
+        """
+        Size the tracks and fit the elements into their cells.
+
+        Args:
+            width (int): Available width.
+            height (int): Available height.
+        """
+        if len(self._items) == 0:
+            return
+        columns = _round_edges(
+            self.padding, self._track_sizes(self.columns, self._auto_columns, width - 2 * self.padding), self.gap)
+        rows = _round_edges(
+            self.padding, self._track_sizes(self.rows, self._auto_rows, height - 2 * self.padding), self.gap)
+        for element, column, row, column_span, row_span in self._items:
+            x = columns[column][0]
+            y = rows[row][0]
+            last_column = columns[column + column_span - 1]
+            last_row = rows[row + row_span - 1]
+            element.set_geometry(x, y, last_column[0] + last_column[1] - x, last_row[0] + last_row[1] - y)
@@ -0,0 +1,231 @@
+"""
+Frame profiler for SUILib applications
+
+This module provides the FrameProfiler class which measures how much time the
+GUI elements of the visible view spend in drawing, event processing and updates,
+per element instance and per element class. The collected data is available
+through an API and can be displayed as an on-screen overlay with FPS, a frame
+time graph and the most expensive elements. When the profiler is disabled the
+views only check a single flag, so there is practically no overhead.
+"""
+
+import pygame
+from collections import deque
+from time import perf_counter
+
+from .colors import *
+
+
+class FrameProfiler:
+    """
+    Collects per-element timings (draw, event, update) for every rendered frame.
+
+    Timings are keyed by element instance; each record also holds the name of
+    the element class, so they can be aggregated per class. Only elements placed
+    directly in the view are measured, children are accounted to their container.
+
+    Attributes:
+        enabled (bool): True if timings are collected.
+        overlay_visible (bool): True if the overlay is drawn over the rendered frame.
+        toggle_key (int): Key which toggles the overlay (None = no key).
+        top_n (int): Number of most expensive elements shown in the overlay.
+        history (deque): Work times (ms) of the last main loop iterations.
+    """
+
+    KINDS = ("draw", "event", "update")
+
+    def __init__(self, history_size: int = 120, top_n: int = 5):
+        """
+        Initialize a disabled profiler.
+
+        Args:
+            history_size (int): Number of frames kept for the frame time graph.
+            top_n (int): Number of most expensive elements shown in the overlay.
+        """
+        self.enabled = False
+        self.overlay_visible = False
+        self.toggle_key = None
+        self.top_n = top_n
+        self.history = deque(maxlen=history_size)
+        self.fps = 0.0
+        self._font = None
+        self._current = {}
+        self._last = {}
+        self._frame_start = None
+        self._last_frame_time = None
+
+    def enable(self):
+        """Start collecting timings."""
+        self.enabled = True
+
+    def disable(self):
+        """Stop collecting timings and hide the overlay."""
+        self.enabled = False
+        self.overlay_visible = False
+
+    def reset(self):
+        """Clear all collected timings and the frame history."""
+        self._current = {}
+        self._last = {}
+        self._frame_start = None
+        self._last_frame_time = None
+        self.history.clear()
+        self.fps = 0.0
+
+    def record(self, kind: str, element, seconds: float):
+        """
+        Record time spent by an element in the current frame.
+
+        Args:
+            kind (str): One of "draw", "event", "update".
+            element (GUIElement): The measured element.
+            seconds (float): Measured time in seconds.
+        """
+        stats = self._current.get(id(element))
+        if stats is None:
+            stats = {
+                "element": element,
+                "class": element.__class__.__name__,
+                "draw": 0.0, "event": 0.0, "update": 0.0,
+                "draw_calls": 0, "event_calls": 0, "update_calls": 0
+            }
+            self._current[id(element)] = stats
+        stats[kind] += seconds * 1000.0
+        stats[kind + "_calls"] += 1
+
+    def begin_frame(self):
+        """
+        Mark the start of the work of a main loop iteration (events, updates, rendering).
+        """
+        self._frame_start = perf_counter()
+
+    def end_frame(self, rendered: bool):
+        """
+        Mark the end of the work of a main loop iteration.
+
+        The work time is added to the history. When the frame was rendered, the
+        element timings collected since the previous rendered frame become the
+        timings of the last frame and the FPS is updated.
+
+        Args:
+            rendered (bool): True if the frame was rendered.
+        """
+        now = perf_counter()
+        if self._frame_start is not None:
+            self.history.append((now - self._frame_start) * 1000.0)
+            self._frame_start = None
+        if rendered:
+            if self._last_frame_time is not None and now > self._last_frame_time:
+                fps = 1.0 / (now - self._last_frame_time)
+                self.fps = fps if self.fps == 0 else self.fps + (fps - self.fps) * 0.1
+            self._last_frame_time = now
+            self._last = self._current
+            self._current = {}
+
+    def get_frame_time(self) -> float:
+        """
+        Get the work time of the last frame.
+
+        Returns:
+            float: Time in milliseconds.
+        """
+        return self.history[-1] if len(self.history) != 0 else 0.0
+
+    def get_element_stats(self) -> list:
+        """
+        Get timings of the last frame per element instance.
+
+        Returns:
+            list: List of dicts with keys element, class, draw, event, update (ms)
+                and draw_calls, event_calls, update_calls.
+        """
+        return [dict(stats) for stats in self._last.values()]
+
+    def get_class_stats(self) -> dict:
+        """
+        Get timings of the last frame aggregated per element class.
+
+        Returns:
+            dict: Class name -> dict with summed times (ms), call counts and instance count.
+        """
+        result = {}
+        for stats in self._last.values():
+            cls = result.get(stats["class"])
+            if cls is None:
+                cls = {"instances": 0}
+                for kind in FrameProfiler.KINDS:
+                    cls[kind] = 0.0
+                    cls[kind + "_calls"] = 0
+                result[stats["class"]] = cls
+            cls["instances"] += 1
+            for kind in FrameProfiler.KINDS:
+                cls[kind] += stats[kind]
+                cls[kind + "_calls"] += stats[kind + "_calls"]
+        return result
+
+    def get_top_elements(self, n: int = None) -> list:
+        """
+        Get the most expensive elements of the last frame (by total time).
+
+        Args:
+            n (int, optional): Number of elements. Defaults to top_n.
+
+        Returns:
+            list: Element stats (see get_element_stats()) sorted by total time, descending.
+        """
+        if n is None:
+            n = self.top_n
+        stats = self.get_element_stats()
+        stats.sort(key=lambda s: s["draw"] + s["event"] + s["update"], reverse=True)
+        return stats[:n]
+
+    def get_overlay_rect(self, screen: pygame.Surface) -> pygame.Rect:
+        """
+        Get the area of the screen covered by the overlay.
+
+        Args:
+            screen (pygame.Surface): The screen surface.
+
+        Returns:
+            pygame.Rect: Rectangle of the overlay.
+        """
+        width = min(260, screen.get_width())
+        height = min(86 + 16 * self.top_n, screen.get_height())
+        return pygame.Rect(screen.get_width() - width, 0, width, height)
+
+    def draw_overlay(self, screen: pygame.Surface):
+        """
+        Draw the overlay with FPS, frame time graph and the most expensive elements.
+
+        Args:
+            screen (pygame.Surface): The surface to draw on.
+        """
+        if self._font is None:
+            self._font = pygame.font.Font(None, 18)
+        rect = self.get_overlay_rect(screen)
+        background = pygame.Surface(rect.size, pygame.SRCALPHA)
+        background.fill((0, 0, 0, 180))
+        screen.blit(background, rect.topleft)
+
+        text = "FPS: %.1f  frame: %.2f ms" % (self.fps, self.get_frame_time())
+        screen.blit(self._font.render(text, True, WHITE), (rect.x + 6, rect.y + 4))
+
+        # frame time graph, full height = 33 ms (30 FPS)
+        graph = pygame.Rect(rect.x + 6, rect.y + 22, rect.width - 12, 50)
+        pygame.draw.rect(screen, GRAY, graph, 1)
+        limit_y = graph.bottom - graph.height * 16.7 / 33.3
+        pygame.draw.line(screen, (90, 90, 90), (graph.x, limit_y), (graph.right - 1, limit_y))
+        if len(self.history) > 1:
+            step = graph.width / (self.history.maxlen - 1)
+            points = []
+            for i, t in enumerate(self.history):
+                y = graph.bottom - 1 - min(t / 33.3, 1.0) * (graph.height - 2)
+                points.append((graph.x + i * step, y))
+            pygame.draw.lines(screen, GREEN, False, points)
+
+        y = graph.bottom + 6
+        for stats in self.get_top_elements():
+            text = "%s  d %.2f  e %.2f  u %.2f" % (
+                stats["class"], stats["draw"], stats["event"], stats["update"])
+            screen.blit(self._font.render(text, True, WHITE), (rect.x + 6, y))
+            y += 16
@@ -0,0 +1,249 @@
+"""
+Frame scheduling for SUILib applications
+
+This module provides the FrameScheduler class used by the Application main loop
+to run View.update() at a fixed rate, cap rendering to a target FPS and keep
+the work done in one frame within a time budget. Work which does not fit into
+the budget of a frame is deferred to the next one. The scheduler also collects
+telemetry about frame times, missed frames and dropped update ticks.
+"""
+
+import math
+from collections import deque
+
+
+class FrameScheduler:
+    """
+    Fixed-timestep scheduler decoupling updates from rendering.
+
+    All times are in milliseconds (as returned by pygame.time.get_ticks()).
+
+    Attributes:
+        update_interval (float): Time between two update ticks.
+        frame_interval (float): Minimal time between two rendered frames (0 = uncapped).
+        frame_budget (float): Time available for the work of one frame.
+        max_catch_up (int): Maximum number of update ticks run in one frame, older ticks are dropped.
+    """
+
+    def __init__(self, update_rate: int = 60, fps: int = 60, frame_budget: float = None, max_catch_up: int = 5):
+        """
+        Initialize the frame scheduler.
+
+        Args:
+            update_rate (int): Number of update ticks per second.
+            fps (int): Maximum number of rendered frames per second (0 or None = uncapped).
+            frame_budget (float, optional): Time budget of one frame in milliseconds.
+                Defaults to the frame interval (or the update interval if FPS is uncapped).
+            max_catch_up (int): Maximum number of update ticks run in one frame.
+        """
+        self.configure(update_rate, fps, frame_budget, max_catch_up)
+        self._deferred = deque()
+        self._next_update = 0.0
+        self._last_render = None
+        self._frame_start = 0.0
+        self.reset_stats()
+
+    def configure(self, update_rate: int = 60, fps: int = 60, frame_budget: float = None, max_catch_up: int = 5):
+        """
+        Change the update rate, FPS cap and frame budget of the scheduler.
+
+        Args:
+            update_rate (int): Number of update ticks per second.
+            fps (int): Maximum number of rendered frames per second (0 or None = uncapped).
+            frame_budget (float, optional): Time budget of one frame in milliseconds.
+            max_catch_up (int): Maximum number of update ticks run in one frame.
+        """
+        self.update_interval = 1000.0 / max(update_rate, 1)
+        self.frame_interval = 1000.0 / fps if fps else 0.0
+        if frame_budget is None:
+            frame_budget = self.frame_interval if self.frame_interval > 0 else self.update_interval
+        self.frame_budget = frame_budget
+        self.max_catch_up = max(max_catch_up, 1)
+
+    def reset(self, now: float):
+        """
+        Restart the update clock, e.g. after the loop was idle.
+        The first update tick is due immediately.
+
+        Args:
+            now (float): Current time.
+        """
+        self._next_update = now
+
+    def reset_stats(self):
+        """
+        Reset all collected telemetry.
+        """
+        self._stats = {
+            "frames": 0,
+            "rendered_frames": 0,
+            "updates": 0,
+            "missed_frames": 0,
+            "dropped_updates": 0,
+            "deferred_tasks": 0,
+            "last_frame_time": 0.0,
+            "avg_frame_time": 0.0,
+            "max_frame_time": 0.0,
+            "fps": 0.0
+        }
+
+    def get_stats(self) -> dict:
+        """
+        Get the collected frame telemetry.
+
+        Returns:
+            dict: Counters (frames, rendered_frames, updates, missed_frames, dropped_updates,
+                deferred_tasks), frame times in milliseconds (last_frame_time, avg_frame_time,
+                max_frame_time), measured fps and the number of pending deferred tasks.
+        """
+        stats = dict(self._stats)
+        stats["pending_tasks"] = len(self._deferred)
+        return stats
+
+    def begin_frame(self, now: float):
+        """
+        Mark the start of the work of a frame.
+
+        Args:
+            now (float): Current time.
+        """
+        self._frame_start = now
+
+    def end_frame(self, now: float, rendered: bool):
+        """
+        Mark the end of the work of a frame and update telemetry.
+
+        Args:
+            now (float): Current time.
+            rendered (bool): True if the frame was rendered.
+        """
+        frame_time = now - self._frame_start
+        stats = self._stats
+        stats["frames"] += 1
+        stats["last_frame_time"] = frame_time
+        stats["avg_frame_time"] += (frame_time - stats["avg_frame_time"]) * 0.1
+        stats["max_frame_time"] = max(stats["max_frame_time"], frame_time)
+        if frame_time > self.frame_budget:
+            stats["missed_frames"] += 1
+        if rendered:
+            if self._last_render is not None and now > self._last_render:
+                fps = 1000.0 / (now - self._last_render)
+                stats["fps"] += (fps - stats["fps"]) * 0.1
+            stats["rendered_frames"] += 1
+            self._last_render = now
+
+    def time_left(self, now: float) -> float:
+        """
+        Get the remaining time budget of the current frame.
+
+        Args:
+            now (float): Current time.
+
+        Returns:
+            float: Remaining time in milliseconds (negative if the budget is exceeded).
+        """
+        return self.frame_budget - (now - self._frame_start)
+
+    def pending_updates(self, now: float) -> int:
+        """
+        Get the number of update ticks due at the given time.
+
+        If more than max_catch_up ticks are due, the oldest ones are dropped.
+
+        Args:
+            now (float): Current time.
+
+        Returns:
+            int: Number of update ticks to run.
+        """
+        if now < self._next_update:
+            return 0
+        count = int((now - self._next_update) // self.update_interval) + 1
+        if count > self.max_catch_up:
+            dropped = count - self.max_catch_up
+            self._stats["dropped_updates"] += dropped
+            self._next_update += dropped * self.update_interval
+            count = self.max_catch_up
+        return count
+
+    def consume_update(self):
+        """
+        Mark one due update tick as done.
+        """
+        self._next_update += self.update_interval
+        self._stats["updates"] += 1
+
+    def render_due(self, now: float) -> bool:
+        """
+        Check whether a frame may be rendered without exceeding the target FPS.
+
+        Args:
+            now (float): Current time.
+
+        Returns:
+            bool: True if rendering is allowed now.
+        """
+        if self._last_render is None or self.frame_interval <= 0:
+            return True
+        return now - self._last_render >= self.frame_interval
+
+    def wait_time(self, now: float, active: bool, render_pending: bool):
+        """
+        Get how long the main loop may wait for events.
+
+        Args:
+            now (float): Current time.
+            active (bool): True if content is animated or work is pending, so update ticks must keep running.
+            render_pending (bool): True if a frame is waiting to be rendered.
+
+        Returns:
+            int or None: Time to wait in milliseconds, None to block until the next event.
+        """
+        if len(self._deferred) != 0:
+            return 0
+        wait = None
+        if active:
+            wait = self._next_update - now
+        if render_pending and self._last_render is not None and self.frame_interval > 0:
+            render_wait = self._last_render + self.frame_interval - now
+            wait = render_wait if wait is None else min(wait, render_wait)
+        elif render_pending:
+            wait = 0
+        if wait is None:
+            return None
+        return max(0, int(math.ceil(wait)))
+
+    def defer(self, task):
+        """
+        Defer a task to be run in a later frame, when there is time left in the frame budget.
+
+        Args:
+            task (callable): Function without arguments.
+        """
+        self._deferred.append(task)
+
+    def has_deferred(self) -> bool:
+        """
+        Check whether deferred tasks are waiting.
+
+        Returns:
+            bool: True if at least one task is pending.
+        """
+        return len(self._deferred) != 0
+
+    def run_deferred(self, clock):
+        """
+        Run deferred tasks while the frame budget allows it.
+
+        At least one task is run per frame so deferred work always progresses,
+        tasks which do not fit are kept for the next frame.
+
+        Args:
+            clock (callable): Function returning the current time.
+        """
+        first = True
+        while len(self._deferred) != 0 and (first or self.time_left(clock()) > 0):
+            task = self._deferred.popleft()
+            task()
+            self._stats["deferred_tasks"] += 1
+            first = False
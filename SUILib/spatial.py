@@ -0,0 +1,143 @@
+"""
+Spatial index for SUILib views
+
+This module provides the SpatialGrid class, a uniform grid over element
+rectangles used by View to find the GUI elements under the mouse cursor
+without testing every element of the view.
+"""
+
+import pygame
+
+
+class SpatialGrid:
+    """
+    Uniform grid mapping rectangles of items to the cells they overlap.
+
+    Attributes:
+        cell_size (int): Size of one grid cell in pixels.
+    """
+
+    def __init__(self, cell_size: int = 128):
+        """
+        Initialize an empty grid.
+
+        Args:
+            cell_size (int): Size of one grid cell in pixels.
+        """
+        self.cell_size = max(int(cell_size), 1)
+        self._cells = {}
+        self._items = {}
+
+    def __len__(self) -> int:
+        """
+        Get the number of items in the grid.
+
+        Returns:
+            int: Number of items.
+        """
+        return len(self._items)
+
+    def __contains__(self, item) -> bool:
+        """
+        Check whether an item is indexed.
+
+        Returns:
+            bool: True if the item is in the grid.
+        """
+        return item in self._items
+
+    def clear(self):
+        """
+        Remove all items from the grid.
+        """
+        self._cells = {}
+        self._items = {}
+
+    def insert(self, item, rect: pygame.Rect):
+        """
+        Insert an item into the grid or move it to a new rectangle.
+
+        Args:
+            item: The indexed object (must be hashable).
+            rect (pygame.Rect): Area of the item.
+        """
+        rect = pygame.Rect(rect)
+        entry = self._items.get(item)
+        if entry is not None:
+            if entry[0] == rect:
+                return
+            self.remove(item)
+        cells = self._cells_of(rect)
+        for cell in cells:
+            bucket = self._cells.get(cell)
+            if bucket is None:
+                bucket = set()
+                self._cells[cell] = bucket
+            bucket.add(item)
+        self._items[item] = (rect, cells)
+
+    def remove(self, item):
+        """
+        Remove an item from the grid (does nothing if the item is not indexed).
+
+        Args:
+            item: The indexed object.
+        """
+        entry = self._items.pop(item, None)
+        if entry is None:
+            return
+        for cell in entry[1]:
+            bucket = self._cells.get(cell)
+            if bucket is not None:
+                bucket.discard(item)
+                if len(bucket) == 0:
+                    del self._cells[cell]
+
+    def query_point(self, x: int, y: int) -> list:
+        """
+        Find all items whose rectangle contains a point.
+
+        Args:
+            x (int): X coordinate.
+            y (int): Y coordinate.
+
+        Returns:
+            list: Items at the point (in no particular order).
+        """
+        bucket = self._cells.get((int(x) // self.cell_size, int(y) // self.cell_size))
+        if bucket is None:
+            return []
+        return [item for item in bucket if self._items[item][0].collidepoint(x, y)]
+
+    def query_rect(self, rect: pygame.Rect) -> set:
+        """
+        Find all items whose rectangle intersects an area.
+
+        Args:
+            rect (pygame.Rect): The area.
+
+        Returns:
+            set: Items intersecting the area.
+        """
+        rect = pygame.Rect(rect)
+        result = set()
+        for cell in self._cells_of(rect):
+            bucket = self._cells.get(cell)
+            if bucket is not None:
+                for item in bucket:
+                    if item not in result and self._items[item][0].colliderect(rect):
+                        result.add(item)
+        return result
+
+    def _cells_of(self, rect: pygame.Rect) -> list:
+        """
+        Get the grid cells overlapped by a rectangle.
+        """
+        if rect.width <= 0 or rect.height <= 0:
+            return []
+        size = self.cell_size
+        return [
+            (cx, cy)
+            for cx in range(rect.left // size, (rect.right - 1) // size + 1)
+            for cy in range(rect.top // size, (rect.bottom - 1) // size + 1)
+        ]
@@ -6,10 +6,160 @@ and processing style definitions for all GUI elements in a SUILib-based applicat
 Styles are typically loaded from JSON files and support both dark and light
 themes. The StyleManager enables easy theme switching and ensures consistent
 styling across the entire framework.
+
+Styles are compiled once when the stylesheet is loaded into immutable Style
+objects, which are shared by all elements using them. For the draw methods a
+style can be compiled into a StyleRecord with attribute access
+(style.body.background_color) and precomputed derived colors.
 """
 
 import os
+import keyword
 from .utils import *
+from .colors import color_change
+
+# Derived colors precomputed for every color of a style record: suffix -> function
+DERIVED_COLORS = {
+    # background of hovered / selected elements
+    "hover": lambda c: color_change(c, -0.2 if c[0] > 128 else 0.6),
+    # background of focused (edited) elements
+    "focus": lambda c: color_change(c, 0.4 if c[0] > 128 else 0.7),
+    # lighter variant for pressed / active parts (toggled switch, slider bar)
+    "pressed": lambda c: color_change(c, 0.8),
+    # darker variant for lines and separators (table column lines)
+    "shade": lambda c: color_change(c, -0.5),
+}
+
+_record_classes = {}
+
+
+class StyleRecord:
+    """
+    Compiled style with attribute access, for draw methods.
+
+    Every attribute of the style is a slot of the record (nested styles are
+    records too) and every color has the derived colors of DERIVED_COLORS
+    precomputed with the suffix "_<name>" (e.g. background_color_hover).
+    Records are created by compile_record() and must not be modified.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "StyleRecord(%s)" % ", ".join(
+            "%s=%r" % (name, getattr(self, name)) for name in self.__slots__)
+
+
+def compile_record(style: dict) -> StyleRecord:
+    """
+    Compile a processed style (colors as tuples) into a StyleRecord.
+
+    Attributes whose names are not valid identifiers are skipped. Record classes
+    are shared by all styles with the same attributes.
+
+    Args:
+        style (dict): The style (or Style).
+
+    Returns:
+        StyleRecord: The record.
+    """
+    values = {}
+    for tag, value in style.items():
+        if not tag.isidentifier() or keyword.iskeyword(tag):
+            continue
+        if isinstance(value, dict):
+            values[tag] = style_record(value)
+        else:
+            values[tag] = value
+            if "color" in tag and isinstance(value, tuple) and len(value) >= 3:
+                for suffix, derive in DERIVED_COLORS.items():
+                    values.setdefault(tag + "_" + suffix, derive(value))
+
+    fields = tuple(values.keys())
+    cls = _record_classes.get(fields)
+    if cls is None:
+        cls = type("StyleRecord", (StyleRecord,), {"__slots__": fields})
+        _record_classes[fields] = cls
+    record = cls()
+    for name, value in values.items():
+        setattr(record, name, value)
+    return record
+
+
+def style_record(style: dict) -> StyleRecord:
+    """
+    Get the record of a style: the shared record of a compiled Style, or a new
+    record of a plain style dictionary.
+
+    Args:
+        style (dict): The style.
+
+    Returns:
+        StyleRecord: The record, None if the style is None.
+    """
+    if style is None:
+        return None
+    if isinstance(style, Style):
+        return style.get_record()
+    return compile_record(style)
+
+
+class Style(dict):
+    """
+    Immutable compiled style, shared by all GUI elements using it.
+
+    Behaves like a read-only dict; copy() returns a mutable (deep) copy
+    which can be modified and passed to an element as its own style.
+    copy.copy() and copy.deepcopy() return the same mutable copy, pickling
+    preserves the Style.
+    """
+
+    __slots__ = ("_record",)
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Style objects are shared and immutable, modify a copy() instead")
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def copy(self) -> dict:
+        """
+        Get a mutable copy of the style (nested styles are copied too).
+
+        Returns:
+            dict: The copy.
+        """
+        return {tag: value.copy() if isinstance(value, Style) else value for tag, value in self.items()}
+
+    def __copy__(self) -> dict:
+        return self.copy()
+
+    def __deepcopy__(self, memo) -> dict:
+        return self.copy()
+
+    def __reduce__(self):
+        # rebuilt from the items, the record is compiled again on demand
+        return (Style, (dict(self),))
+
+    def get_record(self) -> "StyleRecord":
+        """
+        Get the StyleRecord of this style (compiled on the first call and shared).
+
+        Returns:
+            StyleRecord: The record.
+        """
+        try:
+            return self._record
+        except AttributeError:
+            self._record = compile_record(self)
+            return self._record
+
 
 class StyleManager:
     """
@@ -24,7 +174,8 @@ class StyleManager:
 
     Instance Attributes:
         styles_path (str): Path to the current stylesheet.
-        styles (dict): Loaded and processed styles.
+        styles (dict): Styles loaded from the stylesheet (before compilation).
+        version (int): Incremented every time the styles are compiled (loaded or reloaded).
     """
 
     __modele_path = os.path.dirname(os.path.abspath(__file__))
@@ -40,6 +191,9 @@ class StyleManager:
         """
         self.styles_path = styles_path
         self.styles = {}
+        self.version = 0
+        self._compiled = {}
+        self._class_styles = {}
 
     def init(self):
         """
@@ -55,24 +209,85 @@ class StyleManager:
             styles_path (str): Path to the JSON file with styles for all GUI elements.
 
         Side Effects:
-            Updates self.styles with the processed styles from the file.
+            Updates self.styles with the styles from the file and compiles them.
         """
         self.styles = load_config(styles_path)
+        self.compile_styles()
+
+    def compile_styles(self):
+        """
+        Compile all loaded styles into shared Style objects (call it after modifying self.styles).
+        """
+        self._compiled = {name: self.compile_style(style) for name, style in self.styles.items()}
+        for style in self._compiled.values():
+            style.get_record()
+        self._class_styles = {}
+        self.version += 1
+
+    def compile_style(self, style: dict) -> Style:
+        """
+        Process a style and freeze it (including its nested styles) into a Style object.
+
+        Args:
+            style (dict): The style dictionary from the stylesheet.
+
+        Returns:
+            Style: The compiled style.
+        """
+        return self._freeze(self.process_style(style))
+
+    def _freeze(self, style: dict) -> Style:
+        """
+        Internal: Convert a processed style and its nested styles into Style objects.
+        """
+        return Style({
+            tag: self._freeze(value) if isinstance(value, dict) else value
+            for tag, value in style.items()
+        })
 
     def get_style_with_name(self, name) -> dict:
         """
-        Retrieve and process a style dictionary by its name from the stylesheet.
+        Retrieve a compiled style by its name from the stylesheet.
+
+        The returned style is shared and immutable (see Style); use its copy()
+        to get a modifiable dictionary.
 
         Args:
             name (str): Name of the style to retrieve.
 
         Returns:
-            dict: The processed style dictionary, or None if not found.
+            Style: The compiled style, or None if not found.
         """
-        if name not in self.styles.keys():
-            return None
-        else:
-            return self.process_style(self.styles[name])
+        return self._compiled.get(name)
+
+    def get_style_for_class(self, cls) -> dict:
+        """
+        Resolve the style of a GUI element class: the style named after the class,
+        or after the nearest base class in its MRO which has a style.
+
+        The result is cached per class until the styles are compiled again.
+
+        Args:
+            cls (type): The element class.
+
+        Returns:
+            Style: The compiled style, or None if not found.
+        """
+        try:
+            return self._class_styles[cls]
+        except KeyError:
+            pass
+        style = self._compiled.get(cls.__name__)
+        if not style:
+            for base in cls.__mro__[1:]:
+                if base is object:
+                    continue
+                base_style = self._compiled.get(base.__name__)
+                if base_style:
+                    style = base_style
+                    break
+        self._class_styles[cls] = style
+        return style
 
     def process_style(self, style) -> dict:
         """
@@ -0,0 +1,245 @@
+"""
+Rendered text cache for SUILib
+
+This module provides the TextCache class and the process-wide cache used by
+the built-in elements. Surfaces returned by font.render() are cached by
+(font, text, antialias, color) and reused by later frames; the least recently
+used surfaces are evicted when the cache exceeds its size budget in bytes.
+Text measurements (font.size()) are memoized the same way, limited by the
+number of entries.
+"""
+
+from collections import OrderedDict
+import pygame
+
+
+class TextCache:
+    """
+    LRU cache of rendered text surfaces with a byte-size budget.
+
+    Cached surfaces are shared, they must not be modified by the caller.
+
+    Attributes:
+        budget (int): Maximum total size of the cached surfaces in bytes.
+        max_sizes (int): Maximum number of memoized text measurements.
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups which rendered the text.
+        evictions (int): Number of surfaces evicted to keep the budget.
+        size_hits (int): Number of measurements served from the cache.
+        size_misses (int): Number of measurements done by the font.
+    """
+
+    def __init__(self, budget: int = 8 * 1024 * 1024, max_sizes: int = 65536):
+        """
+        Initialize an empty cache.
+
+        Args:
+            budget (int): Maximum total size of the cached surfaces in bytes.
+            max_sizes (int): Maximum number of memoized text measurements.
+        """
+        self.budget = budget
+        self.max_sizes = max_sizes
+        self._entries = OrderedDict()
+        self._sizes = OrderedDict()
+        self._size = 0
+        self.reset_stats()
+
+    def __len__(self) -> int:
+        """
+        Get the number of cached surfaces.
+
+        Returns:
+            int: Number of cached surfaces.
+        """
+        return len(self._entries)
+
+    def reset_stats(self):
+        """
+        Reset the hit, miss and eviction counters.
+        """
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size_hits = 0
+        self.size_misses = 0
+
+    def render(self, font: pygame.font.Font, text: str, antialias, color) -> pygame.Surface:
+        """
+        Get the rendered text, render it with font.render() only if it is not cached.
+
+        Args:
+            font (pygame.font.Font): The font.
+            text (str): The text.
+            antialias: True to render antialiased text.
+            color (tuple): Text color.
+
+        Returns:
+            pygame.Surface: The rendered text (shared, do not modify).
+        """
+        key = (font, text, bool(antialias), tuple(color))
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        size = self.surface_size(surface)
+        if size > self.budget:
+            # never evict the whole cache because of one huge text
+            return surface
+        self._entries[key] = surface
+        self._size += size
+        while self._size > self.budget:
+            _, old = self._entries.popitem(last=False)
+            self._size -= self.surface_size(old)
+            self.evictions += 1
+        return surface
+
+    def size(self, font: pygame.font.Font, text: str) -> tuple:
+        """
+        Get the size of rendered text, measure it with font.size() only if it is not cached.
+
+        Args:
+            font (pygame.font.Font): The font.
+            text (str): The text.
+
+        Returns:
+            tuple: Width and height of the text in pixels.
+        """
+        key = (font, text)
+        size = self._sizes.get(key)
+        if size is not None:
+            self._sizes.move_to_end(key)
+            self.size_hits += 1
+            return size
+
+        self.size_misses += 1
+        size = font.size(text)
+        self._sizes[key] = size
+        if len(self._sizes) > self.max_sizes:
+            self._sizes.popitem(last=False)
+        return size
+
+    def set_budget(self, budget: int):
+        """
+        Change the size budget, surfaces over the new budget are evicted immediately.
+
+        Args:
+            budget (int): Maximum total size of the cached surfaces in bytes.
+        """
+        self.budget = budget
+        while self._size > self.budget and len(self._entries) != 0:
+            _, old = self._entries.popitem(last=False)
+            self._size -= self.surface_size(old)
+            self.evictions += 1
+
+    def clear(self):
+        """
+        Drop all cached surfaces (the statistics are kept).
+        """
+        self._entries = OrderedDict()
+        self._sizes = OrderedDict()
+        self._size = 0
+
+    def get_stats(self) -> dict:
+        """
+        Get statistics of the cache.
+
+        Returns:
+            dict: Dictionary with keys entries, size (bytes), budget (bytes), hits,
+                misses, evictions, hit_rate (0.0 - 1.0) and sizes, size_hits, size_misses
+                (memoized measurements).
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "size": self._size,
+            "budget": self.budget,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "sizes": len(self._sizes),
+            "size_hits": self.size_hits,
+            "size_misses": self.size_misses,
+        }
+
+    @staticmethod
+    def surface_size(surface: pygame.Surface) -> int:
+        """
+        Get the size of the pixel data of a surface.
+
+        Args:
+            surface (pygame.Surface): The surface.
+
+        Returns:
+            int: Size in bytes.
+        """
+        return surface.get_pitch() * surface.get_height()
+
+
+# Cache shared by all elements of all applications
+text_cache = TextCache()
+
+
+def render_text(font: pygame.font.Font, text: str, antialias, color) -> pygame.Surface:
+    """
+    Render text through the global text cache (see TextCache.render()).
+
+    Args:
+        font (pygame.font.Font): The font.
+        text (str): The text.
+        antialias: True to render antialiased text.
+        color (tuple): Text color.
+
+    Returns:
+        pygame.Surface: The rendered text (shared, do not modify).
+    """
+    return text_cache.render(font, text, antialias, color)
+
+
+def text_size(font: pygame.font.Font, text: str) -> tuple:
+    """
+    Measure text through the global text cache (see TextCache.size()).
+
+    Args:
+        font (pygame.font.Font): The font.
+        text (str): The text.
+
+    Returns:
+        tuple: Width and height of the text in pixels.
+    """
+    return text_cache.size(font, text)
+
+
+def draw_text(surface: pygame.Surface, font: pygame.font.Font, text: str, antialias, color, pos: tuple) -> pygame.Rect:
+    """
+    Draw text onto a surface.
+
+    Fonts of the freetype backend draw the text directly onto the surface (respecting its
+    clip area), other fonts blit the surface from the global text cache. Text starting
+    outside the clip area (e.g. scrolled out rows of a table) is skipped.
+
+    Args:
+        surface (pygame.Surface): Target surface.
+        font (pygame.font.Font): The font (or fonts.FreetypeFont).
+        text (str): The text.
+        antialias: True to render antialiased text.
+        color (tuple): Text color.
+        pos (tuple): Top left corner of the text.
+
+    Returns:
+        pygame.Rect: Area covered by the text.
+    """
+    clip = surface.get_clip()
+    if pos[0] >= clip.right or pos[1] >= clip.bottom or pos[1] + font.get_height() <= clip.top:
+        return pygame.Rect(int(pos[0]), int(pos[1]), 0, 0)
+    if not hasattr(font, "render_to"):
+        return surface.blit(text_cache.render(font, text, antialias, color), pos)
+    if clip.size == surface.get_size():
+        return font.render_to(surface, pos, text, antialias, color)
+    # freetype ignores the clip area of the target surface
+    rect = font.render_to(surface.subsurface(clip), (pos[0] - clip.x, pos[1] - clip.y), text, antialias, color)
+    return rect.move(clip.x, clip.y)
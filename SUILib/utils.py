@@ -16,6 +16,7 @@ import matplotlib
 import matplotlib.pyplot as plt
 import matplotlib.backends.backend_agg as agg
 import pylab
+from .executor import get_shared_executor
 
 def overrides(interface_class):
     """
@@ -54,6 +55,25 @@ def in_rect(x: int, y: int, rect: pygame.Rect) -> bool:
         return False
 
 
+def clipped_subsurface(surface: pygame.Surface, rect: pygame.Rect) -> pygame.Surface:
+    """
+    Create a subsurface that keeps the clipping area of its parent surface.
+
+    A plain subsurface ignores the clip rect of the surface it was taken from,
+    so drawing into it could leak outside of the region being redrawn.
+
+    Args:
+        surface (pygame.Surface): Parent surface.
+        rect (pygame.Rect): Area of the subsurface in parent coordinates.
+
+    Returns:
+        pygame.Surface: The subsurface with the parent's clip translated into it.
+    """
+    sub = surface.subsurface(rect)
+    sub.set_clip(surface.get_clip().move(-rect[0], -rect[1]))
+    return sub
+
+
 def generate_signal(ms_periode: int) -> bool:
     """
     Generate a periodic boolean signal: (ms_periode) True -> (ms_periode) False -> ...
@@ -67,6 +87,31 @@ def generate_signal(ms_periode: int) -> bool:
     return round((time() * 1000) / ms_periode) % 2 == 0
 
 
+def coalesce_mouse_motion(events: list) -> list:
+    """
+    Merge runs of consecutive MOUSEMOTION events into a single event.
+
+    The merged event keeps the attributes of the last event of the run (position,
+    buttons) and the summed relative movement of the whole run.
+
+    Args:
+        events (list): List of pygame events in queue order.
+
+    Returns:
+        list: List of events with consecutive mouse motions merged.
+    """
+    result = []
+    for event in events:
+        if event.type == pygame.MOUSEMOTION and len(result) != 0 and result[-1].type == pygame.MOUSEMOTION:
+            last = result[-1]
+            attrs = event.dict.copy()
+            attrs["rel"] = (last.rel[0] + event.rel[0], last.rel[1] + event.rel[1])
+            result[-1] = pygame.event.Event(pygame.MOUSEMOTION, attrs)
+        else:
+            result.append(event)
+    return result
+
+
 def load_image(img_path: str) -> pygame.Surface:
     """
     Load an image from the filesystem as a pygame Surface.
@@ -146,10 +191,15 @@ def get_display_height() -> int:
 
 def run_task_async(task):
     """
-    Run a function asynchronously in a new thread.
+    Run a function asynchronously in the shared worker thread pool.
+
+    Prefer Application.run_task(), which delivers the result to the UI thread.
 
     Args:
-        task (function): Function to be run in a separate thread, expected to accept a single argument.
+        task (function): Function to be run in a worker thread, expected to accept a single argument
+            (always 1, kept for compatibility).
+
+    Returns:
+        concurrent.futures.Future: Future of the task.
     """
-    task = threading.Thread(target=task, args=(1,))
-    task.start()
\ No newline at end of file
+    return get_shared_executor().submit(task, 1)
\ No newline at end of file
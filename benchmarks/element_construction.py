@@ -0,0 +1,105 @@
+"""
+Benchmark of GUI element construction
+
+Constructs 10 000 elements with the default (stylesheet) styles in a headless
+application and prints the construction time per element class, the time of
+the style resolution alone and the time of a stylesheet reload.
+
+Usage:
+    python benchmarks/element_construction.py [count]
+"""
+
+import os
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from SUILib.application import Application, View
+from SUILib.stylemanager import StyleManager
+from SUILib.utils import overrides
+from SUILib.elements import *
+
+
+class BenchmarkView(View):
+    def __init__(self):
+        super().__init__("Benchmark", 1)
+
+    @overrides(View)
+    def create_evt(self):
+        pass
+
+    @overrides(View)
+    def close_evt(self):
+        pass
+
+    @overrides(View)
+    def open_evt(self):
+        pass
+
+    @overrides(View)
+    def hide_evt(self):
+        pass
+
+    @overrides(View)
+    def reload_style_evt(self):
+        pass
+
+
+# element factories (all elements use the style of their class from the stylesheet)
+FACTORIES = {
+    "Button": lambda view, i: Button(view, None, "Button %d" % i, 120, 40),
+    "Label": lambda view, i: Label(view, None, "Label %d" % i),
+    "CheckBox": lambda view, i: CheckBox(view, None, "Check %d" % i, i % 2 == 0),
+    "ToggleButton": lambda view, i: ToggleButton(view, None, "Toggle %d" % i),
+    "TextInput": lambda view, i: TextInput(view, None, "Text %d" % i, 200, 40),
+    "Slider": lambda view, i: Slider(view, None, 50, 0, 100, 200, 20),
+    "Panel": lambda view, i: Panel(view, None, 200, 200),
+    "Canvas": lambda view, i: Canvas(view, None, 200, 200),
+}
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+    view = BenchmarkView()
+    app = Application([view])
+    app.init(800, 600, "Benchmark", "", headless=True)
+    app.start(view)
+
+    report = app.get_startup_report()
+    print("startup: init %.1f ms (font discovery %.1f ms, font cache hit: %s)" % (
+        report["init_total"], report["font_discovery"], report.get("font_cache_hit")))
+
+    per_class = count // len(FACTORIES)
+    elements = []
+    total = 0.0
+    print("constructing %d elements" % (per_class * len(FACTORIES)))
+    for name, factory in FACTORIES.items():
+        start = perf_counter()
+        for i in range(per_class):
+            elements.append(factory(view, i))
+        elapsed = perf_counter() - start
+        total += elapsed
+        print("  %-14s %8.1f ms  %6.2f us/element" % (name, elapsed * 1000, elapsed / per_class * 1e6))
+    print("  %-14s %8.1f ms  %6.2f us/element" % ("total", total * 1000, total / len(elements) * 1e6))
+
+    sm = app.get_style_manager()
+    classes = [type(el) for el in elements]
+    start = perf_counter()
+    for cls in classes:
+        sm.get_style_for_class(cls)
+    elapsed = perf_counter() - start
+    print("style resolution: %.2f us/element" % (elapsed / len(classes) * 1e6))
+
+    view.add_gui_elements(elements)
+    start = perf_counter()
+    app.reload_style_sheet(StyleManager.DARK_THEME_CONFIG)
+    app.reload_element_styles()
+    print("stylesheet reload: %.1f ms" % ((perf_counter() - start) * 1000))
+
+    app.close()
+
+
+if __name__ == "__main__":
+    main()
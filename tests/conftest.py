@@ -0,0 +1,58 @@
+"""
+Shared fixtures of the SUILib test suite
+
+The tests run headless (SDL dummy video driver), see Application.init(headless=True).
+"""
+
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from SUILib.application import Application, View
+from SUILib.utils import overrides
+
+
+class EmptyView(View):
+    """
+    View without elements, the tests add their own.
+    """
+
+    def __init__(self, name: str = "Test", id: int = 1):
+        super().__init__(name, id)
+
+    @overrides(View)
+    def create_evt(self):
+        pass
+
+    @overrides(View)
+    def close_evt(self):
+        pass
+
+    @overrides(View)
+    def open_evt(self):
+        pass
+
+    @overrides(View)
+    def hide_evt(self):
+        pass
+
+    @overrides(View)
+    def reload_style_evt(self):
+        pass
+
+
+@pytest.fixture
+def view():
+    return EmptyView()
+
+
+@pytest.fixture
+def app(view):
+    app = Application([view])
+    # the font cache of the user is neither read nor rewritten by the tests
+    app.init(640, 480, "Test", "", headless=True, font_cache=False)
+    app.start(view)
+    yield app
+    app.close()
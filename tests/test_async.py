@@ -0,0 +1,84 @@
+"""
+Tests of the asyncio-cooperative main loop and coroutine callbacks
+"""
+
+import asyncio
+import pygame
+from SUILib.events import SUIEvents
+from SUILib.guielement import GUIElement
+from SUILib.utils import overrides
+
+
+class ClickArea(GUIElement):
+    """Element with the default event handling (click events)"""
+
+    def __init__(self, view):
+        super().__init__(view, 0, 0, 100, 100, {})
+
+    @overrides(GUIElement)
+    def draw(self, view, screen):
+        pass
+
+    @overrides(GUIElement)
+    def process_event(self, view, event):
+        super().process_event(view, event)
+
+    @overrides(GUIElement)
+    def update(self, view):
+        pass
+
+
+def test_run_async_runs_coroutine_callbacks(app, view, monkeypatch):
+    # the display of the other tests stays initialized
+    monkeypatch.setattr(pygame, "quit", lambda: None)
+    area = ClickArea(view)
+    view.add_gui_elements([area])
+    results = []
+    ticks = []
+
+    async def on_click(event):
+        await asyncio.sleep(0.01)
+        results.append(event.pos)
+
+    async def ticker():
+        while True:
+            ticks.append(True)
+            await asyncio.sleep(0.001)
+
+    area.add_event_callback(SUIEvents.EVENT_ON_CLICK, on_click)
+
+    async def main():
+        other = asyncio.ensure_future(ticker())
+        loop_task = asyncio.ensure_future(app.run_async(view, poll_interval=0.001))
+        await asyncio.sleep(0.01)
+        pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(10, 10), button=1))
+        for _ in range(500):
+            if len(results) != 0:
+                break
+            await asyncio.sleep(0.002)
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+        done = await asyncio.wait_for(loop_task, 2)
+        other.cancel()
+        return done
+
+    pygame.event.clear()
+    assert asyncio.run(main()) is True
+    assert results == [(10, 10)]
+    # other tasks of the event loop ran while the application was running
+    assert len(ticks) > 5
+    assert len(app._tasks) == 0
+
+
+def test_coroutine_callback_without_event_loop(app, view):
+    area = ClickArea(view)
+    view.add_gui_elements([area])
+    results = []
+
+    async def on_click(event):
+        results.append(event.pos)
+        return "done"
+
+    area.add_event_callback(SUIEvents.EVENT_ON_CLICK, on_click)
+    view.process_evt(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(10, 10), button=1))
+    # run to completion immediately
+    assert results == [(10, 10)]
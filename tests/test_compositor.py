@@ -0,0 +1,70 @@
+"""
+Tests of the overlay compositor (z-order and save-under of cached layers)
+"""
+
+import pygame
+from SUILib.compositor import Compositor, subtract_rect
+
+
+def fill(color, rect=None):
+    def callback(view, screen):
+        screen.fill(color, rect)
+    return callback
+
+
+def test_layers_are_drawn_in_z_order():
+    compositor = Compositor()
+    order = []
+    for z_index, name in ((5, "a"), (1, "b"), (5, "c"), (3, "d")):
+        compositor.push(z_index, lambda view, screen, name=name: order.append(name))
+    compositor.flush(None, pygame.Surface((10, 10)))
+    # same z-index keeps the queue order
+    assert order == ["b", "d", "a", "c"]
+    assert compositor.queue == []
+
+
+def test_damaged_layer_is_restored_from_saved_pixels():
+    screen = pygame.Surface((100, 100))
+    screen.fill((0, 0, 255))
+    compositor = Compositor()
+    owner = object()
+    layer = pygame.Rect(10, 10, 20, 20)
+    compositor.push(10, fill((255, 0, 0), layer), layer, owner)
+    compositor.flush(None, screen)
+    assert screen.get_at((15, 15))[:3] == (255, 0, 0)
+
+    # the owner (e.g. a combo box with an open popup) changes above and inside the layer
+    rest = compositor.damage(owner, pygame.Rect(10, 0, 20, 30))
+    assert rest == pygame.Rect(10, 0, 20, 10)
+    assert compositor.restore_damaged(screen) == [layer]
+    assert screen.get_at((15, 15))[:3] == (0, 0, 255)
+    # restored once
+    assert compositor.restore_damaged(screen) == []
+
+
+def test_changes_under_a_layer_drop_the_saved_pixels():
+    screen = pygame.Surface((100, 100))
+    compositor = Compositor()
+    owner = object()
+    layer = pygame.Rect(10, 10, 20, 20)
+    compositor.push(10, fill((255, 0, 0), layer), layer, owner)
+    compositor.flush(None, screen)
+    assert compositor.damage(owner, pygame.Rect(10, 0, 20, 30)) is not None
+
+    # another element changed underneath: the damaged layer must be redrawn normally
+    assert compositor.invalidate(pygame.Rect(12, 12, 4, 4)) == [layer]
+    assert compositor.restore_damaged(screen) == []
+    assert compositor.damage(owner, pygame.Rect(10, 0, 20, 30)) is None
+
+    # a layer which is not queued again is dropped when its area is redrawn
+    compositor.flush(None, screen, pygame.Rect(0, 0, 50, 50))
+    assert compositor.layers == {}
+
+
+def test_subtract_rect():
+    rect = pygame.Rect(0, 0, 10, 10)
+    assert subtract_rect(rect, pygame.Rect(0, 0, 10, 4)) == pygame.Rect(0, 4, 10, 6)
+    assert subtract_rect(rect, pygame.Rect(6, -5, 10, 20)) == pygame.Rect(0, 0, 6, 10)
+    assert subtract_rect(rect, pygame.Rect(20, 20, 5, 5)) == rect
+    # the rest is not a rectangle
+    assert subtract_rect(rect, pygame.Rect(2, 2, 4, 4)) is None
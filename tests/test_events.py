@@ -0,0 +1,75 @@
+"""
+Tests of the batched event processing of the main loop
+"""
+
+import pygame
+from SUILib.guielement import GUIElement
+from SUILib.utils import coalesce_mouse_motion, overrides
+
+
+def motion(pos, rel):
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=rel, buttons=(0, 0, 0))
+
+
+def button(type, pos):
+    return pygame.event.Event(type, pos=pos, button=1)
+
+
+class Recorder(GUIElement):
+    """Element recording the events dispatched to it"""
+
+    def __init__(self, view):
+        super().__init__(view, 0, 0, 640, 480, {})
+        self.events = []
+
+    @overrides(GUIElement)
+    def draw(self, view, screen):
+        pass
+
+    @overrides(GUIElement)
+    def process_event(self, view, event):
+        self.events.append(event)
+
+    @overrides(GUIElement)
+    def update(self, view):
+        pass
+
+
+def test_coalesce_mouse_motion_keeps_order():
+    key = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, mod=0, unicode="a")
+    events = [
+        motion((1, 1), (1, 1)), motion((3, 2), (2, 1)),
+        button(pygame.MOUSEBUTTONDOWN, (3, 2)),
+        motion((4, 4), (1, 2)), motion((6, 4), (2, 0)), motion((7, 5), (1, 1)),
+        key,
+        button(pygame.MOUSEBUTTONUP, (7, 5)),
+        motion((8, 5), (1, 0)),
+    ]
+    result = coalesce_mouse_motion(events)
+    assert [event.type for event in result] == [
+        pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION,
+        pygame.KEYDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION]
+    # the merged motion has the last position and the summed movement
+    assert (result[0].pos, result[0].rel) == ((3, 2), (3, 2))
+    assert (result[2].pos, result[2].rel) == ((7, 5), (4, 3))
+    assert result[3] is key
+    assert (result[5].pos, result[5].rel) == ((8, 5), (1, 0))
+
+
+def test_batched_frame_dispatches_coalesced_events(app, view):
+    recorder = Recorder(view)
+    view.add_gui_elements([recorder])
+    app.enable_event_batching()
+    pygame.event.clear()
+    app.step([
+        motion((10, 10), (1, 0)), motion((20, 10), (10, 0)),
+        button(pygame.MOUSEBUTTONDOWN, (20, 10)),
+        motion((30, 10), (10, 0)), motion((40, 10), (10, 0)),
+        button(pygame.MOUSEBUTTONUP, (40, 10)),
+    ])
+    assert [(event.type, event.pos) for event in recorder.events] == [
+        (pygame.MOUSEMOTION, (20, 10)),
+        (pygame.MOUSEBUTTONDOWN, (20, 10)),
+        (pygame.MOUSEMOTION, (40, 10)),
+        (pygame.MOUSEBUTTONUP, (40, 10)),
+    ]
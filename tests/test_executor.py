@@ -0,0 +1,67 @@
+"""
+Tests of the background task executor
+"""
+
+import threading
+from time import perf_counter
+from SUILib.application import Application
+from SUILib.executor import TaskExecutor, get_shared_executor
+
+
+def test_shutdown_cancels_pending_tasks():
+    executor = TaskExecutor(max_threads=1)
+    release = threading.Event()
+    running = executor.submit(release.wait, 5)
+    pending = executor.submit(lambda: None)
+    executor.shutdown()
+    release.set()
+    assert pending.cancelled()
+    assert running.result(5) is True
+
+
+def test_callbacks_are_dispatched_on_ui_thread():
+    executor = TaskExecutor()
+    results = []
+    future = executor.submit(lambda x: x * 2, 21, callback=results.append)
+    future.result(5)
+    assert results == []
+    # the completion is queued by the worker thread right after the result is set
+    end = perf_counter() + 5
+    dispatched = 0
+    while dispatched == 0 and perf_counter() < end:
+        dispatched = executor.dispatch_completed()
+    assert dispatched == 1
+    assert results == [42]
+    assert not executor.has_pending()
+    executor.shutdown()
+
+
+def test_applications_do_not_share_the_executor(app):
+    other = Application([])
+    assert other.executor is not app.executor
+    assert app.executor is not get_shared_executor()
+
+    shared = get_shared_executor().submit(lambda: 1)
+    app.set_task_workers(2)
+    app.executor.shutdown()
+    assert shared.result(5) == 1
+    assert get_shared_executor().submit(lambda: 2).result(5) == 2
+
+
+def test_tasks_submitted_from_several_threads():
+    executor = TaskExecutor(max_threads=4)
+    results = []
+
+    def submit_many(offset):
+        for i in range(200):
+            executor.submit(lambda x: x, offset + i, callback=results.append)
+
+    threads = [threading.Thread(target=submit_many, args=(1000 * t,)) for t in range(4)]
+    for thread in threads:
+        thread.start()
+    end = perf_counter() + 10
+    while (any(thread.is_alive() for thread in threads) or executor.has_pending()) and perf_counter() < end:
+        executor.dispatch_completed()
+    assert sorted(results) == sorted(1000 * t + i for t in range(4) for i in range(200))
+    assert not executor.has_pending()
+    executor.shutdown()
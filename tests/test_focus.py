@@ -0,0 +1,92 @@
+"""
+Tests of focus tracking and pointer capture
+"""
+
+import pygame
+from SUILib.guielement import GUIElement
+from SUILib.utils import overrides
+
+
+class Recorder(GUIElement):
+    """Element with the default event handling (focus on click), records event types"""
+
+    def __init__(self, view, x):
+        super().__init__(view, x, 0, 100, 100, {})
+        self.events = []
+
+    @overrides(GUIElement)
+    def draw(self, view, screen):
+        pass
+
+    @overrides(GUIElement)
+    def process_event(self, view, event):
+        self.events.append(event.type)
+        super().process_event(view, event)
+
+    @overrides(GUIElement)
+    def update(self, view):
+        pass
+
+
+def click(view, pos):
+    view.process_evt(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1))
+    view.process_evt(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=1))
+
+
+def motion(view, pos):
+    view.process_evt(pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0)))
+
+
+def key(view):
+    view.process_evt(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, mod=0, unicode="a"))
+
+
+def test_focus_moves_with_clicks(app, view):
+    first = Recorder(view, 0)
+    second = Recorder(view, 200)
+    view.add_gui_elements([first, second])
+
+    click(view, (50, 50))
+    assert view.focus_manager.focused is first
+    first.events.clear()
+    second.events.clear()
+    key(view)
+    # keyboard events go only to the focused element
+    assert first.events == [pygame.KEYDOWN]
+    assert second.events == []
+
+    click(view, (250, 50))
+    assert view.focus_manager.focused is second
+    assert not first.focused and second.focused
+    first.events.clear()
+    key(view)
+    assert first.events == []
+    assert second.events[-1] == pygame.KEYDOWN
+
+    view.remove_gui_element(second)
+    assert view.focus_manager.focused is None
+
+
+def test_pointer_capture(app, view):
+    first = Recorder(view, 0)
+    second = Recorder(view, 200)
+    view.add_gui_elements([first, second])
+    motion(view, (500, 300))
+    assert first.events == [] and second.events == []
+
+    # a selected element (e.g. a dragged slider) gets pointer events outside of its area
+    motion(view, (50, 50))
+    first.select()
+    assert view.has_capture(first)
+    motion(view, (500, 300))
+    motion(view, (510, 300))
+    assert first.events == [pygame.MOUSEMOTION] * 3
+    assert second.events == []
+    assert view.focus_manager.get_cursor(None) == first.get_focused_cursor()
+
+    first.un_select()
+    assert not view.has_capture(first)
+    # the next event still reaches it (the release of the capture), then it stops
+    motion(view, (500, 300))
+    motion(view, (510, 300))
+    assert len(first.events) == 4
@@ -0,0 +1,63 @@
+"""
+Tests of the persistent font discovery cache
+"""
+
+import json
+import pygame.sysfont
+import pytest
+from SUILib import fontcache
+
+
+@pytest.fixture
+def sysfont(monkeypatch):
+    """Fresh (not yet initialized) pygame.sysfont tables"""
+    monkeypatch.setattr(pygame.sysfont, "Sysfonts", {})
+    monkeypatch.setattr(pygame.sysfont, "Sysalias", {})
+    monkeypatch.setattr(pygame.sysfont, "is_init", False)
+    return pygame.sysfont
+
+
+def write_cache(path, fonts, stamp=None):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"stamp": fontcache.get_cache_stamp() if stamp is None else stamp, "fonts": fonts}, f)
+
+
+def test_load_applies_cache(sysfont, tmp_path):
+    path = str(tmp_path / "fonts.json")
+    write_cache(path, {"testsans": {"00": "/fonts/TestSans.ttf", "10": "/fonts/TestSans-Bold.ttf"}})
+    assert fontcache.load_font_cache(path) is True
+    assert sysfont.is_init
+    assert sysfont.Sysfonts["testsans"][(True, False)] == "/fonts/TestSans-Bold.ttf"
+
+
+def test_load_without_reading_returns_false(sysfont, tmp_path):
+    path = str(tmp_path / "fonts.json")
+    assert fontcache.load_font_cache(path) is False
+    write_cache(path, {}, stamp=["outdated"])
+    assert fontcache.load_font_cache(path) is False
+    # already initialized by pygame: the file is not read
+    write_cache(path, {"testsans": {"00": "/fonts/TestSans.ttf"}})
+    sysfont.is_init = True
+    assert fontcache.load_font_cache(path) is False
+    assert "testsans" not in sysfont.Sysfonts
+
+
+def test_changed_pygame_internals_fall_back(sysfont, tmp_path, monkeypatch):
+    path = str(tmp_path / "fonts.json")
+    write_cache(path, {"testsans": {"00": "/fonts/TestSans.ttf"}})
+
+    def broken_aliases():
+        raise TypeError("changed signature")
+
+    calls = []
+    monkeypatch.setattr(sysfont, "create_aliases", broken_aliases)
+    monkeypatch.setattr(sysfont, "initsysfonts", lambda: calls.append(True))
+    assert fontcache.init_system_fonts(path) is False
+    assert calls == [True]
+    assert not sysfont.Sysfonts
+
+    monkeypatch.delattr(sysfont, "create_aliases")
+    calls.clear()
+    assert fontcache.init_system_fonts(path) is False
+    assert fontcache.load_font_cache(path) is False
+    assert calls == []
@@ -0,0 +1,82 @@
+"""
+Tests of the reference-counted font registry
+"""
+
+import pygame
+import pytest
+from SUILib import fonts
+from SUILib.elements import Button, Label
+from SUILib.fonts import FontRegistry, FreetypeFont, font_registry
+
+
+def test_registry_refcount(app):
+    registry = FontRegistry()
+    font = registry.acquire("arial", 20)
+    assert registry.acquire("arial", 20.0, 0) is font
+    assert registry.get_refcount("arial", 20) == 2
+    assert len(registry) == 1
+
+    registry.release(font)
+    assert registry.get_refcount("arial", 20) == 1
+    registry.release(font)
+    assert registry.get_refcount("arial", 20) == 0
+    assert len(registry) == 0
+    # released twice, unknown fonts are ignored
+    registry.release(font)
+    assert len(registry) == 0
+    assert registry.acquire("arial", 20) is not font
+
+
+def test_removed_elements_release_fonts(app, view):
+    style = app.get_style_manager().get_style_for_class(Button)
+    key = (style["font_name"], style["font_size"], style["font_bold"])
+    before = font_registry.get_refcount(*key)
+    buttons = [Button(view, None, "Button", 100, 40) for _ in range(3)]
+    view.add_gui_elements(buttons)
+    assert font_registry.get_refcount(*key) == before + 3
+
+    for button in buttons:
+        view.remove_gui_element(button)
+    assert font_registry.get_refcount(*key) == before
+
+
+def test_freetype_backend(app):
+    registry = FontRegistry()
+    regular = registry.acquire("arial", 20)
+    registry.set_backend("freetype")
+    font = registry.acquire("arial", 20)
+    assert isinstance(font, FreetypeFont)
+    assert not isinstance(regular, FreetypeFont)
+    # fonts of the backends are cached separately
+    assert registry.get_refcount("arial", 20) == 1
+    assert len(registry) == 2
+    width, height = font.size("Hello")
+    assert width > 0 and height > 0
+    assert font.render("Hello", True, (0, 0, 0)).get_size() == (width, height)
+
+    with pytest.raises(ValueError):
+        registry.set_backend("cairo")
+    assert registry.backend == "freetype"
+
+
+def test_freetype_backend_fallback(monkeypatch):
+    monkeypatch.setattr(fonts, "freetype", None)
+    registry = FontRegistry()
+    with pytest.warns(UserWarning):
+        registry.set_backend("freetype")
+    assert registry.backend == "font"
+
+
+def test_application_text_backend(app, view, monkeypatch):
+    monkeypatch.setattr(font_registry, "backend", font_registry.backend)
+    app.set_text_backend("freetype")
+    label = Label(view, None, "Label", x=10, y=10)
+    view.add_gui_elements([label])
+    assert isinstance(label.font, FreetypeFont)
+    app.request_repaint()
+    app.step()
+    # the text was drawn
+    rect = label.get_paint_rect()
+    assert rect.width > 0 and rect.height > 0
+    area = app.grab_pixels()[rect.left:rect.right, rect.top:rect.bottom]
+    assert (area != area[0, 0]).any()
@@ -0,0 +1,26 @@
+"""
+Tests of the rendering of the Graph element
+"""
+
+from SUILib.elements import Graph
+
+
+def test_builder_renders_on_set_and_resize(app, view):
+    graph = Graph(view, None, 200, 150)
+    view.add_gui_elements([graph])
+    calls = []
+
+    def builder(fig):
+        calls.append(tuple(fig.get_size_inches()))
+        fig.gca().plot([1, 2, 3])
+
+    graph.set_figure_builder_func(builder)
+    assert calls == [(2.0, 1.5)]
+    assert graph.graph is not None
+
+    # moving the graph does not render it again
+    graph.set_geometry(10, 10, 200, 150)
+    assert len(calls) == 1
+
+    graph.set_geometry(10, 10, 300, 200)
+    assert calls == [(2.0, 1.5), (3.0, 2.0)]
@@ -0,0 +1,55 @@
+"""
+Tests of the headless mode and of driving the application frame by frame
+"""
+
+import pygame
+from SUILib.guielement import GUIElement
+from SUILib.utils import overrides
+
+
+class ClickBox(GUIElement):
+    """Element which changes its color when clicked"""
+
+    def __init__(self, view):
+        super().__init__(view, 100, 100, 50, 50, {})
+        self.color = (255, 0, 0)
+
+    @overrides(GUIElement)
+    def draw(self, view, screen):
+        screen.fill(self.color, self.get_view_rect())
+
+    @overrides(GUIElement)
+    def process_event(self, view, event):
+        if event.type == pygame.MOUSEBUTTONDOWN and self.get_view_rect().collidepoint(event.pos):
+            self.color = (0, 255, 0)
+
+    @overrides(GUIElement)
+    def update(self, view):
+        pass
+
+
+def test_step_renders_injected_events(app, view):
+    box = ClickBox(view)
+    view.add_gui_elements([box])
+    assert app.headless
+    assert app.screen.get_size() == (640, 480)
+
+    surface = app.step()
+    assert surface is app.screen
+    pixels = app.grab_pixels()
+    assert pixels.shape == (640, 480, 3)
+    assert tuple(pixels[120, 120]) == (255, 0, 0)
+
+    app.step([pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(120, 120), button=1)])
+    assert tuple(app.grab_pixels()[120, 120]) == (0, 255, 0)
+    # outside of the box the view fill color stays
+    assert tuple(app.grab_pixels()[10, 10]) == tuple(app.get_view_fill_color(view))[:3]
+
+
+def test_grab_frame_is_a_copy(app, view):
+    view.add_gui_elements([ClickBox(view)])
+    app.step()
+    frame = app.grab_frame()
+    frame.fill((1, 2, 3))
+    assert app.screen.get_at((120, 120))[:3] == (255, 0, 0)
+    assert frame.get_size() == app.screen.get_size()
@@ -0,0 +1,226 @@
+"""
+Tests of the layout managers (geometry of the managed elements)
+"""
+
+import pygame
+from SUILib.elements import Button
+from SUILib.guielement import GUIElement
+from SUILib.utils import overrides
+from SUILib.application import Layout
+from SUILib.layout import AbsoluteLayout, FlexLayout, GridLayout
+
+
+def geometry(element):
+    return (element.get_x(), element.get_y(), element.get_width(), element.get_height())
+
+
+def resize(app, width, height):
+    app.process_events([pygame.event.Event(pygame.VIDEORESIZE, size=(width, height), w=width, h=height)])
+
+
+def test_absolute_layout(app, view):
+    layout = AbsoluteLayout(view)
+    first = Button(view, None, "First")
+    second = Button(view, None, "Second")
+    layout.add_element(first, ["10%", "20", "50%", "25%"])
+    layout.add_element(second, ["50", "50%"])
+    layout.layout(400, 200)
+    assert geometry(first) == (40, 20, 200, 50)
+    assert (second.get_x(), second.get_y()) == (50, 100)
+    # the compiled properties are owned by the layout
+    assert all(set(el) == {"element", "propt"} for el in layout.get_layout_elements())
+
+    # a new list of elements is compiled again
+    layout.set_elements([{"element": second, "propt": ["0", "0", "100%", "100%"]}])
+    layout.layout(300, 100)
+    assert geometry(second) == (0, 0, 300, 100)
+
+
+def test_absolute_layout_propt_edited_in_place(app, view):
+    layout = AbsoluteLayout(view)
+    button = Button(view, None, "Button")
+    propt = ["0", "0", "25%", "40"]
+    layout.add_element(button, propt)
+    layout.layout(400, 200)
+    assert geometry(button) == (0, 0, 100, 40)
+
+    propt[2] = "50%"
+    layout.invalidate_layout()
+    layout.layout(400, 200)
+    assert geometry(button) == (0, 0, 200, 40)
+
+
+def test_flex_layout_resize(app, view):
+    layout = FlexLayout(view, "row", gap=10, padding=5)
+    first = Button(view, None, "", 100, 40)
+    second = Button(view, None, "", 30, 40)
+    third = Button(view, None, "", 50, 40)
+    layout.add_element(first)
+    layout.add_element(second, {"grow": 1})
+    layout.add_element(third, {"align": "end"})
+    view.add_gui_elements([first, second, third])
+
+    resize(app, 400, 200)
+    assert geometry(first) == (5, 5, 100, 190)
+    assert geometry(second) == (115, 5, 220, 190)
+    assert geometry(third) == (345, 155, 50, 40)
+
+    resize(app, 600, 300)
+    assert geometry(first) == (5, 5, 100, 290)
+    assert geometry(second) == (115, 5, 420, 290)
+    assert geometry(third) == (545, 255, 50, 40)
+
+    # a larger intrinsic size takes space from the growing element
+    first.set_preferred_size(200, 40)
+    assert view.is_layout_pending()
+    app.process_events([])
+    assert geometry(second) == (215, 5, 320, 290)
+
+
+def test_grid_layout_resize(app, view):
+    layout = GridLayout(view, ["100", "1fr", "2fr"], ["40", "1fr"], gap=5, padding=5)
+    first = Button(view, None, "", 20, 20)
+    second = Button(view, None, "", 20, 20)
+    third = Button(view, None, "", 20, 20)
+    layout.add_element(first, {"column": 0, "row": 0})
+    layout.add_element(second, {"column": 1, "row": 0})
+    layout.add_element(third, {"column": 0, "row": 1, "column_span": 3})
+    view.add_gui_elements([first, second, third])
+
+    resize(app, 630, 300)
+    assert geometry(first) == (5, 5, 100, 40)
+    assert geometry(second) == (110, 5, 170, 40)
+    assert geometry(third) == (5, 50, 620, 245)
+
+    resize(app, 930, 400)
+    assert geometry(first) == (5, 5, 100, 40)
+    assert geometry(second) == (110, 5, 270, 40)
+    assert geometry(third) == (5, 50, 920, 345)
+
+
+def test_element_in_several_layouts(app, view):
+    button = Button(view, None, "", 50, 40)
+    row = FlexLayout(view, "row")
+    column = FlexLayout(view, "column")
+    row.add_element(button)
+    column.add_element(button)
+    view.add_gui_elements([button])
+    assert button.layout_owners == {row, column}
+    row.layout(400, 200)
+    column.layout(400, 200)
+
+    button.set_preferred_size(80, 60)
+    assert view.is_layout_pending()
+    assert row.needs_layout(400, 200)
+    assert column.needs_layout(400, 200)
+
+
+class Counter(GUIElement):
+    """Element counting its geometry updates, may move another element when resized"""
+
+    def __init__(self, view, follower=None):
+        self.follower = follower
+        self.rect_updates = 0
+        self.size_changes = 0
+        super().__init__(view, 0, 0, 10, 10, {})
+
+    @overrides(GUIElement)
+    def update_view_rect(self):
+        super().update_view_rect()
+        self.rect_updates += 1
+
+    @overrides(GUIElement)
+    def size_changed(self):
+        self.size_changes += 1
+        if self.follower is not None:
+            self.follower.set_geometry(x=self.get_x() + self.get_width())
+
+    @overrides(GUIElement)
+    def draw(self, view, screen):
+        pass
+
+    @overrides(GUIElement)
+    def process_event(self, view, event):
+        pass
+
+    @overrides(GUIElement)
+    def update(self, view):
+        pass
+
+
+def test_batch_layout_defers_geometry_changes(app, view):
+    follower = Counter(view)
+    element = Counter(view, follower)
+    view.add_gui_elements([element, follower])
+    element.rect_updates = follower.rect_updates = 0
+
+    with view.batch_layout():
+        element.set_x(5)
+        element.set_width(100)
+        with view.batch_layout():
+            element.set_height(50)
+            element.set_geometry(10, 10, 120, 60)
+        # nested blocks flush at the end of the outermost one
+        assert (element.rect_updates, element.size_changes) == (0, 0)
+    assert (element.rect_updates, element.size_changes) == (1, 1)
+    assert geometry(element) == (10, 10, 120, 60)
+    assert element.get_view_rect() == pygame.Rect(10, 10, 120, 60)
+    # the element moved by size_changed() is updated in the same flush
+    assert follower.get_x() == 130
+    assert (follower.rect_updates, follower.size_changes) == (1, 0)
+
+    # a move does not call size_changed()
+    with view.batch_layout():
+        element.set_geometry(x=20)
+        element.set_geometry(y=20)
+    assert (element.rect_updates, element.size_changes) == (2, 1)
+
+    # outside of a batch the change is applied immediately
+    element.set_width(200)
+    assert (element.rect_updates, element.size_changes) == (3, 2)
+
+
+class RecordingLayout(Layout):
+    """Layout recording the sizes it was updated for"""
+
+    def __init__(self, view):
+        super().__init__(view)
+        self.passes = []
+
+    @overrides(Layout)
+    def update_layout(self, width, height):
+        self.passes.append((width, height))
+
+
+def test_resize_is_debounced(app, view):
+    layout = RecordingLayout(view)
+    view.update_layouts(640, 480)
+    layout.passes.clear()
+
+    app.process_events([
+        pygame.event.Event(pygame.VIDEORESIZE, size=(700, 500), w=700, h=500),
+        pygame.event.Event(pygame.VIDEORESIZE, size=(720, 510), w=720, h=510),
+        pygame.event.Event(pygame.VIDEORESIZE, size=(800, 600), w=800, h=600),
+    ])
+    # one layout pass for the last size of the frame
+    assert layout.passes == [(800, 600)]
+    assert app.screen.get_size() == (800, 600)
+    app.process_events([])
+    assert layout.passes == [(800, 600)]
+
+
+def test_only_dirty_layouts_are_updated(app, view):
+    first = RecordingLayout(view)
+    second = RecordingLayout(view)
+    view.update_layouts(640, 480)
+    assert first.passes == second.passes == [(640, 480)]
+
+    view.update_layouts(640, 480)
+    assert len(first.passes) == len(second.passes) == 1
+
+    second.invalidate_layout()
+    view.request_layout()
+    app.process_events([])
+    assert not view.is_layout_pending()
+    assert len(first.passes) == 1
+    assert second.passes == [(640, 480), (640, 480)]
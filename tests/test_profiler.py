@@ -0,0 +1,62 @@
+"""
+Tests of the per-element frame profiler
+"""
+
+import pygame
+from SUILib.elements import Button, Label
+from SUILib.profiler import FrameProfiler
+
+
+def test_record_and_aggregate():
+    profiler = FrameProfiler(top_n=2)
+    first, second, third = object(), object(), 1
+    profiler.begin_frame()
+    profiler.record("draw", first, 0.002)
+    profiler.record("draw", first, 0.001)
+    profiler.record("event", first, 0.001)
+    profiler.record("update", second, 0.004)
+    profiler.record("draw", third, 0.0005)
+    # timings become visible when the frame is rendered
+    profiler.end_frame(False)
+    assert profiler.get_element_stats() == []
+    profiler.begin_frame()
+    profiler.end_frame(True)
+
+    stats = {id(s["element"]): s for s in profiler.get_element_stats()}
+    assert abs(stats[id(first)]["draw"] - 3.0) < 1e-9
+    assert stats[id(first)]["draw_calls"] == 2
+    assert stats[id(first)]["event_calls"] == 1
+
+    classes = profiler.get_class_stats()
+    assert classes["object"]["instances"] == 2
+    assert abs(classes["object"]["update"] - 4.0) < 1e-9
+    assert abs(classes["object"]["draw"] - 3.0) < 1e-9
+    assert classes["int"]["draw_calls"] == 1
+
+    top = profiler.get_top_elements()
+    assert [s["element"] for s in top] == [first, second]
+    assert len(profiler.history) == 2
+
+
+def test_application_profiles_view_elements(app, view):
+    button = Button(view, None, "Button", 100, 40, 10, 10)
+    label = Label(view, None, "Label", x=10, y=100)
+    view.add_gui_elements([button, label])
+    app.enable_profiler()
+    app.request_repaint()
+    pygame.event.clear()
+    app.step([pygame.event.Event(pygame.MOUSEMOTION, pos=(20, 20), rel=(1, 1), buttons=(0, 0, 0))])
+
+    stats = app.get_profiler_stats()
+    classes = stats["classes"]
+    assert classes["Button"]["draw_calls"] == 1
+    assert classes["Button"]["event_calls"] == 1
+    assert classes["Label"]["draw_calls"] == 1
+    assert len(stats["history"]) == 1
+    assert stats["frame_time"] == stats["history"][-1]
+
+    # nothing is measured while the profiler is disabled
+    app.disable_profiler()
+    app.request_repaint()
+    app.step()
+    assert app.get_profiler_stats()["classes"] == {}
@@ -0,0 +1,101 @@
+"""
+Tests of the dirty-rectangle renderer and the render cache of the elements
+"""
+
+import pygame
+from SUILib.guielement import GUIElement
+from SUILib.utils import overrides
+
+
+class Box(GUIElement):
+    """Element filling its area with a color, counts its draws"""
+
+    def __init__(self, view, x, y, color):
+        super().__init__(view, x, y, 100, 40, {})
+        self.color = color
+        self.draws = 0
+
+    @overrides(GUIElement)
+    def draw(self, view, screen):
+        self.draws += 1
+        screen.fill(self.color, self.get_view_rect())
+
+    @overrides(GUIElement)
+    def process_event(self, view, event):
+        pass
+
+    @overrides(GUIElement)
+    def update(self, view):
+        pass
+
+
+def test_dirty_rects_are_redrawn_and_presented(app, view, monkeypatch):
+    first = Box(view, 10, 10, (255, 0, 0))
+    second = Box(view, 200, 200, (0, 255, 0))
+    far = Box(view, 500, 400, (0, 0, 255))
+    view.add_gui_elements([first, second, far])
+    app.enable_dirty_rendering()
+    app.render_frame()
+    assert [box.draws for box in (first, second, far)] == [1, 1, 1]
+
+    presented = []
+    monkeypatch.setattr(pygame.display, "update", lambda rects: presented.extend(rects))
+    # pixels outside of the union of the dirty rects are not touched
+    app.screen.fill((1, 2, 3), pygame.Rect(400, 10, 10, 10))
+    first.color = (255, 255, 0)
+    first.invalidate()
+    second.invalidate()
+    app.render_frame()
+
+    assert presented == [first.get_view_rect(), second.get_view_rect()]
+    assert [box.draws for box in (first, second, far)] == [2, 2, 1]
+    assert app.screen.get_at((50, 20))[:3] == (255, 255, 0)
+    assert app.screen.get_at((405, 15))[:3] == (1, 2, 3)
+    # the union of the dirty rects is cleared with the fill color
+    assert app.screen.get_at((150, 100))[:3] == app.get_view_fill_color(view)[:3]
+    assert app._dirty_rects == []
+
+
+def test_full_repaint_ignores_dirty_rects(app, view, monkeypatch):
+    box = Box(view, 10, 10, (255, 0, 0))
+    view.add_gui_elements([box])
+    app.enable_dirty_rendering()
+    app.render_frame()
+    flips = []
+    monkeypatch.setattr(pygame.display, "flip", lambda: flips.append(True))
+    box.invalidate()
+    app.invalidate_all()
+    app.render_frame()
+    assert flips == [True]
+    assert app._dirty_rects == []
+
+
+def test_render_cache_is_dropped_on_invalidation(app, view):
+    box = Box(view, 10, 10, (255, 0, 0))
+    box.set_render_cache(True)
+    view.add_gui_elements([box])
+    for _ in range(3):
+        app.invalidate_all()
+        app.render_frame()
+    assert box.draws == 1
+    assert app.screen.get_at((20, 20))[:3] == (255, 0, 0)
+
+    box.color = (0, 255, 0)
+    box.invalidate()
+    app.render_frame()
+    assert box.draws == 2
+    assert app.screen.get_at((20, 20))[:3] == (0, 255, 0)
+
+    # moving the element drops the cache too
+    box.set_geometry(50, 50, 100, 40)
+    app.invalidate_all()
+    app.render_frame()
+    assert box.draws == 3
+    assert app.screen.get_at((60, 60))[:3] == (0, 255, 0)
+
+    # disabled on the element, it is drawn every frame
+    box.set_render_cache(False)
+    app.invalidate_all()
+    app.render_frame()
+    app.render_frame()
+    assert box.draws == 5
@@ -0,0 +1,76 @@
+"""
+Tests of the frame-scheduled main loop and dirty-rectangle rendering
+"""
+
+from time import perf_counter
+from SUILib.elements import TextInput
+
+
+def run_frames(app, timeout: float = 0.5) -> int:
+    """
+    Run non-blocking scheduled frames until no render is pending (or the timeout
+    expires), return the number of frames which rendered.
+    """
+    def pending():
+        return app._needs_repaint or len(app._dirty_rects) != 0
+
+    renders = 0
+    end = perf_counter() + timeout
+    while pending() and perf_counter() < end:
+        app.run_scheduled_frame(block=False)
+        if not pending():
+            renders += 1
+    return renders
+
+
+def test_programmatic_invalidation_is_presented(app, view):
+    text_input = TextInput(view, None, "", 200, 40, 20, 20)
+    view.add_gui_elements([text_input])
+    app.enable_dirty_rendering()
+    app.enable_frame_scheduler(60, 30)
+    app.request_repaint()
+    run_frames(app)
+    before = app.grab_pixels()
+
+    text_input.set_text("hello")
+    assert len(app._dirty_rects) != 0
+    assert run_frames(app) == 1
+    assert len(app._dirty_rects) == 0
+    assert not app._needs_repaint
+    assert (app.grab_pixels() != before).any()
+
+
+def test_invalidation_requests_repaint(app, view):
+    text_input = TextInput(view, None, "", 200, 40, 20, 20)
+    view.add_gui_elements([text_input])
+    app.enable_dirty_rendering()
+    app.step()
+    assert not app._needs_repaint
+
+    text_input.set_text("hello")
+    assert app._needs_repaint
+    app.step()
+    assert len(app._dirty_rects) == 0
+
+
+def test_repaint_requests_are_coalesced(app, view, monkeypatch):
+    app.step()
+    renders = []
+    render_frame = app.render_frame
+    monkeypatch.setattr(app, "render_frame", lambda: (renders.append(True), render_frame()))
+
+    for _ in range(10):
+        view.request_repaint()
+    assert renders == []
+    app.step()
+    assert len(renders) == 1
+    app.step()
+    assert len(renders) == 1
+
+    # flush_repaint() renders a pending repaint synchronously, once
+    app.request_repaint()
+    app.flush_repaint()
+    app.flush_repaint()
+    assert len(renders) == 2
+    app.step()
+    assert len(renders) == 2
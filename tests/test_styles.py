@@ -0,0 +1,98 @@
+"""
+Tests of the style caches after a stylesheet reload
+"""
+
+import os
+import copy
+import pickle
+import pytest
+import SUILib
+from SUILib.elements import Button, Table
+from SUILib.colors import color_change
+from SUILib.stylemanager import DERIVED_COLORS, Style, compile_record, style_record
+
+DARK_STYLES = os.path.join(os.path.dirname(SUILib.__file__), "config", "styles_dark.json")
+
+
+def test_reload_invalidates_style_caches(app, view):
+    manager = app.get_style_manager()
+    button = Button(view, None, "Button", 100, 40)
+    view.add_gui_elements([button])
+    light = manager.get_style_for_class(Button)
+    assert button.get_style() is light
+    light_record = button.get_style_record()
+    version = manager.version
+
+    app.reload_style_sheet(DARK_STYLES)
+    assert manager.version != version
+    dark = manager.get_style_for_class(Button)
+    assert dark is not light
+    assert dark["background_color"] == (42, 42, 42)
+
+    app.reload_element_styles()
+    assert button.get_style() is dark
+    record = button.get_style_record()
+    assert record is not light_record
+    assert record.background_color == (42, 42, 42)
+    assert record.foreground_color == (235, 235, 235)
+
+
+def test_shared_style_copies(app, view):
+    style = app.get_style_manager().get_style_with_name("Table")
+    style.get_record()
+    with pytest.raises(TypeError):
+        style["background_color"] = (0, 0, 0)
+
+    for mutable in (style.copy(), copy.copy(style), copy.deepcopy(style)):
+        assert type(mutable) is dict
+        assert type(mutable["body"]) is dict
+        assert mutable == style
+        mutable["body"]["background_color"] = (1, 2, 3)
+        assert style["body"]["background_color"] != (1, 2, 3)
+
+    restored = pickle.loads(pickle.dumps(style))
+    assert type(restored) is Style and type(restored["body"]) is Style
+    assert restored == style
+    assert restored.get_record().body.background_color == style["body"]["background_color"]
+
+    # a modified copy is the element's own style
+    own = style.copy()
+    own["body"]["background_color"] = (1, 2, 3)
+    table = Table(view, own, {"header": ["a"], "body": [["1"]]}, 100, 100)
+    assert table.get_style_record().body.background_color == (1, 2, 3)
+
+
+def test_record_derived_colors():
+    style = {
+        "background_color": (200, 200, 200),
+        "outline_color": (40, 40, 40),
+        "font_size": 20,
+        "body": {"foreground_color": (10, 20, 30)},
+        "not-an-identifier": 1,
+        "class": 2,
+    }
+    record = compile_record(style)
+    assert record.background_color == (200, 200, 200)
+    assert record.font_size == 20
+    for suffix, derive in DERIVED_COLORS.items():
+        assert getattr(record, "background_color_" + suffix) == derive((200, 200, 200))
+        assert getattr(record.body, "foreground_color_" + suffix) == derive((10, 20, 30))
+    # light and dark colors are highlighted in opposite directions
+    assert record.background_color_hover == color_change((200, 200, 200), -0.2)
+    assert record.outline_color_hover == color_change((40, 40, 40), 0.6)
+    assert not hasattr(record, "font_size_hover")
+    assert not hasattr(record, "class")
+
+    # a derived color defined by the style is kept
+    custom = compile_record({"background_color": (200, 200, 200), "background_color_hover": (1, 2, 3)})
+    assert custom.background_color_hover == (1, 2, 3)
+    # records of styles with the same attributes share their class
+    assert type(compile_record(style)) is type(record)
+    assert style_record(None) is None
+
+
+def test_shared_record_of_compiled_style(app):
+    style = app.get_style_manager().get_style_with_name("Button")
+    record = style_record(style)
+    assert record is style.get_record()
+    assert record.background_color_hover == DERIVED_COLORS["hover"](style["background_color"])
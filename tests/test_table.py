@@ -0,0 +1,35 @@
+"""
+Tests of the incremental column measurement of Table
+"""
+
+import pytest
+from SUILib.elements import Table
+
+
+def full_measure(table):
+    """Column widths of the table measured from scratch"""
+    table.measure_columns()
+    table.update_columns()
+    return list(table._content_width), list(table.col_width)
+
+
+@pytest.mark.parametrize("width", [200, 2000])
+def test_row_operations_match_full_measure(app, view, width):
+    data = {"header": ["id", "name", "note"], "body": [[str(i), "item %d" % i, ""] for i in range(5)]}
+    table = Table(view, None, data, width, 300)
+    view.add_gui_elements([table])
+
+    table.add_row(["5", "a much longer item name", "note"])
+    widest = list(table._content_width)
+    assert (list(table._content_width), list(table.col_width)) == full_measure(table)
+
+    table.set_row(2, ["2", "x", "the widest note of the whole table"])
+    assert (list(table._content_width), list(table.col_width)) == full_measure(table)
+
+    # removing the widest cells shrinks the columns again
+    table.remove_row(5)
+    table.remove_row(2)
+    incremental = (list(table._content_width), list(table.col_width))
+    assert incremental == full_measure(table)
+    assert incremental[0][1] < widest[1]
+    assert len(table.body) == 4
@@ -0,0 +1,21 @@
+"""
+Tests of the TextInput element
+"""
+
+from SUILib.elements import TextInput
+from SUILib.textcache import text_cache
+
+
+def test_draw_measures_through_text_cache(app, view):
+    text_input = TextInput(view, None, "", 200, 40)
+    view.add_gui_elements([text_input])
+    text_input.set_text("hello world")
+    text_input.caret_position = 5
+    text_input.draw(view, app.screen)
+
+    stats = text_cache.get_stats()
+    for _ in range(3):
+        text_input.draw(view, app.screen)
+    # the text and the text before the caret are measured once
+    assert text_cache.get_stats()["size_misses"] == stats["size_misses"]
+    assert text_cache.get_stats()["size_hits"] - stats["size_hits"] >= 6
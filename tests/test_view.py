@@ -0,0 +1,68 @@
+"""
+Tests of the element bookkeeping of View (spatial index, pointer targets)
+"""
+
+import pygame
+from SUILib.elements import Button
+from SUILib.events import SUIEvents
+from SUILib.guielement import GUIElement
+from SUILib.utils import overrides
+
+
+def test_spatial_index_follows_element_list(app, view):
+    first = Button(view, None, "", 100, 40, 0, 0)
+    second = Button(view, None, "", 100, 40, 200, 0)
+    view.add_gui_elements([first, second])
+    assert view.get_pointer_targets((10, 10)) == [first]
+
+    # replaced directly, same number of elements
+    third = Button(view, None, "", 100, 40, 0, 0)
+    view.GUIElements[0] = third
+    assert view.get_pointer_targets((10, 10)) == [third]
+
+    # reordered directly
+    second.set_geometry(0, 0, 100, 40)
+    view.GUIElements.reverse()
+    assert view.get_pointer_targets((10, 10)) == [second, third]
+
+    view.remove_gui_element(second)
+    assert view.get_pointer_targets((10, 10)) == [third]
+
+
+class PointerElement(GUIElement):
+    """Element handling events with the default GUIElement.process_event()"""
+
+    @overrides(GUIElement)
+    def draw(self, view, screen):
+        pass
+
+    @overrides(GUIElement)
+    def process_event(self, view, event):
+        super().process_event(view, event)
+
+    @overrides(GUIElement)
+    def update(self, view):
+        pass
+
+
+def test_mouse_enter_leave_from_event_position(app, view, monkeypatch):
+    element = PointerElement(view, 100, 100, 50, 50, {})
+    view.add_gui_elements([element])
+    log = []
+    element.add_event_callback(SUIEvents.EVENT_ON_MOUSE_ENTER, lambda event: log.append("enter"))
+    element.add_event_callback(SUIEvents.EVENT_ON_MOUSE_LEAVE, lambda event: log.append("leave"))
+    # the real pointer position is not used
+    monkeypatch.setattr(pygame.mouse, "get_pos", lambda: (120, 120))
+
+    def motion(pos):
+        view.process_evt(pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0)))
+
+    motion((10, 10))
+    view.process_evt(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, mod=0, unicode="a"))
+    assert log == []
+    motion((110, 110))
+    motion((120, 120))
+    assert log == ["enter"]
+    # the element under the previous event gets the next one to detect leaving
+    motion((300, 300))
+    assert log == ["enter", "leave"]